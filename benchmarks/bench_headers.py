@@ -0,0 +1,30 @@
+"""
+Benchmark cached vs uncached MDUI header generation
+
+Run with:
+    python benchmarks/bench_headers.py
+"""
+import timeit
+
+from fasthtml.common import to_xml
+
+from fastmdui import MDUI
+
+
+def uncached():
+    return to_xml(tuple(MDUI.build_headers("auto", True, "10, 20, 30", None, "all", "open-sans", "cdn")))
+
+
+def cached():
+    return MDUI.headers(theme="auto", tachyons=True, primary_light_color="10, 20, 30").html
+
+
+def main(number=2000):
+    assert uncached().replace("\n", "") == cached().replace("\n", "")
+    for name, fn in (("uncached build + render", uncached), ("cached bundle .html", cached)):
+        seconds = min(timeit.repeat(fn, number=number, repeat=5))
+        print(f"{name:<26} {seconds / number * 1e6:9.2f} us/call")
+
+
+if __name__ == "__main__":
+    main()
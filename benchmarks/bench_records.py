@@ -0,0 +1,39 @@
+"""
+Benchmark List.from_records against a loop over ListItem
+Times building and rendering a 10k row query result
+
+Run with:
+    python benchmarks/bench_records.py
+"""
+import timeit
+
+from fastmdui import List, ListItem
+from fastmdui.render import render
+
+
+ROWS = [{"id": i, "name": f"User {i}", "email": f"user{i}@example.com"} for i in range(10_000)]
+
+
+def loop():
+    return render(List(*(
+        ListItem(r["name"], description=r["email"], icon="person", href=f"/users/{r['id']}") for r in ROWS
+    )))
+
+
+def records(prerender=False):
+    return render(List.from_records(
+        ROWS, headline="name", description="email", href=lambda r: f"/users/{r['id']}",
+        item={"icon": "person"}, prerender=prerender,
+    ))
+
+
+def main(number=5):
+    assert loop() == records() == records(prerender=True)
+    for name, fn in (("ListItem loop", loop), ("from_records", records),
+                     ("from_records prerender", lambda: records(True))):
+        seconds = min(timeit.repeat(fn, number=number, repeat=3))
+        print(f"{name:<24} {seconds / number * 1e3:8.2f} ms")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,34 @@
+"""
+Benchmark the direct-to-string renderer against FastHTML's to_xml
+on a page with a 10k item List
+
+Run with:
+    python benchmarks/bench_render.py
+"""
+import timeit
+
+from fasthtml.common import to_xml
+
+from fastmdui import List, ListItem, Icon
+from fastmdui.render import render
+
+
+def page(n=10_000):
+    return List(*(
+        ListItem(f"Item {i} & more", description=f"Row <{i}>", icon="inbox", end_icon="chevron_right",
+                 href=f"/items/{i}", cls="item")
+        for i in range(n)
+    ), Icon("done"))
+
+
+def main(number=5):
+    tree = page()
+    for indent in (True, False):
+        assert render(tree, indent=indent) == to_xml(tree, indent=indent)
+        for name, fn in (("to_xml", to_xml), ("render", render)):
+            seconds = min(timeit.repeat(lambda: fn(tree, indent=indent), number=number, repeat=3))
+            print(f"{name:<8} indent={indent!s:<5} {seconds / number * 1e3:9.2f} ms/page")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,37 @@
+"""
+Benchmark the generated component constructors
+Times building 10k ListItems and Chips with and without extra attributes;
+calls with extra attributes take the ft_hx path
+
+Run with:
+    python benchmarks/bench_schema.py
+"""
+import timeit
+
+from fastmdui import Chip, ListItem
+
+
+N = 10_000
+
+
+def plain():
+    return [ListItem(f"User {i}", description="user@example.com", icon="person", href="/u") for i in range(N)]
+
+
+def with_attrs():
+    return [ListItem(f"User {i}", description="user@example.com", icon="person", href="/u", data_id=i)
+            for i in range(N)]
+
+
+def chips():
+    return [Chip(f"Tag {i}", icon="sell") for i in range(N)]
+
+
+def main(number=5):
+    for name, fn in (("ListItem", plain), ("ListItem + attrs", with_attrs), ("Chip", chips)):
+        seconds = min(timeit.repeat(fn, number=number, repeat=3))
+        print(f"{name:<20} {seconds / number * 1e3:8.2f} ms")
+
+
+if __name__ == "__main__":
+    main()
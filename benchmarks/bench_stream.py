@@ -0,0 +1,33 @@
+"""
+Peak memory of rendering a generated List in one piece vs streaming it
+
+Run with:
+    python benchmarks/bench_stream.py
+"""
+import tracemalloc
+
+from fastmdui import List, ListItem
+from fastmdui.render import render, stream
+
+
+def items(n):
+    return (ListItem(f"Item {i}", description=f"Description {i}", icon="inbox") for i in range(n))
+
+
+def peak(fn):
+    tracemalloc.start()
+    fn()
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return peak
+
+
+def main():
+    for n in (10_000, 100_000):
+        whole = peak(lambda: render(List(*items(n))))
+        streamed = peak(lambda: sum(len(chunk) for chunk in stream(List(items(n)))))
+        print(f"{n:>7} items  render {whole / 2**20:8.1f} MiB  stream {streamed / 2**20:6.2f} MiB")
+
+
+if __name__ == "__main__":
+    main()
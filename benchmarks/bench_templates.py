@@ -0,0 +1,45 @@
+"""
+Benchmark @mdui_template against plain Card/ListItem/Button calls
+Both sides produce the rendered HTML of one component
+
+Run with:
+    python benchmarks/bench_templates.py
+"""
+import timeit
+
+from fasthtml.common import to_xml
+
+from fastmdui import Button, Card, ListItem, mdui_template
+
+
+def card(title, subtitle, content):
+    return Card(title, subtitle, content)
+
+
+def list_item(name, email):
+    return ListItem(name, description=email, icon="person", href="/contacts")
+
+
+def button(label):
+    return Button(label, icon="save", variant="tonal")
+
+
+CASES = [
+    ("Card", card, ("Title", "Subtitle", "Body text")),
+    ("ListItem", list_item, ("Ann", "ann@example.com")),
+    ("Button", button, ("Save",)),
+]
+
+
+def main(number=20000):
+    for name, fn, args in CASES:
+        template = mdui_template(fn)
+        assert template(*args) == to_xml(fn(*args), indent=False)
+        plain = min(timeit.repeat(lambda: to_xml(fn(*args), indent=False), number=number, repeat=5))
+        compiled = min(timeit.repeat(lambda: template(*args), number=number, repeat=5))
+        print(f"{name:<9} plain {plain / number * 1e6:7.2f} us  template {compiled / number * 1e6:7.2f} us"
+              f"  ({plain / compiled:.1f}x)")
+
+
+if __name__ == "__main__":
+    main()
@@ -14,6 +14,7 @@ setup(
     url="https://github.com/yourusername/fastmdui",
     packages=find_packages(where="src"),
     package_dir={"": "src"},
+    package_data={"fastmdui": ["static/*", "static/fonts/*"]},
     classifiers=[
         "Development Status :: 3 - Alpha",
         "Intended Audience :: Developers",
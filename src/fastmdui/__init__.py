@@ -1,6 +1,9 @@
 __version__ = "0.1.2"
 
 from .core import MDUI
+from .assets import MDUIAssets
+from .templates import cached, mdui_template
+from .patches import mdui_patch, mdui_updates
 from .components import (
     Button,
     Card,
@@ -37,9 +40,16 @@ from .components import (
     Tooltip,
     ThemeToggle,
 )
+from .virtual import VirtualList
+from .batch import ChangeBatch, decode_changes
 
 __all__ = [
     "MDUI",
+    "MDUIAssets",
+    "mdui_template",
+    "cached",
+    "mdui_patch",
+    "mdui_updates",
     "Button",
     "Card",
     "TextField",
@@ -74,4 +84,7 @@ __all__ = [
     "TabPanel",
     "Tooltip",
     "ThemeToggle",
+    "VirtualList",
+    "ChangeBatch",
+    "decode_changes",
 ]
\ No newline at end of file
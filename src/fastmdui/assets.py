@@ -0,0 +1,321 @@
+"""
+Self-hosted MDUI assets
+
+Serves the MDUI stylesheet/script, tachyons and the icon/font stylesheets
+from the FastHTML app itself under content-hashed URLs, so pages don't
+depend on unpkg or Google Fonts at runtime.
+
+This is opt-in: the package doesn't ship the files. Vendor them, along with
+precompressed gzip/brotli variants, into a directory of the app (by default
+``fastmdui/static``) and point MDUI at it before building the headers:
+
+    python -m fastmdui.assets fetch vendor/mdui    # or: compress [directory]
+
+    MDUI.use_assets("vendor/mdui")
+    app = FastHTML(hdrs=MDUI.headers(assets="local"))
+    MDUI.mount_assets(app)
+"""
+import gzip
+import hashlib
+import mimetypes
+import re
+import sys
+import urllib.request
+from pathlib import Path
+
+from starlette.responses import FileResponse, Response
+
+try:
+    import brotli
+except ImportError:  # optional, enables .br variants
+    brotli = None
+
+
+STATIC_DIR = Path(__file__).parent / "static"
+CACHE_CONTROL = "public, max-age=31536000, immutable"
+# Content-Encoding -> file suffix of the precompressed variant, in preference order
+ENCODINGS = {"br": ".br", "gzip": ".gz"}
+# Variants saving less than this (e.g. of woff2 fonts) aren't worth keeping
+MIN_SAVING = 0.05
+
+# Logical asset name -> upstream URL it is vendored from
+SOURCES = {
+    "mdui.css": "https://unpkg.com/mdui@{version}/mdui.css",
+    "mdui.global.js": "https://unpkg.com/mdui@{version}/mdui.global.js",
+    "tachyons.min.css": "https://unpkg.com/tachyons@4.12.0/css/tachyons.min.css",
+    "open-sans.css": "https://fonts.googleapis.com/css2?family=Open+Sans:wght@300;400;500;600;700&display=swap",
+    "material-icons.css": "https://fonts.googleapis.com/icon?family=Material+Icons",
+    "material-symbols-outlined.css": "https://fonts.googleapis.com/css2?family=Material+Symbols+Outlined:opsz,wght,FILL,GRAD@24,400,0,0",
+    "material-symbols-rounded.css": "https://fonts.googleapis.com/css2?family=Material+Symbols+Rounded:opsz,wght,FILL,GRAD@24,400,0,0",
+    "material-symbols-sharp.css": "https://fonts.googleapis.com/css2?family=Material+Symbols+Sharp:opsz,wght,FILL,GRAD@24,400,0,0",
+}
+
+_CSS_URL = re.compile(r"url\((['\"]?)([^)'\"]+)\1\)")
+# Google Fonts only serves woff2 to user agents it knows support it
+_FONT_UA = "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0 Safari/537.36"
+
+
+class Asset:
+    """A single static file with its content-hashed public name"""
+
+    def __init__(self, name, path, data=None):
+        self.name = name
+        self.path = path
+        # Rewritten stylesheets and generated files are kept in memory,
+        # everything else is read from disk
+        self.data = data
+        body = data if data is not None else path.read_bytes()
+        self.digest = hashlib.sha256(body).hexdigest()
+        self.size = len(body)
+        self.media_type = mimetypes.guess_type(name)[0] or "application/octet-stream"
+        stem, dot, ext = name.rpartition(".")
+        self.hashed_name = f"{stem}.{self.digest[:12]}.{ext}" if dot else f"{name}.{self.digest[:12]}"
+        # Content-Encoding -> precompressed body (bytes) or file next to the original
+        self.encodings = {}
+        if data is not None:
+            self.encodings = {
+                enc: body for enc, body in _compress(data).items()
+                if len(body) <= self.size * (1 - MIN_SAVING)
+            }
+        else:
+            for enc, suffix in ENCODINGS.items():
+                variant = path.with_name(path.name + suffix)
+                if variant.is_file():
+                    self.encodings[enc] = variant
+
+    def etag(self, encoding=None):
+        return f'"{self.digest}-{encoding}"' if encoding else f'"{self.digest}"'
+
+    def encoded_size(self, encoding):
+        body = self.encodings.get(encoding)
+        if body is None:
+            return None
+        return len(body) if isinstance(body, bytes) else body.stat().st_size
+
+
+def _compress(data):
+    """gzip (and brotli, when installed) variants of ``data``"""
+    variants = {"gzip": gzip.compress(data, compresslevel=9, mtime=0)}
+    if brotli is not None:
+        variants["br"] = brotli.compress(data)
+    return variants
+
+
+def _accepted(accept_encoding):
+    """Content-Encodings a client accepts (q > 0) from an Accept-Encoding header"""
+    accepted = set()
+    for part in accept_encoding.split(","):
+        coding, _, params = part.strip().partition(";")
+        q = params.strip()
+        if q.startswith("q="):
+            try:
+                if float(q[2:]) <= 0:
+                    continue
+            except ValueError:
+                continue
+        accepted.add(coding.strip().lower())
+    return accepted
+
+
+def _etag_matches(if_none_match, etags):
+    if if_none_match.strip() == "*":
+        return True
+    candidates = {tag.strip().removeprefix("W/") for tag in if_none_match.split(",")}
+    return not candidates.isdisjoint(etags)
+
+
+class MDUIAssets:
+    """
+    Content-hashed asset set served from a FastHTML app
+
+    Args:
+        directory: Folder holding the vendored files (defaults to fastmdui/static)
+        prefix: URL prefix the assets are mounted under
+
+    Example:
+        app = FastHTML(hdrs=MDUI.headers(assets="local"))
+        MDUI.mount_assets(app)
+    """
+
+    def __init__(self, directory=STATIC_DIR, prefix="/_mdui"):
+        self.directory = Path(directory)
+        self.prefix = prefix.rstrip("/")
+        self._by_name = {}
+        self._by_hashed = {}
+        self._scan()
+
+    def _add(self, asset):
+        self._by_name[asset.name] = asset
+        self._by_hashed[asset.hashed_name] = asset
+
+    def _scan(self):
+        if not self.directory.is_dir():
+            return
+        stylesheets = []
+        for path in sorted(self.directory.rglob("*")):
+            if not path.is_file() or path.name.startswith(".") or path.suffix in (".gz", ".br"):
+                continue
+            name = path.relative_to(self.directory).as_posix()
+            if path.suffix == ".css":
+                stylesheets.append((name, path))
+            else:
+                self._add(Asset(name, path))
+        # Stylesheets point at fonts by relative path; swap those for hashed URLs
+        # so the stylesheet hash changes whenever a font it references does.
+        for name, path in stylesheets:
+            css = path.read_text(encoding="utf-8")
+            base = Path(name).parent
+
+            def _rewrite(match):
+                ref = match.group(2)
+                if ":" in ref or ref.startswith(("/", "#")):
+                    return match.group(0)
+                target = self._by_name.get((base / ref).as_posix())
+                return f"url({self.url(target.name)})" if target else match.group(0)
+
+            self._add(Asset(name, path, _CSS_URL.sub(_rewrite, css).encode("utf-8")))
+
+    def __contains__(self, name):
+        return name in self._by_name
+
+    def __iter__(self):
+        return iter(self._by_name.values())
+
+    def get(self, name):
+        return self._by_name.get(name)
+
+    def from_url(self, url):
+        """Return the asset served at a hashed URL, or None"""
+        prefix = self.prefix + "/"
+        return self._by_hashed.get(url[len(prefix):]) if url.startswith(prefix) else None
+
+    def references(self, asset):
+        """Hashed URLs a (rewritten) stylesheet points at, e.g. its font files"""
+        if asset.data is None or not asset.name.endswith(".css"):
+            return []
+        refs = (m.group(2) for m in _CSS_URL.finditer(asset.data.decode("utf-8")))
+        return [ref for ref in refs if self.from_url(ref)]
+
+    def add(self, name, data):
+        """Register generated content (e.g. a small script) under a hashed URL"""
+        if isinstance(data, str):
+            data = data.encode("utf-8")
+        asset = Asset(name, None, data)
+        self._add(asset)
+        return asset
+
+    def url(self, name):
+        """Return the content-hashed URL for a logical asset name"""
+        asset = self._by_name.get(name)
+        if asset is None:
+            raise LookupError(
+                f"MDUI asset {name!r} is not vendored in {self.directory}. assets='local' needs the "
+                "files fetched first: run `python -m fastmdui.assets fetch <directory>` and call "
+                "MDUI.use_assets(<directory>) before MDUI.headers()"
+            )
+        return f"{self.prefix}/{asset.hashed_name}"
+
+    def response(self, fname, request_headers=None):
+        """
+        Build the response for a hashed file name, or a 404
+
+        Picks the best precompressed variant for the request's Accept-Encoding
+        and answers If-None-Match with a 304 from the manifest alone, without
+        touching the file.
+        """
+        asset = self._by_hashed.get(fname)
+        if asset is None:
+            return Response("Not Found", status_code=404)
+        request_headers = request_headers or {}
+        accepted = _accepted(request_headers.get("accept-encoding", ""))
+        encoding = next((enc for enc in ENCODINGS if enc in accepted and enc in asset.encodings), None)
+        headers = {"Cache-Control": CACHE_CONTROL, "ETag": asset.etag(encoding)}
+        if asset.encodings:
+            headers["Vary"] = "Accept-Encoding"
+        if_none_match = request_headers.get("if-none-match")
+        if if_none_match and _etag_matches(if_none_match, {asset.etag(), asset.etag(encoding)}):
+            return Response(status_code=304, headers=headers)
+        body = asset.data
+        if encoding:
+            headers["Content-Encoding"] = encoding
+            body = asset.encodings[encoding]
+        if isinstance(body, bytes):
+            return Response(body, media_type=asset.media_type, headers=headers)
+        return FileResponse(body or asset.path, media_type=asset.media_type, headers=headers)
+
+    def report(self):
+        """Per-asset sizes of the original and each precompressed variant"""
+        return [
+            {"name": asset.name, "size": asset.size, **{enc: asset.encoded_size(enc) for enc in ENCODINGS}}
+            for asset in self
+        ]
+
+    def mount(self, app):
+        """Register the asset route on a FastHTML app"""
+        assets = self
+
+        @app.route(f"{self.prefix}/{{fname:path}}", methods=["get", "head"], include_in_schema=False)
+        def mdui_asset(fname: str, request):
+            return assets.response(fname, request.headers)
+
+        return app
+
+
+def compress(directory=STATIC_DIR):
+    """Write .gz (and .br, with brotli installed) variants next to each file"""
+    directory = Path(directory)
+    for path in sorted(directory.rglob("*")):
+        if not path.is_file() or path.suffix in (".gz", ".br") or path.name.startswith("."):
+            continue
+        for enc, body in _compress(path.read_bytes()).items():
+            variant = path.with_name(path.name + ENCODINGS[enc])
+            if len(body) <= path.stat().st_size * (1 - MIN_SAVING):
+                variant.write_bytes(body)
+            elif variant.exists():
+                variant.unlink()
+    print_report(MDUIAssets(directory))
+
+
+def print_report(assets):
+    """Print the size savings of the precompressed variants"""
+    print(f"{'asset':<40} {'size':>10} {'gzip':>16} {'br':>16}")
+    for row in assets.report():
+        cells = []
+        for enc in ("gzip", "br"):
+            size = row[enc]
+            cells.append(f"{size:>8} ({1 - size / row['size']:>4.0%})" if size else f"{'-':>16}")
+        print(f"{row['name']:<40} {row['size']:>10} {cells[0]:>16} {cells[1]:>16}")
+
+
+def fetch(directory=STATIC_DIR, version=None):
+    """Download the upstream files into ``directory`` for offline use"""
+    from .core import MDUI
+
+    directory = Path(directory)
+    (directory / "fonts").mkdir(parents=True, exist_ok=True)
+
+    def _get(url):
+        req = urllib.request.Request(url, headers={"User-Agent": _FONT_UA})
+        with urllib.request.urlopen(req) as resp:
+            return resp.read()
+
+    for name, url in SOURCES.items():
+        body = _get(url.format(version=version or MDUI.VERSION))
+        if name.endswith(".css"):
+            css = body.decode("utf-8")
+            for ref in sorted(set(m.group(2) for m in _CSS_URL.finditer(css))):
+                if not ref.startswith("http"):
+                    continue
+                font_name = f"fonts/{hashlib.sha256(ref.encode()).hexdigest()[:16]}{Path(ref.split('?')[0]).suffix}"
+                (directory / font_name).write_bytes(_get(ref))
+                css = css.replace(ref, font_name)
+            body = css.encode("utf-8")
+        (directory / name).write_bytes(body)
+        print(f"{name}: {len(body)} bytes")
+    compress(directory)
+
+
+if __name__ == "__main__":
+    command = sys.argv[1] if len(sys.argv) > 1 else "fetch"
+    target = sys.argv[2] if len(sys.argv) > 2 else STATIC_DIR
+    {"fetch": fetch, "compress": compress}[command](target)
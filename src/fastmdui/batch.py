@@ -0,0 +1,136 @@
+"""
+Batched form-control changes
+
+A settings page made of many Switch, Checkbox, Radio and Slider controls
+would send one request per toggle. ChangeBatch collects their changes in
+the browser instead and posts them together once the user pauses for
+``idle`` ms, or leaves the group:
+
+    app = FastHTML(hdrs=MDUI.headers(batch=True))
+
+    ChangeBatch(
+        Switch(name="notifications", checked=prefs.notifications),
+        Checkbox("Weekly digest", name="digest", checked=prefs.digest),
+        Slider(prefs.volume, name="volume"),
+        action="/settings",
+    )
+
+    @app.post("/settings")
+    def save_settings(mdui_changes: str):
+        prefs.update(decode_changes(mdui_changes))
+
+Controls are identified by their ``name``; only the latest value of each is
+sent. The request is an htmx request with hx-swap="none", so the response
+can return out-of-band swaps or mdui_patch() updates. Changes still pending
+when the page is left are sent with navigator.sendBeacon.
+"""
+import json
+
+from .components import Div
+
+
+# Form field carrying the JSON list of changes
+FIELD = "mdui_changes"
+# Changes accepted in one batch
+MAX_CHANGES = 1000
+KINDS = ("bool", "number", "text")
+
+# Collects changes inside [data-mdui-batch] and posts them when idle or on blur
+BATCH_JS = """
+(() => {
+  const kinds = {"MDUI-CHECKBOX": "bool", "MDUI-SWITCH": "bool", "MDUI-SLIDER": "number"};
+  const pending = new WeakMap();
+  function read(el) {
+    if (el.tagName === "MDUI-RADIO" && (el.closest("mdui-radio-group") || !el.checked)) return null;
+    const kind = kinds[el.tagName] || "text";
+    return [el.getAttribute("name"), kind, kind === "bool" ? el.checked : el.value];
+  }
+  function flush(box, beacon) {
+    const state = pending.get(box);
+    if (!state || !state.changes.size) return;
+    clearTimeout(state.timer);
+    const values = {mdui_changes: JSON.stringify([...state.changes.values()])};
+    state.changes.clear();
+    if (beacon) navigator.sendBeacon(box.dataset.mduiBatch, new URLSearchParams(values));
+    else htmx.ajax("POST", box.dataset.mduiBatch, {source: box, swap: "none", values});
+  }
+  document.addEventListener("change", (e) => {
+    const box = e.target.closest && e.target.closest("[data-mdui-batch]");
+    const change = box && read(e.target);
+    if (!change || !change[0]) return;
+    let state = pending.get(box);
+    if (!state) pending.set(box, state = {changes: new Map(), timer: 0});
+    state.changes.set(change[0], change);
+    clearTimeout(state.timer);
+    state.timer = setTimeout(() => flush(box), +box.dataset.mduiBatchIdle);
+  }, true);
+  document.addEventListener("focusout", (e) => {
+    const box = e.target.closest && e.target.closest("[data-mdui-batch]");
+    if (box && !box.contains(e.relatedTarget)) flush(box);
+  });
+  addEventListener("pagehide", () => {
+    for (const box of document.querySelectorAll("[data-mdui-batch]")) flush(box, true);
+  });
+})();
+"""
+
+
+def ChangeBatch(*controls, action, idle=800, **kwargs):
+    """
+    Container posting its controls' changes together
+
+    Args:
+        controls: Switch, Checkbox, Radio/RadioGroup, Slider or other named
+            controls, anywhere inside
+        action: URL the batch is posted to, as the ``mdui_changes`` field
+        idle: Milliseconds without a change before the batch is sent
+
+    Example:
+        ChangeBatch(Switch(name="wifi"), Slider(50, name="brightness"), action="/settings")
+    """
+    return Div(*controls, data_mdui_batch=action, data_mdui_batch_idle=idle, **kwargs)
+
+
+def _number(value):
+    number = float(value)
+    return int(number) if number.is_integer() else number
+
+
+def decode_changes(data):
+    """
+    {name: value} of a posted batch, in the order the controls first changed
+
+    Switch and Checkbox values are booleans, Slider values numbers, and
+    everything else strings.
+
+    Args:
+        data: The ``mdui_changes`` field, or a form/dict containing it
+
+    Raises:
+        ValueError: If the batch is malformed or too large
+    """
+    if not isinstance(data, (str, bytes)):
+        data = data.get(FIELD, "[]")
+    try:
+        changes = json.loads(data)
+    except json.JSONDecodeError as e:
+        raise ValueError(f"Invalid {FIELD}: {e}") from None
+    if not isinstance(changes, list) or len(changes) > MAX_CHANGES:
+        raise ValueError(f"{FIELD} must be a list of at most {MAX_CHANGES} changes")
+    decoded = {}
+    for change in changes:
+        if not isinstance(change, list) or len(change) != 3 or not isinstance(change[0], str):
+            raise ValueError(f"Invalid change in {FIELD}: {change!r}")
+        name, kind, value = change
+        if kind not in KINDS:
+            raise ValueError(f"Unknown kind {kind!r} for {name!r}")
+        try:
+            if kind == "bool":
+                decoded[name] = value is True or value == "true"
+            elif kind == "number":
+                decoded[name] = _number(value)
+            else:
+                decoded[name] = "" if value is None else str(value)
+        except (TypeError, ValueError):
+            raise ValueError(f"Invalid {kind} value for {name!r}: {value!r}") from None
+    return decoded
@@ -1,10 +1,41 @@
-from fasthtml.common import ft_hx
+from collections.abc import Mapping
+from itertools import chain
+from operator import attrgetter, itemgetter
+from urllib.parse import quote
+
+from fastcore.xml import valmap
+from fasthtml.common import FT, Safe, ft_hx
+
+from .icons import icon_registry
+from .modules import record_tag
+from .nodes import CompactFT, is_plain_ft
+from .render import empty_element, lazy_children
+from .schema import KWARGS, REQUIRED, Attr, Schema, Slot, Text, component
+from . import search as _search
+from .sprites import sprite_icon
+
+
+# Route-target shorthands FastHTML resolves to URLs (Button(get=handler))
+_ROUTE_TARGETS = frozenset(("get", "post", "put", "delete", "patch", "link"))
 
 
 def _mdui_component(tag, *children, **kwargs):
     """Helper to create MDUI custom elements"""
-    # ft_hx expects children as a tuple
-    return ft_hx(tag, children, **kwargs)
+    if tag.startswith("mdui-"):
+        record_tag(tag)
+    # ft_hx expects children as a tuple; generators stay lazy for streaming
+    ft = ft_hx(tag, lazy_children(children), **kwargs)
+    # FastHTML resolves route targets by walking FT nodes only, so elements with
+    # targets, or plain FT children that may hold some, stay FT
+    if ft.void_ or not _ROUTE_TARGETS.isdisjoint(ft.attrs) or any(map(is_plain_ft, ft.children)):
+        return ft
+    return CompactFT.from_ft(ft)
+
+
+def _use_icon(name, variant=None):
+    """Record an icon name for MDUI.headers(icons="auto")"""
+    if name:
+        icon_registry.add(name, variant)
 
 
 def Div(*children, **kwargs):
@@ -18,7 +49,7 @@ def Div(*children, **kwargs):
         Div(slot="end")(Button("Click me"))
         Div(style="display: flex; gap: 8px;")(Button1, Button2)
     """
-    return ft_hx("div", children, **kwargs)
+    return _mdui_component("div", *children, **kwargs)
 
 
 def Button(text="", variant="filled", icon=None, end_icon=None, icon_slot=None, end_icon_slot=None, disabled=False, **kwargs):
@@ -58,9 +89,13 @@ def Button(text="", variant="filled", icon=None, end_icon=None, icon_slot=None,
         if hasattr(icon_slot, 'attrs'):
             icon_slot.attrs = {**icon_slot.attrs, 'slot': 'icon'}
         children.append(icon_slot)
+    elif icon and (svg := sprite_icon(icon)) is not None:
+        # Sprite mode: slot an <svg><use> icon instead of the font glyph
+        children.append(_mdui_component("mdui-icon", svg, slot="icon"))
     elif icon:
         # Use icon attribute shorthand - MDUI will render the icon
         attrs["icon"] = icon
+        _use_icon(icon)
     
     # Add text
     if text:
@@ -72,31 +107,25 @@ def Button(text="", variant="filled", icon=None, end_icon=None, icon_slot=None,
         if hasattr(end_icon_slot, 'attrs'):
             end_icon_slot.attrs = {**end_icon_slot.attrs, 'slot': 'end-icon'}
         children.append(end_icon_slot)
+    elif end_icon and (svg := sprite_icon(end_icon)) is not None:
+        children.append(_mdui_component("mdui-icon", svg, slot="end-icon"))
     elif end_icon:
         # Use end-icon attribute shorthand - MDUI will render the icon
         attrs["end-icon"] = end_icon
+        _use_icon(end_icon)
     
     return _mdui_component("mdui-button", *children, **attrs)
 
-def ButtonIcon(
-    icon: str, 
-    variant: str = "standard",
-    href: str = None,
-    selectable: bool = False,
-    disabled: bool = False,
-    loading: bool = False
-):
-    """MDUI Button Icon component"""
-    attrs = {
-        "icon": icon,
-        "variant": variant,
-        "selectable": selectable,
-        "disabled": disabled,
-        "loading": loading
-    }
-    if href:
-        attrs["href"] = href
-    return _mdui_component("mdui-button-icon", **attrs)
+ButtonIcon = component("ButtonIcon", Schema("mdui-button-icon", [
+    Attr("icon", REQUIRED, set_when="always", icon=True),
+    Attr("variant", "standard", set_when="always"),
+    Attr("href", None),
+    Attr("selectable", False, set_when="always"),
+    Attr("disabled", False, set_when="always"),
+    Attr("loading", False, set_when="always"),
+], emit=("icon", "variant", "selectable", "disabled", "loading", "href"), kwargs=False,
+    doc="MDUI Button Icon component"), globals())
+
 
 def Card(title=None, subtitle=None, content=None, variant="elevated", clickable=False, **kwargs):
     """MDUI Card component"""
@@ -115,17 +144,59 @@ def Card(title=None, subtitle=None, content=None, variant="elevated", clickable=
     
     return _mdui_component("mdui-card", *card_content, **attrs)
 
-def TextField(label="", value="", type="text", required=False, **kwargs):
-    """MDUI Text Field component"""
+def TextField(label="", value="", type="text", required=False, search=None, debounce=250, results=None, **kwargs):
+    """
+    MDUI Text Field component
+
+    Args:
+        search: URL searched as the user types; the value is sent as ``q``
+            (or the field's name). Serve it with fastmdui.livesearch.LiveSearch
+        debounce: Milliseconds of typing pause before a search request
+        results: Id of the element the results replace the content of
+
+    Examples:
+        TextField(label="Name", name="name")
+        TextField(label="Search", search="/products", results="product-results")
+    """
     attrs = {"label": label, "value": value, "type": type, **kwargs}
     if required:
         attrs["required"] = True
-    
+    if search:
+        attrs.setdefault("name", "q")
+        attrs["hx_get"] = search
+        # "clear" is sent by the clearable button, which doesn't fire input
+        attrs["hx_trigger"] = f"input changed delay:{debounce}ms, clear"
+        # A newer query aborts the request still in flight
+        attrs["hx_sync"] = "this:replace"
+        if results:
+            attrs.setdefault("hx_target", f"#{results}")
+
     return _mdui_component("mdui-text-field", **attrs)
 
 
-def Select(label="", variant="outlined", multiple=False, options=None, value="", **kwargs):
-    """MDUI Select component"""
+def _menu_item(opt):
+    return _mdui_component("mdui-menu-item", _search.option_text(opt), value=_search.option_value(opt))
+
+
+def Select(label="", variant="outlined", multiple=False, options=None, value="",
+           search=None, page_size=50, match="substring", debounce=250, **kwargs):
+    """
+    MDUI Select component
+
+    Args:
+        options: List of {"value": ..., "text": ...} dicts
+        search: Name for server-side search; only the selected option and a
+            first page are rendered, the rest is searched and loaded from
+            MDUI.mount_select_search(app) as the user types or scrolls.
+            Without options, the ones registered under the name are used
+        page_size: Options per page in search mode
+        match: 'substring' (prefix matches first) or 'prefix'
+        debounce: Milliseconds of typing pause before a search request
+
+    Examples:
+        Select(label="Fruit", options=[{"value": "apple", "text": "Apple"}])
+        Select(label="Country", options=COUNTRIES, value="fr", search="countries")
+    """
     opts = options or []
     attrs = {"label": label, "value": value, "multiple": multiple, **kwargs}
     
@@ -134,14 +205,64 @@ def Select(label="", variant="outlined", multiple=False, options=None, value="",
     else:
         attrs["variant"] = "filled"
     
-    option_elements = [
-        _mdui_component("mdui-menu-item", opt.get("text", opt.get("value", "")), 
-                       value=opt.get("value", opt.get("text", "")))
-        for opt in opts
-    ]
+    if search:
+        if options is not None or _search.select_indexes.get(search) is None:
+            _search.select_indexes.register(search, opts, match)
+        option_elements = SelectOptions(search, selected=value, size=page_size, debounce=debounce)
+    else:
+        option_elements = [_menu_item(opt) for opt in opts]
     
     return _mdui_component("mdui-select", *option_elements, **attrs)
 
+
+def SelectOptions(name, query="", page=0, selected="", size=50, debounce=250):
+    """
+    One page of a searchable Select's options
+
+    The first page starts with the search field and the selected option; a
+    last item loads the next page when scrolled into view. Served by
+    MDUI.mount_select_search(app).
+    """
+    index = _search.select_indexes.get(name)
+    if index is None:
+        return ()
+    size = max(1, min(size, _search.MAX_PAGE_SIZE))
+    opts, more = index.page(query, page, size)
+    url = f"{_search.ROUTE}/{quote(name)}?size={size}&debounce={debounce}"
+    items = []
+    if page == 0:
+        items.append(_mdui_component(
+            "mdui-text-field",
+            id=f"mdui-select-{name}-search",
+            name="q",
+            value=query,
+            label="Search",
+            variant="outlined",
+            clearable=True,
+            hx_get=url,
+            hx_trigger=f"input changed delay:{debounce}ms, clear",
+            hx_sync="this:replace",
+            hx_target="closest mdui-select",
+            hx_swap="innerHTML",
+            hx_vals='js:{selected: event.target.closest("mdui-select").value}',
+        ))
+        # Keep the selected option so mdui-select can show its label
+        pos = index.position(selected) if selected else None
+        if pos is not None and index.options[pos] not in opts:
+            items.append(_menu_item(index.options[pos]))
+    items.extend(_menu_item(opt) for opt in opts)
+    if more:
+        items.append(_mdui_component(
+            "mdui-menu-item",
+            "…",
+            disabled=True,
+            hx_get=f"{url}&page={page + 1}&q={quote(query)}",
+            hx_trigger="intersect once",
+            hx_swap="outerHTML",
+        ))
+    return tuple(items)
+
+
 def SegmentedButton(value="", **kwargs):
     """MDUI Segmented Button component"""
     attrs = {"value": value, **kwargs}
@@ -179,22 +300,16 @@ def Checkbox(label="", checked=False, **kwargs):
     return checkbox
 
 
-def Radio(name="", value="", checked=False, **kwargs):
-    """MDUI Radio button component"""
-    attrs = {"name": name, "value": value, **kwargs}
-    if checked:
-        attrs["checked"] = True
-    
-    return _mdui_component("mdui-radio", **attrs)
+Radio = component("Radio", Schema("mdui-radio", [
+    Attr("name", "", set_when="always"),
+    Attr("value", "", set_when="always"),
+    Attr("checked", False, set_when="flag"),
+], emit=("name", "value", KWARGS, "checked"), doc="MDUI Radio button component"), globals())
 
 
-def Switch(checked=False, **kwargs):
-    """MDUI Switch component"""
-    attrs = {**kwargs}
-    if checked:
-        attrs["checked"] = True
-    
-    return _mdui_component("mdui-switch", **attrs)
+Switch = component("Switch", Schema("mdui-switch", [
+    Attr("checked", False, set_when="flag"),
+], emit=(KWARGS, "checked"), doc="MDUI Switch component"), globals())
 
 
 def ThemeToggle(icon_light="light_mode", icon_dark="dark_mode", **kwargs):
@@ -221,19 +336,11 @@ def ThemeToggle(icon_light="light_mode", icon_dark="dark_mode", **kwargs):
                           **attrs)
 
 
-def Dialog(headline="", description="", open=False, **kwargs):
-    """MDUI Dialog component"""
-    attrs = {**kwargs}
-    if open:
-        attrs["open"] = True
-    
-    content = []
-    if headline:
-        content.append(_mdui_component("div", headline, slot="headline"))
-    if description:
-        content.append(_mdui_component("div", description, slot="description"))
-    
-    return _mdui_component("mdui-dialog", *content, **attrs)
+Dialog = component("Dialog", Schema("mdui-dialog", [
+    Slot("headline"),
+    Slot("description"),
+    Attr("open", False, set_when="flag"),
+], emit=(KWARGS, "open"), doc="MDUI Dialog component"), globals())
 
 
 def Snackbar(message="", action_text=None, **kwargs):
@@ -244,17 +351,12 @@ def Snackbar(message="", action_text=None, **kwargs):
     
     return _mdui_component("mdui-snackbar", *content, **kwargs)
 
-def NavigationBarItem(icon="", label="", href="", **kwargs):
-    """MDUI Navigation Bar Item component"""
-    attrs = {**kwargs}
-    if icon:
-        attrs["icon"] = icon
-    if label:
-        attrs["label"] = label
-    if href:
-        attrs["href"] = href
-    
-    return _mdui_component("mdui-navigation-bar-item", **attrs)
+NavigationBarItem = component("NavigationBarItem", Schema("mdui-navigation-bar-item", [
+    Attr("icon", "", icon=True),
+    Attr("label", ""),
+    Attr("href", ""),
+], emit=(KWARGS, "icon", "label", "href"), doc="MDUI Navigation Bar Item component"), globals())
+
 
 def NavigationBar(*items, **kwargs):
     """MDUI Navigation Bar component"""
@@ -269,17 +371,12 @@ def NavigationRail(*items, **kwargs):
     """MDUI Navigation Rail component"""
     return _mdui_component("mdui-navigation-rail", *items, **kwargs)
 
-def NavigationRailItem(icon="", label="", href="", **kwargs):
-    """MDUI Navigation Rail Item component"""
-    attrs = {**kwargs}
-    if icon:
-        attrs["icon"] = icon
-    if label:
-        attrs["label"] = label
-    if href:
-        attrs["href"] = href
-    
-    return _mdui_component("mdui-navigation-rail-item", **attrs)
+NavigationRailItem = component("NavigationRailItem", Schema("mdui-navigation-rail-item", [
+    Attr("icon", "", icon=True),
+    Attr("label", ""),
+    Attr("href", ""),
+], emit=(KWARGS, "icon", "label", "href"), doc="MDUI Navigation Rail Item component"), globals())
+
 
 def TopAppBarTitle(title: str):
     return _mdui_component("mdui-top-app-bar-title", title)
@@ -318,15 +415,12 @@ def TopAppBar(*children, **kwargs):
 
 
 
-def Chip(text="", icon=None, selected=False, **kwargs):
-    """MDUI Chip component"""
-    attrs = {**kwargs}
-    if icon:
-        attrs["icon"] = icon
-    if selected:
-        attrs["selected"] = True
-    
-    return _mdui_component("mdui-chip", text, **attrs)
+Chip = component("Chip", Schema("mdui-chip", [
+    Text("text"),
+    Attr("icon", None, icon=True),
+    Attr("selected", False, set_when="flag"),
+], emit=(KWARGS, "icon", "selected"), doc="MDUI Chip component"), globals())
+
 
 def ListSubheader(*items, **kw):
     """MDUI List Subheader Component"""
@@ -337,45 +431,136 @@ def List(*items, **kwargs):
     return _mdui_component("mdui-list", *items, **kwargs)
 
 
-def ListItem(
-    headline: str = "", 
-    description: str = "", 
-    icon=None,
-    end_icon=None,
-    headline_line: str = "",
-    description_line: str = "",
-    href: str = "",
-    target: str = "",
-    disabled: bool = False,
-    non_clickable: bool = False,
-    rounded: bool = False,
-    **kwargs):
-    """MDUI List Item component"""
-    attrs = {**kwargs}
-    if icon:
-        attrs["icon"] = icon
-    if end_icon:
-        attrs["end-icon"] = end_icon
-    if headline:
-        attrs["headline"] = headline
-    if description:
-        attrs["description"] = description
-    if headline_line:
-        attrs["headline-line"] = headline_line
-    if description_line:
-        attrs["description-line"] = description_line
-    if href:
-        attrs["href"] = href
-    if target:
-        attrs["target"] = target
-    if disabled:
-        attrs["disabled"] = disabled
-    if non_clickable:
-        attrs["nonclickable"] = non_clickable
-    if rounded:
-        attrs["rounded"] = rounded
-    
-    return _mdui_component("mdui-list-item", **attrs)
+ListItem = component("ListItem", Schema("mdui-list-item", [
+    Attr("headline", ""),
+    Attr("description", ""),
+    Attr("icon", None, icon=True),
+    Attr("end_icon", None, icon=True),
+    Attr("headline_line", ""),
+    Attr("description_line", ""),
+    Attr("href", ""),
+    Attr("target", ""),
+    Attr("disabled", False),
+    Attr("non_clickable", False, attr="nonclickable"),
+    Attr("rounded", False),
+], emit=(KWARGS, "icon", "end_icon", "headline", "description", "headline_line", "description_line",
+         "href", "target", "disabled", "non_clickable", "rounded"),
+    doc="MDUI List Item component"), globals())
+
+
+# ListItem arguments and the attributes they set, in ListItem's output order
+_LIST_ITEM_ATTRS = (
+    ("icon", "icon"),
+    ("end_icon", "end-icon"),
+    ("headline", "headline"),
+    ("description", "description"),
+    ("headline_line", "headline-line"),
+    ("description_line", "description-line"),
+    ("href", "href"),
+    ("target", "target"),
+    ("disabled", "disabled"),
+    ("non_clickable", "nonclickable"),
+    ("rounded", "rounded"),
+)
+# Moved after every other attribute by ft_hx
+_TRAILING_ATTRS = ("id", "class", "title", "style")
+
+
+def _field(spec, first, columns):
+    """Getter for one record field: a callable, column index or field name"""
+    if callable(spec):
+        return spec
+    if isinstance(spec, int) or isinstance(first, Mapping):
+        return itemgetter(spec)
+    if columns is not None:
+        return itemgetter(columns.index(spec))
+    if not hasattr(first, spec):
+        raise ValueError(f"Records have no field {spec!r}; pass columns=... to name the fields of tuple rows")
+    return attrgetter(spec)
+
+
+def _list_from_records(rows, headline=None, description=None, icon=None, end_icon=None,
+                       headline_line=None, description_line=None, href=None, target=None,
+                       disabled=None, non_clickable=None, rounded=None,
+                       columns=None, item=None, prerender=False, **kwargs):
+    """
+    Build a List from query results in a single pass
+
+    The ListItem arguments name the record field they come from: a dict key,
+    attribute, index, a name in ``columns``, or a callable taking the record.
+    Items come out exactly as ListItem would build them.
+
+    Args:
+        rows: dicts, tuples, namedtuples, dataclasses or other objects, or a
+            dict of equal-length column arrays
+        columns: Field names of tuple rows
+        item: ListItem arguments shared by every item, e.g. {"icon": "person"}
+        prerender: Render the items straight to HTML instead of building
+            nodes; the output is the same
+        kwargs: List attributes
+
+    Examples:
+        List.from_records(users, headline="name", description="email", icon=lambda u: u.avatar_icon)
+        List.from_records(cursor.fetchall(), columns=("id", "name"), headline="name",
+                          href=lambda r: f"/users/{r[0]}", item={"end_icon": "chevron_right"})
+        List.from_records({"name": names, "email": emails}, headline="name", description="email")
+    """
+    if isinstance(rows, Mapping):
+        columns = tuple(rows)
+        rows = zip(*rows.values())
+    rows = iter(rows)
+    first = next(rows, None)
+    if first is None:
+        return List(**kwargs)
+    rows = chain((first,), rows)
+
+    # Shared arguments go through ListItem once; its attributes split into the
+    # ones before, among and after the per-record ones
+    shared = ListItem(**(item or {})).attrs
+    fields = {
+        "headline": headline, "description": description, "icon": icon, "end_icon": end_icon,
+        "headline_line": headline_line, "description_line": description_line, "href": href,
+        "target": target, "disabled": disabled, "non_clickable": non_clickable, "rounded": rounded,
+    }
+    mapped = {attr for _, attr in _LIST_ITEM_ATTRS}
+    head, plan, tail = {}, [], {}
+    for key, value in shared.items():
+        if key in _TRAILING_ATTRS:
+            tail[key] = value
+        elif key not in mapped:
+            head[key] = value
+    for param, attr in _LIST_ITEM_ATTRS:
+        spec = fields[param]
+        if spec is not None:
+            plan.append((attr, _field(spec, first, columns)))
+        elif attr in shared:
+            plan.append((attr, lambda row, value=shared[attr]: value))
+
+    record_tag("mdui-list-item")
+    node = FT if not _ROUTE_TARGETS.isdisjoint(shared) else CompactFT
+    icons = set()
+    items = []
+    for row in rows:
+        attrs = head.copy()
+        for attr, get in plan:
+            value = get(row)
+            if value:
+                attrs[attr] = valmap(value)
+        if tail:
+            attrs.update(tail)
+        for attr in ("icon", "end-icon"):
+            name = attrs.get(attr)
+            if name and name not in icons:
+                icons.add(name)
+                _use_icon(name)
+        items.append(empty_element("mdui-list-item", attrs) if prerender else node("mdui-list-item", (), attrs))
+
+    if prerender:
+        return List(Safe("".join(items)), **kwargs)
+    return List(*items, **kwargs)
+
+
+List.from_records = _list_from_records
 
 
 def Divider(vertical=False, **kw):
@@ -399,7 +584,12 @@ def Icon(name, variant="outlined", **kwargs):
         Icon("favorite", variant="filled")
         Icon("search", style="color: blue;")
     """
+    svg = sprite_icon(name, variant)
+    if svg is not None:
+        return _mdui_component("mdui-icon", svg, **kwargs)
+
     attrs = {"name": name, **kwargs}
+    _use_icon(name, variant if variant in ("outlined", "rounded", "sharp", "filled") else None)
     
     # Map variant to Material Icons class
     if variant == "outlined":
@@ -423,48 +613,50 @@ def Icon(name, variant="outlined", **kwargs):
     return _mdui_component("mdui-icon", **attrs)
 
 
-def Avatar(src=None, label=None, **kwargs):
-    """MDUI Avatar component"""
-    attrs = {**kwargs}
-    if src:
-        attrs["src"] = src
-    if label:
-        attrs["label"] = label
-    
-    return _mdui_component("mdui-avatar", **attrs)
+Avatar = component("Avatar", Schema("mdui-avatar", [
+    Attr("src", None),
+    Attr("label", None),
+], emit=(KWARGS, "src", "label"), doc="MDUI Avatar component"), globals())
 
 
-def Badge(content="", **kwargs):
-    """MDUI Badge component"""
-    return _mdui_component("mdui-badge", content, **kwargs)
+Badge = component("Badge", Schema("mdui-badge", [Text("content")], doc="MDUI Badge component"), globals())
 
 
-def Fab(icon, variant="primary", **kwargs):
-    """MDUI Floating Action Button component"""
-    return _mdui_component("mdui-fab", icon=icon, variant=variant, **kwargs)
+Fab = component("Fab", Schema("mdui-fab", [
+    Attr("icon", REQUIRED, set_when="always", icon=True),
+    Attr("variant", "primary", set_when="always"),
+], doc="MDUI Floating Action Button component"), globals())
 
 
-def Progress(value=None, **kwargs):
-    """MDUI Progress component"""
-    attrs = {**kwargs}
-    if value is not None:
-        attrs["value"] = value
-    
-    return _mdui_component("mdui-linear-progress", **attrs)
+Progress = component("Progress", Schema("mdui-linear-progress", [
+    Attr("value", None, set_when="not_none"),
+    Attr("stream", None, attr="data-mdui-stream"),
+], emit=(KWARGS, "value", "stream"), doc="""
+    MDUI Progress component
 
+    Args:
+        value: Progress between 0 and max (default 1); None for indeterminate
+        stream: URL of a progress_stream() endpoint updating the value live;
+            needs MDUI.headers(streams=True)
 
-def Slider(value=0, min=0, max=100, **kwargs):
-    """MDUI Slider component"""
-    return _mdui_component("mdui-slider", value=value, min=min, max=max, **kwargs)
+    Examples:
+        Progress(0.4)
+        Progress(0, stream=f"/jobs/{job_id}/progress", id=f"job-{job_id}")
+    """), globals())
 
 
-def Tab(label="", value="", icon=None, **kwargs):
-    """MDUI Tab component"""
-    attrs = {"value": value, **kwargs}
-    if icon:
-        attrs["icon"] = icon
-    
-    return _mdui_component("mdui-tab", label, **attrs)
+Slider = component("Slider", Schema("mdui-slider", [
+    Attr("value", 0, set_when="always"),
+    Attr("min", 0, set_when="always"),
+    Attr("max", 100, set_when="always"),
+], doc="MDUI Slider component"), globals())
+
+
+Tab = component("Tab", Schema("mdui-tab", [
+    Text("label"),
+    Attr("value", "", set_when="always"),
+    Attr("icon", None, icon=True),
+], emit=("value", KWARGS, "icon"), doc="MDUI Tab component"), globals())
 
 
 def TabPanel(value="", *content, **kwargs):
@@ -472,7 +664,5 @@ def TabPanel(value="", *content, **kwargs):
     return _mdui_component("mdui-tab-panel", *content, value=value, **kwargs)
 
 
-def Tooltip(content, **kwargs):
-    """MDUI Tooltip component"""
-    return _mdui_component("mdui-tooltip", content, **kwargs)
-
+Tooltip = component("Tooltip", Schema("mdui-tooltip", [Text("content", REQUIRED)],
+    doc="MDUI Tooltip component"), globals())
@@ -1,4 +1,198 @@
-from fasthtml.common import Script, Link, Style
+from functools import lru_cache
+from pathlib import Path
+from urllib.parse import urlsplit
+
+from fasthtml.common import FT, Script, Link, Style, Safe, to_xml
+from starlette.responses import Response
+
+from .assets import MDUIAssets
+from .components import SelectOptions
+from .icons import icon_registry
+from .minify import csp_hash, minify_css, minify_js
+from .modules import ComponentCollectorMiddleware, used_tags
+from .offline import service_worker
+from .batch import BATCH_JS
+from .patches import PATCH_JS
+from .streams import STREAM_JS
+from .render import Rendered
+from . import notify, search, sprites, virtual
+
+
+class _LiveHTML:
+    """Pre-rendered HTML with a few parts re-rendered on every response"""
+    
+    def __init__(self, parts):
+        self.parts = parts
+    
+    def __html__(self):
+        return Safe("".join(p if isinstance(p, str) else p.__html__() for p in self.parts))
+    
+    __str__ = __html__
+    
+    def __deepcopy__(self, memo):
+        return self
+
+
+class HeaderBundle(list):
+    """
+    Result of MDUI.headers()
+    
+    A list of header components, so ``hdrs.append(...)`` and
+    ``MDUI.headers() + [...]`` work as before, that also carries the head
+    pre-serialized as ``.html``, so it can be spliced into responses without
+    re-rendering: ``FastHTML(hdrs=MDUI.headers().html)``. ``.html`` is the
+    head as built; items added to the list afterwards aren't part of it.
+    
+    ``.csp_hashes`` holds the precomputed CSP sources for its inline blocks,
+    as {"script-src": [...], "style-src": [...]}.
+    """
+    
+    def __init__(self, items=()):
+        super().__init__(items)
+        self.csp_hashes = {"script-src": [], "style-src": []}
+        parts, static = [], []
+        for item in self:
+            if isinstance(item, FT) and item.tag in ("script", "style") and not item.attrs.get("src"):
+                directive = "script-src" if item.tag == "script" else "style-src"
+                self.csp_hashes[directive].append(csp_hash("".join(map(str, item.children))))
+            if hasattr(item, "__html__") and not isinstance(item, FT):
+                # Live parts (e.g. IconFontLinks) must stay unrendered
+                parts.extend([Safe(to_xml(tuple(static), indent=False)), item])
+                static = []
+            else:
+                static.append(item)
+        html = Safe(to_xml(tuple(static), indent=False))
+        self.html = _LiveHTML(parts + [html]) if parts else html
+    
+    def copy(self):
+        """New list of the same components, sharing the pre-rendered head"""
+        bundle = HeaderBundle.__new__(HeaderBundle)
+        list.extend(bundle, self)
+        bundle.html = self.html
+        bundle.csp_hashes = {k: list(v) for k, v in self.csp_hashes.items()}
+        return bundle
+    
+    __copy__ = copy
+    
+    def __deepcopy__(self, memo):
+        # FastHTML deep-copies app headers on every request; header components
+        # are never mutated, so only the list itself is copied
+        return self.copy()
+
+
+class IconFontLinks:
+    """
+    Icon font stylesheets for the icons recorded so far
+    
+    Used by headers(icons="auto"). It renders on each response from the
+    icon registry, so icons first used after the app was created are still
+    picked up; the output is cached until a new icon is recorded. Only the
+    variants in use are loaded and, for the Material Symbols fonts on the
+    CDN, only the glyphs in use (via Google Fonts' ``icon_names``). The
+    classic Material Icons font can't be subset that way and is loaded whole.
+    """
+    
+    VARIANT_KEYS = {
+        "filled": "MATERIAL_ICONS_CSS",
+        "outlined": "MATERIAL_ICONS_OUTLINED_CSS",
+        "rounded": "MATERIAL_ICONS_ROUNDED_CSS",
+        "sharp": "MATERIAL_ICONS_SHARP_CSS",
+    }
+    
+    def __init__(self, mdui, assets="cdn", loading="blocking", registry=icon_registry):
+        self.mdui = mdui
+        self.assets = assets
+        self.loading = loading
+        self.registry = registry
+        self._version = None
+        self._html = Safe("")
+    
+    def urls(self):
+        urls = []
+        for variant, names in self.registry.used().items():
+            url = self.mdui.asset_url(self.VARIANT_KEYS[variant], self.assets)
+            if self.assets == "cdn" and variant != "filled":
+                # Google Fonts requires icon_names to be sorted
+                url += "&icon_names=" + ",".join(names)
+            urls.append(url)
+        return urls
+    
+    def __html__(self):
+        version = self.registry.version
+        if version != self._version:
+            links = tuple(self.mdui.stylesheet(url, self.loading) for url in self.urls())
+            self._html = Safe(to_xml(links, indent=False))
+            self._version = version
+        return self._html
+    
+    __str__ = __html__
+    
+    def state(self):
+        """What the head loaded, for late_html()"""
+        return frozenset(self.urls())
+    
+    def late_html(self, sent):
+        """Stylesheets for icons first used after the head was rendered (see stream_page)"""
+        urls = [url for url in self.urls() if url not in sent]
+        return Safe(to_xml(tuple(self.mdui.stylesheet(url, self.loading) for url in urls), indent=False))
+    
+    def __deepcopy__(self, memo):
+        return self
+
+
+class ComponentModules:
+    """
+    ES module imports for the mdui-* components the response uses
+    
+    Used by headers(scripts="modules") in place of mdui.global.js. Renders
+    a modulepreload link per component followed by one module script that
+    imports them, so the browser only parses the components on the page.
+    Rendered HTML is cached per distinct tag set.
+    """
+    
+    def __init__(self, mdui, max_cached=256):
+        self.mdui = mdui
+        self.max_cached = max_cached
+        self._cache = {}
+    
+    def urls(self, tags=None):
+        tags = used_tags() if tags is None else tags
+        return [self.mdui.component_module_url(tag) for tag in sorted(tags)]
+    
+    def _html(self, tags):
+        urls = self.urls(tags)
+        links = [Link(rel="modulepreload", href=url) for url in urls]
+        imports = "".join(f'import "{url}";' for url in urls)
+        return Safe(to_xml((*links, Script(imports, type="module")) if urls else (), indent=False))
+    
+    def __html__(self):
+        tags = used_tags()
+        html = self._cache.get(tags)
+        if html is None:
+            html = self._html(tags)
+            if len(self._cache) >= self.max_cached:
+                self._cache.clear()
+            self._cache[tags] = html
+        return html
+    
+    __str__ = __html__
+    
+    def state(self):
+        """What the head loaded, for late_html()"""
+        return used_tags()
+    
+    def late_html(self, sent):
+        """Imports for components first used after the head was rendered (see stream_page)"""
+        return self._html(used_tags() - sent)
+    
+    def __deepcopy__(self, memo):
+        return self
+
+
+@lru_cache(maxsize=128)
+def _cached_headers(cls, local_assets, *args):
+    # local_assets is only part of the key, so swapping asset sets invalidates
+    return HeaderBundle(cls.build_headers(*args))
 
 
 class MDUI:
@@ -13,9 +207,81 @@ class MDUI:
     MATERIAL_ICONS_SHARP_CSS = "https://fonts.googleapis.com/css2?family=Material+Symbols+Sharp:opsz,wght,FILL,GRAD@24,400,0,0"
     
     OPEN_SANS_FONT_CSS = "https://fonts.googleapis.com/css2?family=Open+Sans:wght@300;400;500;600;700&display=swap"
+    # Cookie holding the user's theme choice with headers(theme_mode="server")
+    THEME_COOKIE = "mdui-theme"
+    THEME_CLASSES = {"light": "mdui-theme-light", "dark": "mdui-theme-dark", "auto": "mdui-theme-auto"}
+    # Served by mount_service_worker() and registered by headers(offline=True)
+    SERVICE_WORKER_PATH = "/mdui-sw.js"
+    # Per-component ES modules, used by headers(scripts="modules")
+    COMPONENTS_ESM = f"https://esm.sh/mdui@{VERSION}/components/{{name}}.js"
     # TAILWIND_CSS = "https://cdn.jsdelivr.net/npm/@tailwindcss/browser@4"
     TACHYONS_CSS = "https://unpkg.com/tachyons@4.12.0/css/tachyons.min.css"
     
+    # Bundled file names used when headers(assets="local")
+    LOCAL_ASSETS = {
+        "CDN_CSS": "mdui.css",
+        "CDN_JS": "mdui.global.js",
+        "TACHYONS_CSS": "tachyons.min.css",
+        "OPEN_SANS_FONT_CSS": "open-sans.css",
+        "MATERIAL_ICONS_CSS": "material-icons.css",
+        "MATERIAL_ICONS_OUTLINED_CSS": "material-symbols-outlined.css",
+        "MATERIAL_ICONS_ROUNDED_CSS": "material-symbols-rounded.css",
+        "MATERIAL_ICONS_SHARP_CSS": "material-symbols-sharp.css",
+    }
+    _assets = None
+    
+    @classmethod
+    def local_assets(cls):
+        """Return the shared bundled asset set, scanning it on first use"""
+        if cls._assets is None:
+            cls._assets = MDUIAssets()
+        if "mdui-theme.js" not in cls._assets:
+            cls._assets.add("mdui-theme.js", minify_js(cls.SERVER_THEME_JS))
+        return cls._assets
+    
+    @classmethod
+    def use_assets(cls, assets):
+        """
+        Use vendored asset files for headers(assets="local")
+        
+        Call before building the headers. The files are fetched with
+        ``python -m fastmdui.assets fetch <directory>``.
+        
+        Args:
+            assets: Directory of the vendored files, or an MDUIAssets instance
+                (e.g. with a custom prefix)
+        """
+        previous = cls._assets
+        cls._assets = assets if isinstance(assets, MDUIAssets) else MDUIAssets(assets)
+        if previous is not None and previous is not cls._assets:
+            # Keep generated files, whose URLs may already be in cached headers
+            for asset in previous:
+                if asset.path is None and asset.name not in cls._assets:
+                    cls._assets.add(asset.name, asset.data)
+        return cls.local_assets()
+    
+    @classmethod
+    def mount_assets(cls, app, assets=None):
+        """
+        Serve the local and generated assets from a FastHTML app
+        
+        Args:
+            app: FastHTML app to register the asset route on
+            assets: Optional directory or MDUIAssets instance, see use_assets()
+        """
+        if assets is not None:
+            cls.use_assets(assets)
+        return cls.local_assets().mount(app)
+    
+    @classmethod
+    def asset_url(cls, key, assets="cdn"):
+        """Resolve a URL constant (e.g. 'CDN_CSS') for the given asset mode"""
+        if assets == "local":
+            return cls.local_assets().url(cls.LOCAL_ASSETS[key])
+        if assets != "cdn":
+            raise ValueError(f"assets must be 'cdn' or 'local', got {assets!r}")
+        return getattr(cls, key)
+    
     @classmethod
     def headers(
         cls, 
@@ -24,43 +290,155 @@ class MDUI:
         primary_light_color=None,
         primary_dark_color=None,
         icons="all", 
-        font="open-sans"):
+        font="open-sans",
+        assets="cdn",
+        loading="blocking",
+        scripts="global",
+        theme_mode="client",
+        inline="inline",
+        offline=False,
+        patches=False,
+        streams=False,
+        notifications=False,
+        batch=False):
         """
         Generate required MDUI headers for FastHTML
         
+        Results are cached by their arguments, so calling this per route or
+        per tenant only builds each distinct head once. See build_headers()
+        for the arguments.
+        
+        Returns:
+            HeaderBundle: list of header components, with the pre-rendered
+            HTML available as ``.html``
+        """
+        args = (theme, tachyons, primary_light_color, primary_dark_color, icons, font, assets, loading, scripts, theme_mode, inline, offline, patches, streams, notifications, batch)
+        # Callers may append to the list, so each call gets its own copy of the cached bundle
+        # Generated files (inline="external", server themes) live in the asset set too
+        local = cls.local_assets() if assets == "local" or inline == "external" or theme_mode == "server" else None
+        try:
+            hash(args)
+        except TypeError:
+            # Unhashable argument values can't be cached
+            return HeaderBundle(cls.build_headers(*args))
+        return _cached_headers(cls, local, *args).copy()
+    
+    @classmethod
+    def headers_html(cls, **kwargs):
+        """Pre-rendered header HTML for the given headers() arguments"""
+        return cls.headers(**kwargs).html
+    
+    @classmethod
+    def build_headers(
+        cls, 
+        theme="auto", 
+        tachyons=False, 
+        primary_light_color=None,
+        primary_dark_color=None,
+        icons="all", 
+        font="open-sans",
+        assets="cdn",
+        loading="blocking",
+        scripts="global",
+        theme_mode="client",
+        inline="inline",
+        offline=False,
+        patches=False,
+        streams=False,
+        notifications=False,
+        batch=False):
+        """
+        Build the MDUI header components without caching
+        
         Args:
             theme: 'light', 'dark', or 'auto'
             primary_color: Optional primary color (e.g., '#1976d2')
-            icons: Icon style - 'outlined', 'rounded', 'sharp', 'filled', or 'all'
+            icons: Icon style - 'outlined', 'rounded', 'sharp', 'filled', 'all',
+                'auto' to load only the icons components have used, or 'sprite'
+                to draw icons from MDUI.mount_icon_sprite(app, index) and load fonts
+                only for icons missing from the sprite index
             font: Font family - 'open-sans', 'roboto', 'default', or None
+            assets: 'cdn' to load from unpkg/Google Fonts, 'local' to use the
+                bundled files served by MDUI.mount_assets(app)
+            loading: 'blocking' for plain stylesheet/script tags, or 'async' to
+                add preconnect/preload hints, load fonts and tachyons without
+                blocking render and defer mdui.global.js. Only mdui.css stays
+                render-blocking. Open Sans is requested with font-display: swap;
+                icon fonts keep Google's 'block' so ligature names never flash.
+            scripts: 'global' to load the whole mdui.global.js, or 'modules' to
+                import only the components each response uses (see
+                MDUI.collect_components)
+            theme_mode: 'client' to resolve the theme in an inline script from
+                localStorage, or 'server' to have MDUI.server_theme(app) set
+                the theme class on <html> from a cookie, with only a small
+                cached theme script served by MDUI.mount_assets(app)
+            inline: 'inline' to embed the (minified) style block and theme
+                script, whose CSP hashes are on the result's ``.csp_hashes``,
+                or 'external' to serve them as cacheable files through
+                MDUI.mount_assets(app)
+            offline: register the service worker served by
+                MDUI.mount_service_worker(app, headers), which caches these assets
+            patches: add the script applying mdui_patch() attribute patches
+            streams: add the script binding Progress(stream=...) to its
+                progress_stream() endpoint
+            notifications: add the script showing the Snackbars delivered by
+                MDUI.mount_notifications(app)
+            batch: add the script collecting ChangeBatch changes
         Returns:
             List of FastHTML components for headers
         """
+        if loading not in ("blocking", "async"):
+            raise ValueError(f"loading must be 'blocking' or 'async', got {loading!r}")
+        if scripts not in ("global", "modules"):
+            raise ValueError(f"scripts must be 'global' or 'modules', got {scripts!r}")
+        if theme_mode not in ("client", "server"):
+            raise ValueError(f"theme_mode must be 'client' or 'server', got {theme_mode!r}")
+        if inline not in ("inline", "external"):
+            raise ValueError(f"inline must be 'inline' or 'external', got {inline!r}")
+        if scripts == "modules" and assets == "local":
+            raise ValueError("scripts='modules' loads components from a CDN and can't be combined with assets='local'")
+        
+        def url(key):
+            return cls.asset_url(key, assets)
+        
+        def stylesheet(key):
+            return cls.stylesheet(url(key), loading)
+        
         headers = [
-            Link(rel="stylesheet", href=cls.CDN_CSS),
-            Script(src=cls.CDN_JS),
+            Link(rel="stylesheet", href=url("CDN_CSS")),
+            ComponentModules(cls) if scripts == "modules" else Script(src=url("CDN_JS"), defer=loading == "async"),
         ]
         if tachyons:
-            headers.append(Link(rel="stylesheet", href=cls.TACHYONS_CSS))
+            headers.append(stylesheet("TACHYONS_CSS"))
         # Line ~25 - Load Open Sans font
         if font == "open-sans":
-            headers.append(Link(rel="stylesheet", href=cls.OPEN_SANS_FONT_CSS))
+            headers.append(stylesheet("OPEN_SANS_FONT_CSS"))
         # Add Material Icons based on preference
         if icons == "all":
             headers.extend([
-                Link(rel="stylesheet", href=cls.MATERIAL_ICONS_CSS),
-                Link(rel="stylesheet", href=cls.MATERIAL_ICONS_OUTLINED_CSS),
-                Link(rel="stylesheet", href=cls.MATERIAL_ICONS_ROUNDED_CSS),
-                Link(rel="stylesheet", href=cls.MATERIAL_ICONS_SHARP_CSS),
+                stylesheet("MATERIAL_ICONS_CSS"),
+                stylesheet("MATERIAL_ICONS_OUTLINED_CSS"),
+                stylesheet("MATERIAL_ICONS_ROUNDED_CSS"),
+                stylesheet("MATERIAL_ICONS_SHARP_CSS"),
             ])
         elif icons == "outlined":
-            headers.append(Link(rel="stylesheet", href=cls.MATERIAL_ICONS_OUTLINED_CSS))
+            headers.append(stylesheet("MATERIAL_ICONS_OUTLINED_CSS"))
         elif icons == "rounded":
-            headers.append(Link(rel="stylesheet", href=cls.MATERIAL_ICONS_ROUNDED_CSS))
+            headers.append(stylesheet("MATERIAL_ICONS_ROUNDED_CSS"))
         elif icons == "sharp":
-            headers.append(Link(rel="stylesheet", href=cls.MATERIAL_ICONS_SHARP_CSS))
+            headers.append(stylesheet("MATERIAL_ICONS_SHARP_CSS"))
         elif icons == "filled":
-            headers.append(Link(rel="stylesheet", href=cls.MATERIAL_ICONS_CSS))
+            headers.append(stylesheet("MATERIAL_ICONS_CSS"))
+        elif icons in ("auto", "sprite"):
+            # Sprite icons aren't recorded, so these are only the font fallbacks
+            headers.append(IconFontLinks(cls, assets, loading))
+        
+        if loading == "async":
+            # icons="auto" links are only known at render time
+            extra = [cls.MATERIAL_ICONS_CSS] if icons == "auto" and assets == "cdn" else []
+            if scripts == "modules":
+                extra.append(cls.COMPONENTS_ESM)
+            headers = cls.resource_hints(headers, extra) + headers
         
         style_content = f"""
         html, body {{
@@ -81,15 +459,289 @@ class MDUI:
         .mdui-theme-dark #theme-icon-light { display: none; }
         .mdui-theme-dark #theme-icon-dark { display: inline-flex; }
         """
+        if theme_mode == "server":
+            # Without a cookie the server sets mdui-theme-auto, which follows
+            # the system preference in CSS
+            style_content += """
+        @media (prefers-color-scheme: dark) {
+            .mdui-theme-auto #theme-icon-light { display: none; }
+            .mdui-theme-auto #theme-icon-dark { display: inline-flex; }
+        }
+        """
         
-        headers.append(Style(style_content))
-        headers.append(cls.theme_script())
+        style_content = minify_css(style_content)
+        if inline == "external":
+            headers.append(Link(rel="stylesheet", href=cls.generated_asset_url("mdui-head.css", style_content)))
+        else:
+            headers.append(Style(style_content))
+        if theme_mode == "server":
+            headers.append(Script(src=cls.local_assets().url("mdui-theme.js"), defer=True))
+        elif inline == "external":
+            # Stays blocking so the theme class is set before first paint
+            headers.append(Script(src=cls.generated_asset_url("mdui-theme-init.js", minify_js(cls.THEME_JS))))
+        else:
+            headers.append(cls.theme_script())
+        for enabled, name, js in (
+            (patches, "mdui-patch.js", PATCH_JS),
+            (streams, "mdui-stream.js", STREAM_JS),
+            (notifications, "mdui-notify.js", notify.NOTIFY_JS),
+            (batch, "mdui-batch.js", BATCH_JS),
+        ):
+            if not enabled:
+                continue
+            if inline == "external":
+                headers.append(Script(src=cls.generated_asset_url(name, minify_js(js)), defer=True))
+            else:
+                headers.append(Script(minify_js(js)))
+        if offline:
+            headers.append(Script(
+                f"if ('serviceWorker' in navigator) navigator.serviceWorker.register('{cls.SERVICE_WORKER_PATH}');"
+            ))
         return headers
     
     @classmethod
-    def theme_script(cls):
-        """Generate theme toggle script"""
-        return Script("""
+    def generated_asset_url(cls, name, content):
+        """Serve generated content as a content-hashed file via mount_assets()"""
+        asset = cls.local_assets().add(name, content)
+        return f"{cls.local_assets().prefix}/{asset.hashed_name}"
+    
+    @classmethod
+    def component_module_url(cls, tag):
+        """ES module URL that defines an mdui-* tag, e.g. mdui-list-item"""
+        return cls.COMPONENTS_ESM.format(name=tag.removeprefix("mdui-"))
+    
+    @classmethod
+    def collect_components(cls, app):
+        """
+        Track the mdui-* tags used by each request of a FastHTML app
+        
+        Needed for headers(scripts="modules") to import per-page components;
+        without it, every component built so far in the process is imported.
+        """
+        app.add_middleware(ComponentCollectorMiddleware)
+        return app
+    
+    @classmethod
+    def component_modules(cls):
+        """
+        Module imports for the components used so far in this request
+        
+        Add this to htmx fragment responses that introduce components the
+        full page didn't load.
+        """
+        return ComponentModules(cls).__html__()
+    
+    @classmethod
+    def offline_assets(cls, headers):
+        """
+        Asset URLs a service worker should cache for a headers() bundle
+        
+        Returns:
+            (precache, runtime): exact URLs of the stylesheets, scripts and
+            local font files, and URL prefixes cached on first use for what
+            is only known in the browser (Google Fonts files, icons="auto"
+            subsets, per-component modules)
+        """
+        precache, runtime = [], []
+        for item in headers:
+            if isinstance(item, FT) and (item.tag == "script" or item.attrs.get("rel") == "stylesheet"):
+                url = item.attrs.get("href") or item.attrs.get("src")
+                if url:
+                    precache.append(url)
+            elif isinstance(item, IconFontLinks) and item.assets == "cdn":
+                runtime.append("https://fonts.googleapis.com/")
+            elif isinstance(item, ComponentModules):
+                runtime.append(cls.COMPONENTS_ESM.split("{name}")[0])
+        if any(url.startswith("https://fonts.googleapis.com/") for url in precache + runtime):
+            runtime.append("https://fonts.gstatic.com/")
+        local = cls.local_assets()
+        for url in list(precache):
+            asset = local.from_url(url)
+            if asset is not None:
+                precache.extend(ref for ref in local.references(asset) if ref not in precache)
+        if any(isinstance(item, IconFontLinks) and item.assets == "local" for item in headers):
+            runtime.append(local.prefix + "/")
+        return precache, list(dict.fromkeys(runtime))
+    
+    @classmethod
+    def mount_service_worker(cls, app, headers):
+        """
+        Serve a cache-first service worker for a headers() bundle
+        
+        The cache is versioned from the asset URLs, which carry the MDUI
+        version or content hashes, so changing the asset set replaces it.
+        
+        Example:
+            hdrs = MDUI.headers(offline=True)
+            app = FastHTML(hdrs=hdrs)
+            MDUI.mount_service_worker(app, hdrs)
+        """
+        js = minify_js(service_worker(*cls.offline_assets(headers)))
+        
+        @app.route(cls.SERVICE_WORKER_PATH, methods=["get"], include_in_schema=False)
+        def mdui_service_worker():
+            # The worker itself must be revalidated so asset changes roll out
+            return Response(js, media_type="text/javascript", headers={"Cache-Control": "no-cache"})
+        
+        return app
+    
+    @classmethod
+    def mount_virtual_lists(cls, app):
+        """
+        Serve the windows VirtualList loads while scrolling
+        
+        Example:
+            app = FastHTML(hdrs=MDUI.headers())
+            MDUI.mount_virtual_lists(app)
+        """
+        return virtual.mount(app)
+    
+    @classmethod
+    def mount_select_search(cls, app):
+        """
+        Serve the option pages of Select(search=...)
+        
+        Example:
+            app = FastHTML(hdrs=MDUI.headers())
+            MDUI.mount_select_search(app)
+        """
+        @app.route(f"{search.ROUTE}/{{name}}", methods=["get"], include_in_schema=False)
+        def mdui_select_search(name: str, q: str = "", page: int = 0, size: int = 50,
+                               debounce: int = 250, selected: str = ""):
+            return Rendered(*SelectOptions(name, q, page, selected, size, debounce))
+        
+        return app
+    
+    @classmethod
+    def mount_notifications(cls, app, bus=None):
+        """
+        Serve the Server-Sent Events stream delivering each session's Snackbars
+        
+        Queue messages with fastmdui.notify.notifications.notify(session, ...).
+        
+        Example:
+            app = FastHTML(hdrs=MDUI.headers(notifications=True))
+            MDUI.mount_notifications(app)
+        """
+        return notify.mount(app, bus or notify.notifications)
+    
+    @classmethod
+    def mount_icon_sprite(cls, app, index):
+        """
+        Render Icon and Button icons from an inline SVG sprite
+        
+        Icons found in the index are drawn with ``<use>`` and their symbols
+        are written once per response in the page footer. Combine with
+        headers(icons="sprite") so only icons missing from the index load
+        an icon font.
+        
+        Args:
+            app: FastHTML app
+            index: Path of an icon index built with ``python -m fastmdui.sprites``;
+                none is bundled with the package
+        
+        Example:
+            app = FastHTML(hdrs=MDUI.headers(icons="sprite"))
+            MDUI.mount_icon_sprite(app, "icon-paths.idx")
+        """
+        index = Path(index)
+        if not index.exists():
+            raise FileNotFoundError(f"No icon index at {index}; build one with python -m fastmdui.sprites")
+        sprites.enable(sprites.IconIndex(index))
+        app.add_middleware(sprites.SymbolCollectorMiddleware)
+        app.ftrs.append(sprites.IconSprite())
+        return app
+    
+    @classmethod
+    def icon_sprite(cls):
+        """
+        Symbols referenced so far in this request
+        
+        Add this to htmx fragment responses, which don't get the page footer.
+        """
+        return sprites.IconSprite().__html__()
+    
+    @classmethod
+    def stylesheet(cls, href, loading="blocking"):
+        """
+        Stylesheet link for the given loading strategy
+        
+        'async' uses the media="print" swap so the stylesheet downloads
+        without blocking first render. There is no <noscript> fallback since
+        MDUI components need JavaScript anyway.
+        """
+        if loading == "async":
+            return Link(rel="stylesheet", href=href, media="print", onload="this.media='all'")
+        return Link(rel="stylesheet", href=href)
+    
+    @classmethod
+    def resource_hints(cls, headers, urls=()):
+        """
+        preconnect/preload hints for the given header components
+        
+        Adds a preconnect for each third-party origin in the headers or
+        ``urls`` (plus fonts.gstatic.com, where Google Fonts serves the font
+        files from) and preloads deferred scripts so they download alongside
+        mdui.css. Same-origin (local) assets need no preconnect.
+        """
+        hints, origins = [], []
+        srcs = [item.attrs.get("href") or item.attrs.get("src") for item in headers if isinstance(item, FT)]
+        for src in [*srcs, *urls]:
+            parts = urlsplit(src or "")
+            origin = f"{parts.scheme}://{parts.netloc}"
+            if parts.netloc and origin not in origins:
+                origins.append(origin)
+        if "https://fonts.googleapis.com" in origins:
+            origins.append("https://fonts.gstatic.com")
+        for origin in origins:
+            # Font files are always fetched in CORS mode
+            hints.append(Link(rel="preconnect", href=origin, crossorigin=origin == "https://fonts.gstatic.com"))
+        for item in headers:
+            if isinstance(item, FT) and item.tag == "script" and item.attrs.get("defer"):
+                hints.append(Link(rel="preload", href=item.attrs["src"], **{"as": "script"}))
+        return hints
+    
+    SERVER_THEME_JS = """
+function toggleTheme() {
+    const html = document.documentElement;
+    const dark = html.classList.contains('mdui-theme-dark') ||
+        (html.classList.contains('mdui-theme-auto') && matchMedia('(prefers-color-scheme: dark)').matches);
+    const next = dark ? 'light' : 'dark';
+    html.classList.remove('mdui-theme-auto', 'mdui-theme-light', 'mdui-theme-dark');
+    html.classList.add('mdui-theme-' + next);
+    document.cookie = 'mdui-theme=' + next + '; path=/; max-age=31536000; samesite=lax';
+}
+"""
+    
+    @classmethod
+    def theme_class(cls, req, default="auto"):
+        """Theme class for a request, from the theme cookie or ``default``"""
+        theme = req.cookies.get(cls.THEME_COOKIE)
+        return cls.THEME_CLASSES.get(theme) or cls.THEME_CLASSES[default]
+    
+    @classmethod
+    def server_theme(cls, app, default="auto"):
+        """
+        Resolve the theme on the server for headers(theme_mode="server")
+        
+        Adds a beforeware that puts the theme class from the cookie (or
+        ``default``: 'auto', 'light' or 'dark') on <html>, so pages render in
+        the right theme without a client-side bootstrap.
+        
+        Example:
+            app = FastHTML(hdrs=MDUI.headers(theme_mode="server"))
+            MDUI.server_theme(app)
+            MDUI.mount_assets(app)
+        """
+        def set_theme_class(req):
+            current = req.htmlkw.pop("cls", None) or req.htmlkw.pop("class", None)
+            theme = cls.theme_class(req, default)
+            req.htmlkw["cls"] = f"{current} {theme}" if current else theme
+        
+        app.before.append(set_theme_class)
+        return app
+    
+    THEME_JS = """
         function toggleTheme() {
             const html = document.documentElement;
             const current = html.getAttribute('class')?.includes('mdui-theme-dark') ? 'dark' : 'light';
@@ -117,5 +769,9 @@ class MDUI:
         
         // Initialize theme on page load
         initTheme();
-        """)
-
+        """
+    
+    @classmethod
+    def theme_script(cls):
+        """Generate theme toggle script"""
+        return Script(minify_js(cls.THEME_JS))
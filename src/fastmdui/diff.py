@@ -0,0 +1,211 @@
+"""
+Tree-diff re-rendering
+
+Instead of swapping a whole Card or List when part of it changed, the view
+is rendered in full on the page and re-rendered on each change. The
+differ compares the new tree with the previous one and sends only what
+changed: nodes whose content or structure changed as out-of-band swaps,
+nodes whose attributes alone changed as mdui_patch() attribute patches.
+
+    app = FastHTML(hdrs=MDUI.headers(patches=True))
+
+    def cart_view(cart):
+        return List(*(ListItem(i.name, description=f"{i.qty} × {i.price}", id=f"item-{i.id}")
+                      for i in cart.items), id="cart")
+
+    @app.get("/cart")
+    def page(session):
+        return views.render(session, "cart", cart_view(load_cart(session)))
+
+    @app.post("/cart/{item}/add")
+    def add(session, item: int):
+        return views.update(session, "cart", cart_view(add_item(session, item)))
+
+    Button("Add", hx_post=f"/cart/{product.id}/add", hx_swap="none")
+
+Nodes are matched by ``id``, or by ``data-key`` for nodes that have no id.
+The view's root needs one of them. The previous tree is kept per session
+and view as hashes only, a few small tuples per keyed node, in a bounded
+LRU. Elements triggering updates should use hx-swap="none", since the
+changes arrive out of band.
+"""
+import secrets
+import threading
+from collections import OrderedDict
+
+from .nodes import CompactFT
+from .patches import Patch, mdui_updates, oob
+from .render import _ELEMENTS, Lazy, _element, render
+
+
+# Session key holding the id views are stored under
+SESSION_KEY = "mdui_views"
+# (session, view) snapshots kept before the least recently used is dropped
+MAX_VIEWS = 4096
+# Keyed nodes a snapshot may have; larger views are always swapped whole
+MAX_NODES = 20_000
+
+
+def _key(items):
+    for k, v in items:
+        if k == "id" and v:
+            return str(v), True
+    for k, v in items:
+        if k == "data-key" and v:
+            return str(v), False
+    return None, False
+
+
+def _children(elm, cs):
+    """Children with Lazy iterators materialized, so the node still renders later"""
+    if not any(isinstance(c, Lazy) for c in cs):
+        return cs
+    flat = []
+    for c in cs:
+        flat.extend(c.__ft__() if isinstance(c, Lazy) else (c,))
+    cs = tuple(flat)
+    if type(elm) is CompactFT and elm._ft is None:
+        object.__setattr__(elm, "_children", cs)
+    else:
+        (elm.to_ft() if type(elm) is CompactFT else elm).children = cs
+    return cs
+
+
+def _attrs(items):
+    """Attribute name -> value as rendered; False and None are absent"""
+    return {k: v for k, v in items if v is not False and v is not None and (k == "_" or k[-1] != "_")}
+
+
+class _Walk:
+    """Snapshot entries and nodes of one tree, keyed nodes in document order"""
+
+    def __init__(self):
+        # key -> (tag, ((attr, value hash), ...), structure hash)
+        self.entries = {}
+        # key -> (node, has id, attrs, parent key); not kept in the store
+        self.nodes = {}
+
+    def shape(self, elm, parent):
+        """Hash of a node; keyed nodes are recorded and stand in as their key"""
+        if type(elm) not in _ELEMENTS:
+            if hasattr(elm, "__ft__"):
+                elm = elm.__ft__()
+            if isinstance(elm, (tuple, list)):
+                return hash(tuple(self.shape(c, parent) for c in elm))
+            if type(elm) not in _ELEMENTS:
+                return hash(render(elm, indent=False))
+        tag, cs, items, _, _ = _element(elm)
+        cs = _children(elm, cs)
+        attrs = _attrs(items)
+        key, has_id = _key(attrs.items())
+        if key is not None and key not in self.nodes:
+            self.entries[key] = None  # reserve document order
+            self.nodes[key] = (elm, has_id, attrs, parent)
+            structure = hash((tag, tuple(self.shape(c, key) for c in cs)))
+            self.entries[key] = (tag, tuple((k, hash(str(v))) for k, v in attrs.items()), structure)
+            return hash(("key", key))
+        children = tuple(self.shape(c, parent) for c in cs)
+        return hash((tag, tuple((k, str(v)) for k, v in attrs.items()), children))
+
+
+def snapshot(tree):
+    """Walk a tree into its snapshot entries and nodes"""
+    walk = _Walk()
+    walk.shape(tree, None)
+    return walk
+
+
+def diff(previous, tree):
+    """
+    Out-of-band swaps and a Patch turning ``previous`` into ``tree``
+
+    Args:
+        previous: Snapshot entries of the tree on the page, or None
+        tree: The new tree, whose root has an id or data-key
+
+    Returns:
+        (updates, new snapshot entries); updates is a tuple for mdui_updates
+    """
+    walk = snapshot(tree)
+    if not walk.nodes or next(iter(walk.nodes.values()))[0] is not tree:
+        raise ValueError("The root of a diffed view needs an id or data-key")
+    updates, patch, covered = [], Patch(), set()
+    for key, entry in walk.entries.items():
+        node, has_id, attrs, parent = walk.nodes[key]
+        if parent in covered:
+            covered.add(key)
+            continue
+        old = previous.get(key) if previous else None
+        if old is None or old[0] != entry[0] or old[2] != entry[2] or (old[1] != entry[1] and not has_id):
+            updates.append(oob(node) if has_id else oob(node, f'outerHTML:[data-key="{key}"]'))
+            covered.add(key)
+        elif old[1] != entry[1]:
+            before = dict(old[1])
+            changed = {k: v for (k, h), v in zip(entry[1], attrs.values()) if before.get(k) != h}
+            removed = {k: None for k in before if k not in attrs}
+            patch.set(key, **{**changed, **removed})
+    if patch.patches:
+        updates.append(patch)
+    return tuple(updates), walk.entries
+
+
+class ViewStore:
+    """
+    Previous trees of each session's views, stored as snapshot entries
+
+    Args:
+        max_views: (session, view) snapshots kept; the least recently used
+            are dropped and their next update is a full swap
+        max_nodes: Keyed nodes a snapshot may have; larger views aren't stored
+    """
+
+    def __init__(self, max_views=MAX_VIEWS, max_nodes=MAX_NODES):
+        self.max_views = max_views
+        self.max_nodes = max_nodes
+        self._lock = threading.Lock()
+        self._views = OrderedDict()
+
+    def _id(self, session, name):
+        sid = session.get(SESSION_KEY) if hasattr(session, "get") else session
+        if sid is None:
+            sid = session[SESSION_KEY] = secrets.token_urlsafe(12)
+        return sid, name
+
+    def _store(self, key, entries):
+        with self._lock:
+            if len(entries) > self.max_nodes:
+                self._views.pop(key, None)
+                return
+            self._views[key] = entries
+            self._views.move_to_end(key)
+            if len(self._views) > self.max_views:
+                self._views.popitem(last=False)
+
+    def render(self, session, name, tree):
+        """Remember a view rendered in full and return it"""
+        self._store(self._id(session, name), snapshot(tree).entries)
+        return tree
+
+    def update(self, session, name, tree):
+        """
+        Response parts updating a view on the page to ``tree``
+
+        Without a stored snapshot (first update, evicted) the whole view is
+        swapped out of band.
+        """
+        key = self._id(session, name)
+        with self._lock:
+            previous = self._views.get(key)
+        updates, entries = diff(previous, tree)
+        self._store(key, entries)
+        return mdui_updates(*updates)
+
+    def forget(self, session, name):
+        with self._lock:
+            self._views.pop(self._id(session, name), None)
+
+    def __len__(self):
+        return len(self._views)
+
+
+views = ViewStore()
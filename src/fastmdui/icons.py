@@ -0,0 +1,94 @@
+"""
+Icon usage registry
+
+Components record the icon names and variants they render, so
+MDUI.headers(icons="auto") can load only the icon fonts (and glyphs)
+the app actually uses.
+"""
+import contextvars
+import threading
+from contextlib import contextmanager
+
+
+VARIANTS = ("filled", "outlined", "rounded", "sharp")
+
+# Set while compiling templates, so placeholder names aren't registered
+_recording = contextvars.ContextVar("mdui_icons", default=None)
+
+
+class IconRegistry:
+    """Thread-safe record of the icons used by rendered components"""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._icons = {variant: set() for variant in VARIANTS}
+        # Bumped on every new entry so consumers can cache per snapshot
+        self.version = 0
+
+    def add(self, name, variant=None):
+        """
+        Record an icon
+
+        Args:
+            name: Icon name, optionally with an mdui variant suffix ("home--rounded")
+            variant: 'filled', 'outlined', 'rounded' or 'sharp'; parsed from the
+                name suffix when omitted, defaulting to 'filled'
+        """
+        if not name or not isinstance(name, str):
+            return
+        recorded = _recording.get()
+        if recorded is not None:
+            recorded.append((name, variant))
+            return
+        if variant is None:
+            # mdui-icon names select a variant with a suffix, e.g. "search--outlined"
+            base, sep, suffix = name.partition("--")
+            if sep and suffix in VARIANTS:
+                name, variant = base, suffix
+            else:
+                variant = "filled"
+        names = self._icons.get(variant)
+        # Lock-free fast path for the common case of an already known icon
+        if names is None or name in names:
+            return
+        with self._lock:
+            if name not in names:
+                names.add(name)
+                self.version += 1
+
+    def update(self, *names, variant=None):
+        """Record several icons, e.g. to declare icons ahead of the first render"""
+        for name in names:
+            self.add(name, variant)
+
+    def used(self):
+        """Return {variant: sorted icon names} for every variant in use"""
+        with self._lock:
+            return {variant: sorted(names) for variant, names in self._icons.items() if names}
+
+    def clear(self):
+        with self._lock:
+            for names in self._icons.values():
+                names.clear()
+            self.version += 1
+
+
+@contextmanager
+def record_icons():
+    """
+    Capture icon registrations made inside the block instead of applying them
+
+    Example:
+        with record_icons() as icons:
+            Button("Save", icon="save")
+        # icons == [("save", None)]
+    """
+    icons = []
+    token = _recording.set(icons)
+    try:
+        yield icons
+    finally:
+        _recording.reset(token)
+
+
+icon_registry = IconRegistry()
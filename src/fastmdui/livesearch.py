@@ -0,0 +1,154 @@
+"""
+Debounced, cancellable live search
+
+TextField(search=url) sends the field's value as ``q`` once the user
+stops typing for ``debounce`` ms, and hx-sync replaces a request still in
+flight with the newer one. The browser then drops the stale response, but
+the server would keep computing it; LiveSearch cancels it instead:
+
+    @LiveSearch
+    async def products(q):
+        return [ListItem(p.name) for p in await db.search_products(q)]
+
+    TextField(label="Search", search="/products", results="product-results")
+    List(id="product-results")
+
+    @app.get("/products")
+    async def product_search(q: str, session):
+        return await products.run(session, q)
+
+Each client (by default, the session) has at most one search running:
+a newer query cancels the previous task, whose request gets an empty 204
+response that htmx doesn't swap. Results are cached per query for ``ttl``
+seconds in a bounded LRU, so repeated and backspaced queries are answered
+without running the search.
+"""
+import asyncio
+import secrets
+import threading
+import time
+from collections import OrderedDict
+from collections.abc import Mapping
+
+from starlette.concurrency import run_in_threadpool
+from starlette.responses import Response
+
+
+# Session key holding the live search client id
+SESSION_KEY = "mdui_search"
+# Queries whose results are kept per search
+MAX_CACHED_QUERIES = 256
+# Seconds a cached result is served
+TTL = 30.0
+
+
+def client_id(session):
+    """Live search id of a session, created on first use"""
+    key = session.get(SESSION_KEY)
+    if key is None:
+        key = session[SESSION_KEY] = secrets.token_urlsafe(12)
+    return key
+
+
+def superseded():
+    """Response to a search replaced by a newer one; htmx swaps nothing"""
+    return Response(status_code=204)
+
+
+class LiveSearch:
+    """
+    Search function run at most once at a time per client, with cached results
+
+    Args:
+        fn: Search taking the query (and any extra arguments to run());
+            async functions are cancelled when superseded, sync ones run in a
+            thread and only their result is discarded
+        ttl: Seconds a query's result is cached; 0 disables caching
+        max_cached: Queries whose results are kept
+    """
+
+    def __init__(self, fn, ttl=TTL, max_cached=MAX_CACHED_QUERIES):
+        self.fn = fn
+        self.ttl = ttl
+        self.max_cached = max_cached
+        self._lock = threading.Lock()
+        self._cache = OrderedDict()
+        # Client id -> its running search task
+        self._running = {}
+        self.__doc__ = getattr(fn, "__doc__", None)
+
+    def _key(self, client):
+        return client_id(client) if isinstance(client, Mapping) else client
+
+    def cached(self, query, *args):
+        """Cached result of a query, or None"""
+        key = (query, *args)
+        with self._lock:
+            found = self._cache.get(key)
+            if found is None:
+                return None
+            if found[0] < time.monotonic():
+                del self._cache[key]
+                return None
+            self._cache.move_to_end(key)
+            return found[1]
+
+    def _store(self, key, result):
+        if self.ttl <= 0:
+            return
+        with self._lock:
+            self._cache[key] = (time.monotonic() + self.ttl, result)
+            self._cache.move_to_end(key)
+            if len(self._cache) > self.max_cached:
+                self._cache.popitem(last=False)
+
+    async def _call(self, query, *args):
+        if asyncio.iscoroutinefunction(self.fn):
+            return await self.fn(query, *args)
+        return await run_in_threadpool(self.fn, query, *args)
+
+    async def run(self, client, query, *args):
+        """
+        Result of a search, or a 204 response if a newer query replaced it
+
+        Args:
+            client: The request's session, or any id for the client (e.g. a
+                tab id) whose newer queries supersede older ones
+            query: The search text; surrounding whitespace is ignored
+            args: Further arguments for the search function, part of the cache key
+        """
+        query = query.strip()
+        result = self.cached(query, *args)
+        if result is not None:
+            return result
+        key = self._key(client)
+        task = asyncio.ensure_future(self._call(query, *args))
+        with self._lock:
+            previous = self._running.get(key)
+            self._running[key] = task
+        if previous is not None:
+            previous.cancel()
+        try:
+            # wait() doesn't raise when the task is cancelled, only when this request is
+            await asyncio.wait((task,))
+        except asyncio.CancelledError:
+            task.cancel()
+            raise
+        finally:
+            with self._lock:
+                if self._running.get(key) is task:
+                    del self._running[key]
+        if task.cancelled():
+            return superseded()
+        result = task.result()
+        if result is not None:
+            self._store((query, *args), result)
+        return result
+
+    def running(self):
+        """Number of searches in flight"""
+        return len(self._running)
+
+    def clear(self):
+        with self._lock:
+            self._cache.clear()
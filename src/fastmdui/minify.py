@@ -0,0 +1,46 @@
+"""
+Minification and CSP hashes for the inline head assets
+
+The minifiers are deliberately conservative: they only target the small
+stylesheet and scripts fastMDUI generates itself, not arbitrary code.
+"""
+import base64
+import hashlib
+import re
+from functools import lru_cache
+
+
+_CSS_COMMENT = re.compile(r"/\*.*?\*/", re.S)
+_CSS_SPACE = re.compile(r"\s+")
+# Whitespace around these is never significant in CSS. ':' is left out on
+# purpose since "a :hover" and "a:hover" select different elements.
+_CSS_PUNCT = re.compile(r"\s*([{};,>])\s*")
+_JS_LINE_COMMENT = re.compile(r"^\s*//.*$", re.M)
+
+
+@lru_cache(maxsize=256)
+def minify_css(css):
+    """Strip comments and redundant whitespace from a stylesheet"""
+    css = _CSS_COMMENT.sub("", css)
+    css = _CSS_SPACE.sub(" ", css)
+    css = _CSS_PUNCT.sub(r"\1", css)
+    css = re.sub(r":\s+", ":", css.replace(";}", "}"))
+    return css.strip()
+
+
+@lru_cache(maxsize=64)
+def minify_js(js):
+    """
+    Strip full-line comments, indentation and blank lines from a script
+
+    Line breaks are kept so automatic semicolon insertion behaves exactly as
+    in the source.
+    """
+    js = _JS_LINE_COMMENT.sub("", js)
+    return "\n".join(line.strip() for line in js.splitlines() if line.strip())
+
+
+def csp_hash(content):
+    """CSP source expression (e.g. for script-src) allowing an inline block"""
+    digest = hashlib.sha256(content.encode("utf-8")).digest()
+    return f"'sha256-{base64.b64encode(digest).decode()}'"
@@ -0,0 +1,75 @@
+"""
+Per-component ES module loading
+
+Records which mdui-* custom elements a response contains, so the head can
+import just those components instead of the whole mdui.global.js:
+
+    app = FastHTML(hdrs=MDUI.headers(scripts="modules"))
+    MDUI.collect_components(app)
+
+Tags are recorded as components are built by ``_mdui_component``. Each HTTP
+request gets its own collector from ComponentCollectorMiddleware; outside a
+request every tag built so far in the process is used instead.
+"""
+import contextvars
+from contextlib import contextmanager
+
+
+_current = contextvars.ContextVar("mdui_tags", default=None)
+# Every tag built in this process, the fallback when no collector is active
+_seen = set()
+
+
+def record_tag(tag):
+    """Record an mdui-* tag for the current response"""
+    tags = _current.get()
+    if tags is not None:
+        tags.add(tag)
+    if tag not in _seen:
+        _seen.add(tag)
+
+
+def used_tags():
+    """Return the mdui-* tags used by the current response"""
+    tags = _current.get()
+    return frozenset(_seen if tags is None else tags)
+
+
+@contextmanager
+def collect_tags():
+    """
+    Collect the tags of everything built inside the block
+
+    Example:
+        with collect_tags() as tags:
+            page = List(ListItem("One"))
+        # tags == {"mdui-list", "mdui-list-item"}
+    """
+    tags = set()
+    token = _current.set(tags)
+    try:
+        yield tags
+    finally:
+        _current.reset(token)
+
+
+class ComponentCollectorMiddleware:
+    """
+    ASGI middleware giving each HTTP request its own tag collector
+
+    The collector set is created before the route runs, so components built
+    by sync handlers in FastHTML's threadpool (which copies the context) still
+    add to the same set.
+    """
+
+    def __init__(self, app):
+        self.app = app
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http":
+            return await self.app(scope, receive, send)
+        token = _current.set(set())
+        try:
+            await self.app(scope, receive, send)
+        finally:
+            _current.reset(token)
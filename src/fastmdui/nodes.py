@@ -0,0 +1,218 @@
+"""
+Compact element nodes
+
+CompactFT is what the mdui components return: the tag, children and a flat
+(name, value, name, value, ...) attribute tuple in slots, with the tag and
+attribute names interned. That is less than half the memory of an FT with
+its instance dict, attrs dict and listener list, which adds up on pages
+with tens of thousands of elements.
+
+CompactFT subclasses FT, so ``isinstance(node, FT)`` holds and code that
+type-checks components keeps working. Reading the tag, ``.children`` or
+``.attrs`` doesn't convert it. Changing the node (writing attributes or
+children, calling it, or mutating ``.attrs``) converts it to a real FT
+once, and the node delegates to that FT from then on. Rendering and
+copying never convert it.
+"""
+import copy
+import sys
+
+from fastcore.xml import FT, _fix_k
+
+
+_NO_ATTRS = ()
+
+
+def is_plain_ft(elm):
+    """True for FT nodes that aren't compact"""
+    return isinstance(elm, FT) and type(elm) is not CompactFT
+
+
+class _CompactAttrs(dict):
+    """
+    Attributes of a compact node, as read through ``.attrs``
+
+    A copy; writes convert the node and go to its FT. Popping a missing
+    name, as FastHTML does looking for route targets, changes nothing.
+    """
+
+    __slots__ = ("_node",)
+
+    def __init__(self, node):
+        super().__init__(node.items())
+        self._node = node
+
+    def _write(name):
+        def write(self, *args, **kwargs):
+            getattr(dict, name)(self, *args, **kwargs)
+            return getattr(self._node.to_ft().attrs, name)(*args, **kwargs)
+        return write
+
+    __setitem__ = _write("__setitem__")
+    __delitem__ = _write("__delitem__")
+    update = _write("update")
+    setdefault = _write("setdefault")
+    popitem = _write("popitem")
+    clear = _write("clear")
+
+    def pop(self, k, *default):
+        if k not in self:
+            return dict.pop(self, k, *default)
+        dict.pop(self, k)
+        return self._node.to_ft().attrs.pop(k)
+
+    del _write
+
+
+class CompactFT(FT):
+    """Slotted stand-in for FT with lazy conversion"""
+
+    __slots__ = ("_tag", "_children", "_attrs", "_ft")
+
+    def __init__(self, tag, children=(), attrs=None):
+        _set = object.__setattr__
+        _set(self, "_tag", sys.intern(tag))
+        _set(self, "_children", children)
+        if attrs:
+            flat = []
+            for k, v in attrs.items():
+                flat.append(sys.intern(k))
+                flat.append(v)
+            attrs = tuple(flat)
+        _set(self, "_attrs", attrs or _NO_ATTRS)
+        _set(self, "_ft", None)
+
+    @classmethod
+    def from_ft(cls, ft):
+        """Compact version of a non-void FT"""
+        return cls(ft.tag, ft.children, ft.attrs)
+
+    def items(self):
+        """(name, value) pairs of the attributes"""
+        if self._ft is not None:
+            return self._ft.attrs.items()
+        it = iter(self._attrs)
+        return zip(it, it)
+
+    def to_ft(self):
+        """The FT this node delegates to, created on first use"""
+        ft = self._ft
+        if ft is None:
+            ft = FT(self._tag, self._children, dict(self.items()))
+            object.__setattr__(self, "_ft", ft)
+            object.__setattr__(self, "_children", None)
+            object.__setattr__(self, "_attrs", None)
+        return ft
+
+    def __ft__(self):
+        # Renderers get a throwaway FT, so rendering doesn't grow the node
+        if self._ft is not None:
+            return self._ft
+        return FT(self._tag, self._children, dict(self.items()))
+
+    @property
+    def tag(self):
+        return self._tag if self._ft is None else self._ft.tag
+
+    @tag.setter
+    def tag(self, value):
+        self.to_ft().tag = value
+
+    @property
+    def children(self):
+        return self._children if self._ft is None else self._ft.children
+
+    @children.setter
+    def children(self, value):
+        self.to_ft().children = value
+
+    @property
+    def attrs(self):
+        return _CompactAttrs(self) if self._ft is None else self._ft.attrs
+
+    @attrs.setter
+    def attrs(self, value):
+        self.to_ft().attrs = value
+
+    @property
+    def void_(self):
+        return False if self._ft is None else self._ft.void_
+
+    def get(self, k, default=None):
+        k = _fix_k(k)
+        for name, value in self.items():
+            if name == k:
+                return value
+        return default
+
+    def __getattr__(self, k):
+        # Unset slots (while copy or pickle rebuild a node) and private names
+        # must not fall through to get(), which reads the slots
+        if k.startswith("_"):
+            raise AttributeError(k)
+        if k == "listeners_":
+            return self.to_ft().listeners_
+        # Like FT, other names read attributes
+        return self.get(k)
+
+    def __setattr__(self, k, v):
+        setattr(self.to_ft(), k, v)
+
+    def __call__(self, *c, **kw):
+        return self.to_ft()(*c, **kw)
+
+    def set(self, *c, **kw):
+        return self.to_ft().set(*c, **kw)
+
+    def changed(self):
+        self.to_ft().changed()
+        return self
+
+    @classmethod
+    def _wrap(cls, ft):
+        node = object.__new__(cls)
+        for k, v in (("_tag", ft.tag), ("_children", None), ("_attrs", None), ("_ft", ft)):
+            object.__setattr__(node, k, v)
+        return node
+
+    def __copy__(self):
+        if self._ft is not None:
+            return self._wrap(copy.copy(self._ft))
+        return CompactFT(self._tag, self._children, dict(self.items()))
+
+    def __deepcopy__(self, memo):
+        if self._ft is not None:
+            node = self._wrap(copy.deepcopy(self._ft, memo))
+        else:
+            node = CompactFT(self._tag, copy.deepcopy(self._children, memo), copy.deepcopy(dict(self.items()), memo))
+        memo[id(self)] = node
+        return node
+
+    def __reduce__(self):
+        return CompactFT, (self.tag, tuple(self.children), dict(self.items()))
+
+    def __iter__(self):
+        return iter(self._children if self._ft is None else self._ft.children)
+
+    def __getitem__(self, idx):
+        return (self._children if self._ft is None else self._ft.children)[idx]
+
+    def __setitem__(self, i, o):
+        self.to_ft()[i] = o
+
+    def __repr__(self):
+        return repr(self.__ft__())
+
+    def __html__(self):
+        # render imports this module
+        from .render import render
+        return render(self, indent=False)
+
+    def __str__(self):
+        return self.get("id") or self.__html__()
+
+    def __add__(self, b):
+        return f"{self}{b}"
+
+    def __radd__(self, b):
+        return f"{b}{self}"
@@ -0,0 +1,319 @@
+"""
+Snackbar notification bus
+
+Background events queue Snackbar messages per session; open pages receive
+them over one Server-Sent Events connection (or a WebSocket) each:
+
+    app = FastHTML(hdrs=MDUI.headers(notifications=True))
+    MDUI.mount_notifications(app)
+
+    @app.post("/import")
+    def start_import(session):
+        run_import(on_done=lambda: notifications.notify(session, "Import finished"))
+
+A single dispatcher task delivers every session's queue. It shows each
+session at most one Snackbar per ``interval``. Near-duplicate messages
+(same text apart from case, whitespace and numbers) that pile up in a
+burst are merged into one with a count. The same message is also
+suppressed for ``dedupe_window`` seconds after it was shown. Queues and the
+number of sessions are bounded.
+"""
+import asyncio
+import re
+import secrets
+import threading
+import time
+from collections import OrderedDict, deque
+from collections.abc import Mapping
+
+from starlette.responses import StreamingResponse
+
+from .components import Snackbar
+from .render import render
+
+
+ROUTE = "/_mdui_notify"
+EVENT = "snackbar"
+# Session key holding the notification id
+SESSION_KEY = "mdui_notify"
+# Sessions with queued messages or connections kept before the oldest is dropped
+MAX_SESSIONS = 10_000
+# Messages kept per session while waiting for delivery
+MAX_QUEUE = 20
+
+# Opens the notification stream and shows each Snackbar as it arrives
+NOTIFY_JS = """
+(() => {
+  const source = new EventSource("%s");
+  source.addEventListener("snackbar", (e) => {
+    const t = document.createElement("template");
+    t.innerHTML = e.data;
+    const el = t.content.firstElementChild;
+    el.addEventListener("closed", () => el.remove());
+    document.body.append(el);
+  });
+})();
+""" % ROUTE
+
+_NUMBERS = re.compile(r"\d+(?:[.,]\d+)*")
+_SPACES = re.compile(r"\s+")
+
+
+def _normalize(text):
+    """Key under which near-duplicate messages are merged"""
+    return _SPACES.sub(" ", _NUMBERS.sub("#", str(text))).strip().casefold()
+
+
+def session_id(session):
+    """Notification id of a session, created on first use"""
+    key = session.get(SESSION_KEY)
+    if key is None:
+        key = session[SESSION_KEY] = secrets.token_urlsafe(12)
+    return key
+
+
+class _Message:
+    __slots__ = ("key", "text", "action_text", "kwargs", "count")
+
+    def __init__(self, key, text, action_text, kwargs):
+        self.key = key
+        self.text = text
+        self.action_text = action_text
+        self.kwargs = kwargs
+        self.count = 1
+
+    def html(self):
+        text = self.text if self.count == 1 else f"{self.text} (×{self.count})"
+        return render(Snackbar(text, self.action_text, open=True, **self.kwargs), indent=False)
+
+
+class _Session:
+    __slots__ = ("pending", "subscribers", "next_at", "recent")
+
+    def __init__(self):
+        self.pending = deque()
+        self.subscribers = set()
+        self.next_at = 0.0
+        # Normalized message -> time it was last shown
+        self.recent = {}
+
+
+class Subscription:
+    """Snackbar HTML for one connection, filled by the bus's dispatcher"""
+
+    def __init__(self, bus, key):
+        self.bus = bus
+        self.key = key
+        self.queue = asyncio.Queue()
+
+    def __aiter__(self):
+        return self
+
+    async def __anext__(self):
+        return await self.queue.get()
+
+    def close(self):
+        self.bus._unsubscribe(self)
+
+
+class NotificationBus:
+    """
+    Per-session Snackbar queues delivered by one dispatcher task
+
+    Args:
+        interval: Minimum seconds between Snackbars shown to a session
+        dedupe_window: Seconds during which an identical message isn't shown again
+        max_queue: Messages kept per session; the oldest are dropped
+        max_sessions: Sessions tracked; the least recently used are dropped
+    """
+
+    def __init__(self, interval=1.0, dedupe_window=5.0, max_queue=MAX_QUEUE, max_sessions=MAX_SESSIONS):
+        self.interval = interval
+        self.dedupe_window = dedupe_window
+        self.max_queue = max_queue
+        self.max_sessions = max_sessions
+        self._lock = threading.Lock()
+        self._sessions = OrderedDict()
+        self._loop = None
+        self._wake = None
+        self._task = None
+
+    def _session(self, key):
+        session = self._sessions.get(key)
+        if session is None:
+            session = self._sessions[key] = _Session()
+            if len(self._sessions) > self.max_sessions:
+                # Connected sessions are never dropped
+                for old in list(self._sessions):
+                    if len(self._sessions) <= self.max_sessions:
+                        break
+                    if old != key and not self._sessions[old].subscribers:
+                        del self._sessions[old]
+        else:
+            self._sessions.move_to_end(key)
+        return session
+
+    def _key(self, session):
+        return session_id(session) if isinstance(session, Mapping) else session
+
+    def notify(self, session, message, action_text=None, **kwargs):
+        """
+        Queue a Snackbar for a session; safe to call from any thread
+
+        Args:
+            session: The request's session, or a notification id
+            message: Snackbar text
+            action_text: Optional action button label
+            kwargs: Further Snackbar attributes, e.g. placement="top"
+        """
+        key = self._key(session)
+        norm = _normalize(message)
+        with self._lock:
+            pending = self._session(key).pending
+            for queued in pending:
+                if queued.key == norm:
+                    # Merge into the queued one, showing the latest wording
+                    queued.text, queued.action_text, queued.kwargs = message, action_text, kwargs
+                    queued.count += 1
+                    break
+            else:
+                pending.append(_Message(norm, message, action_text, kwargs))
+                if len(pending) > self.max_queue:
+                    pending.popleft()
+        self._signal()
+
+    def broadcast(self, message, action_text=None, **kwargs):
+        """Queue a Snackbar for every session with an open connection"""
+        with self._lock:
+            keys = [key for key, session in self._sessions.items() if session.subscribers]
+        for key in keys:
+            self.notify(key, message, action_text, **kwargs)
+
+    def subscribe(self, session):
+        """Subscription receiving a session's Snackbars; starts the dispatcher"""
+        self._start()
+        subscription = Subscription(self, self._key(session))
+        with self._lock:
+            self._session(subscription.key).subscribers.add(subscription)
+        self._signal()
+        return subscription
+
+    def _unsubscribe(self, subscription):
+        with self._lock:
+            session = self._sessions.get(subscription.key)
+            if session is not None:
+                session.subscribers.discard(subscription)
+
+    def _start(self):
+        loop = asyncio.get_running_loop()
+        if self._task is None or self._task.done() or self._loop is not loop:
+            self._loop = loop
+            self._wake = asyncio.Event()
+            self._task = loop.create_task(self._dispatch())
+
+    def _signal(self):
+        loop, wake = self._loop, self._wake
+        if loop is None or loop.is_closed():
+            return
+        try:
+            running = asyncio.get_running_loop()
+        except RuntimeError:
+            running = None
+        if running is loop:
+            wake.set()
+        else:
+            loop.call_soon_threadsafe(wake.set)
+
+    def _due(self, now):
+        """(deliveries, seconds until the next one is due) for ready sessions"""
+        deliveries, wait = [], None
+        with self._lock:
+            for session in self._sessions.values():
+                if not session.pending or not session.subscribers:
+                    continue
+                if session.next_at > now:
+                    delay = session.next_at - now
+                    wait = delay if wait is None else min(wait, delay)
+                    continue
+                while session.pending:
+                    message = session.pending.popleft()
+                    shown = session.recent.get(message.key)
+                    if shown is not None and now - shown < self.dedupe_window and message.count == 1:
+                        continue
+                    session.recent[message.key] = now
+                    session.next_at = now + self.interval
+                    deliveries.append((message, tuple(session.subscribers)))
+                    if session.pending:
+                        wait = self.interval if wait is None else min(wait, self.interval)
+                    break
+                if len(session.recent) > self.max_queue:
+                    cutoff = now - self.dedupe_window
+                    session.recent = {k: t for k, t in session.recent.items() if t >= cutoff}
+        return deliveries, wait
+
+    async def _dispatch(self):
+        """The one task delivering every session's Snackbars"""
+        while True:
+            deliveries, wait = self._due(time.monotonic())
+            for message, subscribers in deliveries:
+                html = message.html()
+                for subscription in subscribers:
+                    subscription.queue.put_nowait(html)
+            if deliveries:
+                continue
+            try:
+                await asyncio.wait_for(self._wake.wait(), wait)
+            except asyncio.TimeoutError:
+                pass
+            self._wake.clear()
+
+
+notifications = NotificationBus()
+
+
+def _event(html):
+    data = "".join(f"data: {line}\n" for line in html.split("\n"))
+    return f"event: {EVENT}\n{data}\n"
+
+
+async def _events(bus, key):
+    subscription = bus.subscribe(key)
+    try:
+        async for html in subscription:
+            yield _event(html)
+    finally:
+        subscription.close()
+
+
+def mount(app, bus=notifications):
+    """Register the Server-Sent Events route delivering a session's Snackbars"""
+
+    @app.route(ROUTE, methods=["get"], include_in_schema=False)
+    def mdui_notifications(session):
+        return StreamingResponse(
+            _events(bus, session_id(session)),
+            media_type="text/event-stream",
+            headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"},
+        )
+
+    return app
+
+
+async def websocket(send, session, bus=notifications):
+    """
+    Forward a session's Snackbars to a WebSocket until it closes
+
+    Each one is sent as an htmx out-of-band swap appending it to the body,
+    for pages using the htmx ws extension.
+
+    Example:
+        @app.ws("/notify")
+        async def notify_ws(send, session):
+            await websocket(send, session)
+    """
+    subscription = bus.subscribe(session)
+    try:
+        async for html in subscription:
+            await send(f'<div hx-swap-oob="beforeend:body">{html}</div>')
+    finally:
+        subscription.close()
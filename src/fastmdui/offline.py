@@ -0,0 +1,65 @@
+"""
+Service worker for offline MDUI assets
+
+Generates a cache-first service worker that precaches the exact asset set a
+MDUI.headers() bundle loads, so repeat visits make no network requests for
+the UI framework:
+
+    hdrs = MDUI.headers(offline=True)
+    app = FastHTML(hdrs=hdrs)
+    MDUI.mount_service_worker(app, hdrs)
+"""
+import hashlib
+import json
+
+
+SERVICE_WORKER_JS = """
+const CACHE = %(cache)s;
+const PRECACHE = %(precache)s.map(u => new URL(u, self.location).href);
+const RUNTIME = %(runtime)s.map(u => new URL(u, self.location).href);
+const PRECACHED = new Set(PRECACHE);
+
+self.addEventListener('install', event => {
+    event.waitUntil(caches.open(CACHE).then(cache => cache.addAll(PRECACHE)).then(() => self.skipWaiting()));
+});
+
+self.addEventListener('activate', event => {
+    // Drop caches of previous asset sets
+    event.waitUntil(caches.keys()
+        .then(keys => Promise.all(keys.filter(k => k.startsWith('mdui-') && k !== CACHE).map(k => caches.delete(k))))
+        .then(() => self.clients.claim()));
+});
+
+self.addEventListener('fetch', event => {
+    const url = event.request.url;
+    if (event.request.method !== 'GET' || !(PRECACHED.has(url) || RUNTIME.some(p => url.startsWith(p)))) return;
+    event.respondWith(caches.open(CACHE).then(cache =>
+        cache.match(event.request, {ignoreVary: true}).then(hit => hit || fetch(event.request).then(resp => {
+            if (resp.ok || resp.type === 'opaque') cache.put(event.request, resp.clone());
+            return resp;
+        }))
+    ));
+});
+"""
+
+
+def cache_version(precache, runtime=()):
+    """Cache name derived from the asset URLs, which carry versions or content hashes"""
+    digest = hashlib.sha256("\n".join([*sorted(precache), "", *sorted(runtime)]).encode()).hexdigest()
+    return f"mdui-{digest[:12]}"
+
+
+def service_worker(precache, runtime=()):
+    """
+    Service worker source
+
+    Args:
+        precache: URLs fetched and cached on install
+        runtime: URL prefixes cached on first use (e.g. font files whose exact
+            URLs aren't known up front)
+    """
+    return SERVICE_WORKER_JS % {
+        "cache": json.dumps(cache_version(precache, runtime)),
+        "precache": json.dumps(list(precache)),
+        "runtime": json.dumps(list(runtime)),
+    }
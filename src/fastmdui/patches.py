@@ -0,0 +1,173 @@
+"""
+Out-of-band partial updates
+
+Live values (a Progress value, a Badge count, a Snackbar) can be updated
+without swapping the section around them. Either re-send just the element
+as an htmx out-of-band swap:
+
+    @app.post("/upload")
+    def upload():
+        ...
+        return Progress(0.4, id="upload").oob(), Badge("3", id="inbox-count").oob()
+
+or change only its attributes, which sends no HTML at all; the patches
+travel in an HX-Trigger-After-Swap header and the script added by
+MDUI.headers(patches=True) applies them:
+
+    return mdui_patch("upload", value=0.4)
+
+mdui_updates() batches any number of both into one response, merging the
+attribute patches into a single header:
+
+    return mdui_updates(
+        mdui_patch("upload", value=0.8),
+        mdui_patch("inbox-count", hidden=False),
+        Snackbar("Upload finished", id="toast", open=True).oob(),
+    )
+
+Elements are addressed by id, so give live components a stable one. A
+response made only of out-of-band parts and patches has an empty main
+body, which htmx's default innerHTML swap would put into the triggering
+element. mdui_updates() then adds ``HX-Reswap: none``; when returning a
+patch or swap on its own, give the triggering element hx-swap="none".
+"""
+import json
+
+from fastcore.xml import FT
+from fasthtml.common import HttpHeader
+from fasthtml.components import fh_cfg
+
+from .nodes import CompactFT
+
+
+EVENT = "mdui:patch"
+HEADER = "HX-Trigger-After-Swap"
+RESWAP = "HX-Reswap"
+
+# Applies {id: {attribute: value}}; null removes the attribute, true sets it empty
+PATCH_JS = """
+document.addEventListener("mdui:patch", (e) => {
+  for (const [id, attrs] of Object.entries(e.detail.patches || {})) {
+    const el = document.getElementById(id);
+    if (!el) continue;
+    for (const [k, v] of Object.entries(attrs)) {
+      if (v === null) el.removeAttribute(k);
+      else el.setAttribute(k, v === true ? "" : v);
+    }
+  }
+});
+"""
+
+
+def oob(elm, swap="true"):
+    """
+    Copy of a component marked for an htmx out-of-band swap
+
+    Args:
+        elm: Component with an id
+        swap: hx-swap-oob value: "true" (outerHTML), or a swap style with an
+            optional target such as "innerHTML" or "beforeend:#log"
+    """
+    if isinstance(elm, CompactFT) and elm._ft is None:
+        attrs = dict(elm.items())
+        children = elm._children
+    else:
+        attrs = dict(elm.attrs)
+        children = elm.children
+    # Without an explicit "style:selector" target, htmx swaps by id
+    if ":" not in swap and not attrs.get("id"):
+        raise ValueError(f"{elm.tag} needs an id to be swapped out of band")
+    attrs["hx-swap-oob"] = swap
+    return (CompactFT if isinstance(elm, CompactFT) else FT)(elm.tag, children, attrs)
+
+
+def _oob(self, swap="true"):
+    return oob(self, swap)
+
+
+CompactFT.oob = _oob
+if not hasattr(FT, "oob"):
+    FT.oob = _oob
+
+
+def _value(v):
+    if v is None or v is False:
+        return None
+    if v is True:
+        return True
+    return str(v)
+
+
+class Patch(HttpHeader):
+    """Attribute changes by element id, sent as one htmx trigger header"""
+
+    def __init__(self, patches=None):
+        self.k = HEADER
+        self.patches = patches or {}
+
+    def set(self, id, **attrs):
+        """Add attribute changes for an element; later values win"""
+        if not id:
+            raise ValueError("mdui_patch needs the id of the element to change")
+        changes = self.patches.setdefault(id, {})
+        for k, v in attrs.items():
+            changes[fh_cfg.attrmap(k)] = _value(v)
+        return self
+
+    def merge(self, other):
+        for id, attrs in other.patches.items():
+            self.patches.setdefault(id, {}).update(attrs)
+        return self
+
+    @property
+    def v(self):
+        return json.dumps({EVENT: {"patches": self.patches}}, separators=(",", ":"))
+
+    def __repr__(self):
+        return f"Patch({self.patches!r})"
+
+
+def mdui_patch(id, **attrs):
+    """
+    Change attributes of an element without re-rendering it
+
+    Values are set as attribute strings; True sets a boolean attribute and
+    False or None removes the attribute.
+
+    Examples:
+        mdui_patch("upload", value=0.4)
+        mdui_patch("save", disabled=True, loading=True)
+    """
+    return Patch().set(id, **attrs)
+
+
+def _flatten(parts):
+    for part in parts:
+        if isinstance(part, (tuple, list)):
+            yield from _flatten(part)
+        else:
+            yield part
+
+
+def _is_oob(part):
+    return isinstance(part, FT) and part.get("hx-swap-oob") not in (None, False)
+
+
+def mdui_updates(*parts):
+    """
+    Batch out-of-band swaps and attribute patches into one response
+
+    Patches are merged into a single header, later changes to the same
+    attribute winning; every other part is returned as is. When no part is
+    swapped in the normal way, an ``HX-Reswap: none`` header keeps htmx
+    from replacing the triggering element's content with the empty body.
+    """
+    merged, rest = None, []
+    for part in _flatten(parts):
+        if isinstance(part, Patch):
+            merged = Patch().merge(part) if merged is None else merged.merge(part)
+        else:
+            rest.append(part)
+    if all(_is_oob(part) or isinstance(part, HttpHeader) for part in rest):
+        rest.append(HttpHeader(RESWAP, "none"))
+    return (*rest, merged) if merged is not None else tuple(rest)
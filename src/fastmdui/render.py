@@ -0,0 +1,380 @@
+"""
+Direct-to-string renderer
+
+A drop-in replacement for ``fastcore.xml.to_xml`` that writes into a single
+string buffer instead of concatenating a new string at every level of the
+tree. Open/close strings are precomputed per tag and attribute strings are
+cached per value, so each value is escaped once. The output is byte-for-byte
+identical to ``to_xml``.
+
+    from fastmdui.render import render, Rendered
+
+    html = render(List(*items))          # same as to_xml(List(*items))
+
+    @app.get("/")
+    def home():
+        return Title("Items"), Rendered(List(*items))
+
+stream() renders the same output in chunks, consuming generator children
+one item at a time, and stream_page() sends a whole page that way:
+
+    @app.get("/items")
+    def items(req):
+        return stream_page(req, List(ListItem(r.name) for r in query()), title="Items")
+"""
+import json
+import types
+from collections.abc import Mapping
+from html import escape
+
+from fastcore.foundation import L
+from fastcore.xml import FT, Safe, _block_tags, _ws_significant
+from fasthtml.common import Body, Head, Html, Title
+from fasthtml.core import flat_xt
+from starlette.responses import StreamingResponse
+
+from .nodes import CompactFT
+
+
+# tag -> ("<tag", "</tag>", is_block, whitespace_significant)
+_TAGS = {}
+# (name, value) -> ' name="value"' for str values
+_ATTRS = {}
+_MAX_ATTRS = 8192
+# Bytes buffered by stream() before a chunk is sent
+CHUNK_SIZE = 16 * 1024
+# Yielded by _stream() where the buffer should be sent right away
+_FLUSH = object()
+
+
+def _tag(tag):
+    spec = _TAGS.get(tag)
+    if spec is None:
+        spec = _TAGS[tag] = (f"<{tag}", f"</{tag}>", tag in _block_tags, tag in _ws_significant)
+    return spec
+
+
+def _attr(k, v):
+    """Same output as fastcore.xml._to_attr, with a leading space"""
+    if isinstance(v, bool):
+        return f" {k}" if v else ""
+    if isinstance(v, str):
+        key = (k, v)
+        cached = _ATTRS.get(key)
+        if cached is not None:
+            return cached
+        if "&" in v or "<" in v or ">" in v:
+            v = escape(v, quote=False)
+    elif isinstance(v, Mapping):
+        key, v = None, json.dumps(v)
+    elif hasattr(v, "__html__"):
+        key, v = None, v.__html__()
+    else:
+        key, v = None, str(v)
+    qt = '"'
+    if qt in v:
+        qt = "'"
+        if "'" in v:
+            v = v.replace("'", "&#39;")
+    out = f" {k}={qt}{v}{qt}"
+    if key is not None:
+        if len(_ATTRS) >= _MAX_ATTRS:
+            _ATTRS.clear()
+        _ATTRS[key] = out
+    return out
+
+
+def _escape(s):
+    return "" if s is None else s.__html__() if hasattr(s, "__html__") \
+        else escape(s, quote=False) if isinstance(s, str) else s
+
+
+def _noescape(s):
+    return "" if s is None else s.__html__() if hasattr(s, "__html__") else s
+
+
+def _start(tag, items, editable, void_, lvl, indent):
+    """Start tag, close tag, indentation, newline and child indent flag of an element"""
+    open_, close, is_block, ws_significant = _tag(tag)
+    if indent and (ws_significant or editable):
+        indent = False
+    if indent and is_block:
+        sp, nl = " " * lvl, "\n"
+    else:
+        sp = nl = ""
+
+    if not tag:
+        stag_ = ""
+    elif items:
+        sattrs = "".join(
+            _attr(k, v) for k, v in items
+            if v is not False and v is not None and (k == "_" or k[-1] != "_")
+        )
+        stag_ = f"{open_}{sattrs}>"
+    else:
+        stag_ = f"{open_}>"
+    return stag_, "" if void_ else close, sp, nl, indent
+
+
+def _element(elm):
+    """(tag, children, attribute pairs, contenteditable, void) of an FT or CompactFT"""
+    if type(elm) is CompactFT and elm._ft is None:
+        attrs = elm._attrs
+        editable = "contenteditable" in attrs and elm.get("contenteditable") == "true"
+        return elm._tag, elm._children, elm.items() if attrs else (), editable, False
+    if type(elm) is CompactFT:
+        elm = elm._ft
+    attrs = elm.attrs
+    return elm.tag, elm.children, attrs.items(), attrs.get("contenteditable") == "true", elm.void_
+
+
+def empty_element(tag, attrs):
+    """HTML of a childless, non-void element, as render() outputs it for custom tags"""
+    open_, close, _, _ = _tag(tag)
+    sattrs = "".join(
+        _attr(k, v) for k, v in attrs.items()
+        if v is not False and v is not None and (k == "_" or k[-1] != "_")
+    )
+    return f"{open_}{sattrs}>{close}"
+
+
+def _inline(cs):
+    """True when to_xml renders the children on the start tag's line"""
+    return len(cs) == 1 and not isinstance(cs[0], (list, tuple, L, FT)) and not hasattr(cs[0], "__ft__")
+
+
+_ELEMENTS = (FT, CompactFT)
+
+
+class Lazy:
+    """
+    Children produced by an iterator
+
+    Components wrap generator children in Lazy so stream() can render them
+    one at a time; everything else materializes them through ``__ft__``.
+    The iterator is consumed by the first render.
+    """
+
+    __slots__ = ("items",)
+
+    def __init__(self, items):
+        self.items = items
+
+    def __ft__(self):
+        return tuple(self.items)
+
+
+_ITERATORS = (types.GeneratorType, map, filter)
+
+
+def lazy_children(children):
+    """Wrap generator children in Lazy instead of letting FT materialize them"""
+    if any(isinstance(c, _ITERATORS) for c in children):
+        return tuple(Lazy(c) if isinstance(c, _ITERATORS) else c for c in children)
+    return children
+
+
+def _render(elm, lvl, indent, esc, out):
+    if elm is None:
+        return
+    if type(elm) not in _ELEMENTS:
+        if hasattr(elm, "__ft__"):
+            elm = elm.__ft__()
+        if isinstance(elm, (tuple, L)):
+            for o in elm:
+                _render(o, lvl, indent, esc, out)
+            return
+        if isinstance(elm, bytes):
+            out.append(elm.decode("utf-8"))
+            return
+        if not isinstance(elm, FT):
+            out.append(f"{esc(elm)}")
+            return
+
+    tag, cs, items, editable, void_ = _element(elm)
+    stag_, cltag, sp, nl, indent = _start(tag, items, editable, void_, lvl, indent)
+    if not cs:
+        out.append(f"{sp}{stag_}{cltag}{nl}")
+        return
+    if _inline(cs):
+        out.append(f"{sp}{stag_}{esc(cs[0])}{cltag}{nl}")
+        return
+
+    out.append(f"{sp}{stag_}{nl}")
+    child_lvl = lvl + 2 if indent else 0
+    for c in cs:
+        _render(c, child_lvl, indent, esc, out)
+    if cltag:
+        out.append(f"{sp}{cltag}{nl}")
+
+
+def render(*elms, lvl=0, indent=True, do_escape=True):
+    """Render FT trees to HTML; same signature and output as ``to_xml``"""
+    esc = _escape if do_escape else _noescape
+    parts = []
+    for elm in elms:
+        if isinstance(elm, (list, tuple, L, FT, CompactFT)) or hasattr(elm, "__ft__"):
+            out = []
+            _render(elm, lvl, indent, esc, out)
+            parts.append("".join(out))
+        elif isinstance(elm, bytes):
+            parts.append(elm.decode("utf-8"))
+        else:
+            parts.append(elm or "")
+    return Safe("\n".join(parts))
+
+
+def _stream(elm, lvl, indent, esc):
+    """Yield the output of _render in pieces, iterating Lazy children as they're rendered"""
+    if type(elm) not in _ELEMENTS:
+        if isinstance(elm, Lazy):
+            for item in elm.items:
+                out = []
+                _render(item, lvl, indent, esc, out)
+                yield "".join(out)
+            return
+        if hasattr(elm, "__ft__"):
+            elm = elm.__ft__()
+        if isinstance(elm, (tuple, L)):
+            for o in elm:
+                yield from _stream(o, lvl, indent, esc)
+            return
+        if not isinstance(elm, FT):
+            out = []
+            _render(elm, lvl, indent, esc, out)
+            yield from out
+            return
+
+    tag, cs, items, editable, void_ = _element(elm)
+    if not cs or _inline(cs):
+        out = []
+        _render(elm, lvl, indent, esc, out)
+        yield out[0]
+    else:
+        stag_, cltag, sp, nl, indent = _start(tag, items, editable, void_, lvl, indent)
+        yield f"{sp}{stag_}{nl}"
+        child_lvl = lvl + 2 if indent else 0
+        for c in cs:
+            yield from _stream(c, child_lvl, indent, esc)
+        if cltag:
+            yield f"{sp}{cltag}{nl}"
+    if tag == "head":
+        # Let the browser start fetching the assets while the body renders
+        yield _FLUSH
+
+
+def stream(*elms, lvl=0, indent=True, do_escape=True, chunk_size=CHUNK_SIZE):
+    """
+    Render like render(), yielding chunks of about ``chunk_size`` characters
+
+    Generator children of components are consumed as they're rendered, so
+    memory stays flat however many items they produce. The buffer is also
+    flushed after ``</head>``.
+    """
+    esc = _escape if do_escape else _noescape
+    buf, size = [], 0
+    for i, elm in enumerate(elms):
+        if i:
+            buf.append("\n")
+        if isinstance(elm, (list, tuple, L, FT)) or hasattr(elm, "__ft__"):
+            pieces = _stream(elm, lvl, indent, esc)
+        else:
+            pieces = (render(elm),)
+        for piece in pieces:
+            if piece is _FLUSH:
+                size = chunk_size
+            else:
+                buf.append(piece)
+                size += len(piece)
+            if size >= chunk_size and buf:
+                yield "".join(buf)
+                buf, size = [], 0
+    if buf:
+        yield "".join(buf)
+
+
+def stream_page(req, *content, title=None, chunk_size=CHUNK_SIZE, **kwargs):
+    """
+    Stream a FastHTML page: the head (with the app's hdrs, e.g. MDUI.headers())
+    goes out first, then the body as it renders
+
+    Args:
+        req: The current request; supplies the app's hdrs, ftrs, htmlkw and bodykw
+        content: Body content; pass generators as component children to keep
+            memory flat
+        title: Page title, defaulting to the app's
+        kwargs: Passed to StreamingResponse (status_code, headers...)
+
+    Examples:
+        @app.get("/items")
+        def items(req):
+            return stream_page(req, List(ListItem(r.name) for r in query()))
+    """
+    if "hx-request" in req.headers and "hx-history-restore-request" not in req.headers:
+        page = lazy_children(content)
+    else:
+        late = _LateAssets(req.hdrs)
+        head = Head(Title(title or req.app.title), *flat_xt(req.hdrs), late.head_mark)
+        body = Body(*lazy_children(content), late, *flat_xt(req.ftrs), **req.bodykw)
+        page = Html(head, body, **req.htmlkw)
+    return StreamingResponse(stream(page, chunk_size=chunk_size), media_type="text/html", **kwargs)
+
+
+def _live_parts(items):
+    """Header parts rendered per response that can add assets late (ComponentModules, IconFontLinks)"""
+    for item in items:
+        if isinstance(item, (list, tuple)):
+            yield from _live_parts(item)
+        elif isinstance(item, FT):
+            continue
+        elif hasattr(item, "late_html"):
+            yield item
+        elif type(item).__name__ == "_LiveHTML":
+            yield from _live_parts(item.parts)
+
+
+class _LateAssets:
+    """
+    Module imports and icon fonts first needed by a streamed body
+
+    The head goes out before the body renders, so components and icons the
+    body uses for the first time are loaded from the end of the body.
+    """
+
+    def __init__(self, hdrs):
+        self.parts = list(_live_parts(hdrs))
+        self.sent = {}
+        self.head_mark = _HeadMark(self)
+
+    def __ft__(self):
+        return Safe("".join(part.late_html(self.sent[part]) for part in self.parts if part in self.sent))
+
+
+class _HeadMark:
+    """Records what the live header parts loaded once the head is rendered"""
+
+    def __init__(self, late):
+        self.late = late
+
+    def __ft__(self):
+        for part in self.late.parts:
+            self.late.sent[part] = part.state()
+        return ""
+
+
+class Rendered:
+    """
+    Content rendered with the fast path when FastHTML serializes the response
+
+    Wrap the heavy part of a page (e.g. a long List) in a handler's return
+    value; the page shell around it keeps using FastHTML's renderer.
+    """
+
+    def __init__(self, *children, indent=False):
+        self.children = children
+        self.indent = indent
+
+    def __html__(self):
+        return render(self.children, indent=self.indent)
+
+    __str__ = __html__
@@ -0,0 +1,223 @@
+"""
+Declarative component schemas
+
+Simple components are declared as a tag plus the arguments it takes: which
+attribute each one sets and when, which ones become slotted children, and
+where the free **kwargs attributes go. component() generates the
+constructor from the schema once at import, with the same signature and
+output a hand-written constructor would have, and a fast path for the
+common call without extra keyword attributes that builds the node directly
+instead of going through ft_hx:
+
+    ListItem = component("ListItem", Schema("mdui-list-item", [
+        Attr("headline", ""),
+        Attr("icon", None, icon=True),
+        Attr("non_clickable", False, attr="nonclickable"),
+    ], emit=(KWARGS, "icon", "headline", "non_clickable")), globals())
+
+    ListItem.schema.describe()  # tag, arguments, attributes, slots...
+"""
+from fasthtml.components import fh_cfg
+from fastcore.xml import FT, valmap
+
+from .modules import record_tag
+from .nodes import CompactFT, is_plain_ft
+
+
+KWARGS = "**kwargs"
+# When an Attr sets its attribute
+SET_WHEN = ("always", "truthy", "flag", "not_none")
+REQUIRED = object()
+# Generated constructors by name
+SCHEMAS = {}
+
+
+class Attr:
+    """
+    A constructor argument that sets an attribute
+
+    Args:
+        param: Argument name
+        default: Default value, or REQUIRED
+        attr: Attribute name; defaults to the argument name with dashes
+        set_when: 'always', 'truthy' (skipped when falsy), 'flag' (set to True
+            when truthy) or 'not_none'
+        icon: Record the value as a used icon
+    """
+
+    kind = "attr"
+
+    def __init__(self, param, default="", attr=None, set_when="truthy", icon=False):
+        if set_when not in SET_WHEN:
+            raise ValueError(f"set_when must be one of {SET_WHEN}, got {set_when!r}")
+        self.param = param
+        self.default = default
+        self.attr = attr or param.replace("_", "-")
+        self.set_when = set_when
+        self.icon = icon
+
+
+class Slot:
+    """A constructor argument rendered as a <div slot="..."> child when truthy"""
+
+    kind = "slot"
+
+    def __init__(self, param, default="", slot=None):
+        self.param = param
+        self.default = default
+        self.slot = slot or param.replace("_", "-")
+
+
+class Text:
+    """A constructor argument passed as the element's content"""
+
+    kind = "text"
+
+    def __init__(self, param, default=""):
+        self.param = param
+        self.default = default
+
+
+class Schema:
+    """
+    Declaration of a component
+
+    Args:
+        tag: Element tag
+        args: Attr/Slot/Text arguments in signature order
+        emit: Attribute order as argument names, with KWARGS marking where
+            extra keyword attributes go; defaults to the signature order
+            followed by KWARGS
+        kwargs: Whether the constructor takes extra keyword attributes
+        doc: Constructor docstring
+    """
+
+    def __init__(self, tag, args, emit=None, kwargs=True, doc=None):
+        self.tag = tag
+        self.args = tuple(args)
+        self.kwargs = kwargs
+        attrs = [a.param for a in self.args if a.kind == "attr"]
+        emit = tuple(emit) if emit is not None else (*attrs, *([KWARGS] if kwargs else []))
+        if sorted(p for p in emit if p != KWARGS) != sorted(attrs) or (KWARGS in emit) != kwargs:
+            raise ValueError(f"emit for {tag} must list every attribute argument once")
+        self.emit = emit
+        self.doc = doc or f"MDUI {tag} component"
+
+    def arg(self, param):
+        return next(a for a in self.args if a.param == param)
+
+    def describe(self):
+        """Plain-data description for validation and tooling"""
+        return {
+            "tag": self.tag,
+            "arguments": [
+                {"name": a.param, "kind": a.kind, "required": a.default is REQUIRED,
+                 **({} if a.default is REQUIRED else {"default": a.default})}
+                for a in self.args
+            ],
+            "attributes": {
+                a.param: {"attribute": a.attr, "set_when": a.set_when, "icon": a.icon}
+                for a in self.args if a.kind == "attr"
+            },
+            "slots": {a.param: a.slot for a in self.args if a.kind == "slot"},
+            "kwargs": self.kwargs,
+        }
+
+
+def _node(tag, children, attrs):
+    """Element built without ft_hx; the same node _mdui_component would return"""
+    record_tag(tag)
+    for c in children:
+        if is_plain_ft(c):
+            return FT(tag, children, attrs)
+    return CompactFT(tag, children, attrs)
+
+
+def _set_attr(lines, a, target, indent, fast):
+    value = f"_valmap({a.param})" if fast else a.param
+    pad = " " * indent
+    use_icon = [f"{pad}    _use_icon({a.param})"] if a.icon else []
+    if a.set_when == "always":
+        if fast:
+            lines += [f"{pad}_v = {value}", f"{pad}if _v is not None:", f"{pad}    {target}[{a.attr!r}] = _v"]
+        else:
+            lines.append(f"{pad}{target}[{a.attr!r}] = {value}")
+        lines += [u[4:] for u in use_icon]
+        return
+    test = f"{a.param} is not None" if a.set_when == "not_none" else a.param
+    if fast and a.set_when == "not_none":
+        test = f"(_v := {value}) is not None"
+        value = "_v"
+    lines.append(f"{pad}if {test}:")
+    lines.append(f"{pad}    {target}[{a.attr!r}] = {'True' if a.set_when == 'flag' else value}")
+    lines += use_icon
+
+
+def _source(name, schema):
+    """Constructor source for a schema"""
+    params = []
+    for a in schema.args:
+        params.append(a.param if a.default is REQUIRED else f"{a.param}=_defaults[{a.param!r}]")
+    if schema.kwargs:
+        params.append("**kwargs")
+    attrs = {a.param: a for a in schema.args if a.kind == "attr"}
+    texts = [a.param for a in schema.args if a.kind == "text"]
+    slots = [a for a in schema.args if a.kind == "slot"]
+
+    lines = [f"def {name}({', '.join(params)}):"]
+    children = [f"_mdui_component('div', {s.param}, slot={s.slot!r})" for s in slots]
+    lines.append("    children = []")
+    for t in texts:
+        lines.append(f"    children.append({t})")
+    for s, child in zip(slots, children):
+        lines += [f"    if {s.param}:", f"        children.append({child})"]
+
+    # Fast path: no extra attributes, so there's nothing for ft_hx to map
+    checks = ["not _cfg.auto_id"] + (["not kwargs"] if schema.kwargs else [])
+    checks += [f"type({t}) is str" for t in texts]
+    lines.append(f"    if {' and '.join(checks)}:")
+    lines.append("        attrs = {}")
+    for param in schema.emit:
+        if param != KWARGS:
+            _set_attr(lines, attrs[param], "attrs", 8, fast=True)
+    lines.append(f"        return _node({schema.tag!r}, tuple(children), attrs)")
+
+    before = schema.emit[:schema.emit.index(KWARGS)] if schema.kwargs else schema.emit
+    after = schema.emit[len(before) + 1:] if schema.kwargs else ()
+    lines.append("    attrs = {}")
+    for param in before:
+        _set_attr(lines, attrs[param], "attrs", 4, fast=False)
+    if schema.kwargs:
+        lines.append("    attrs.update(kwargs)")
+    for param in after:
+        _set_attr(lines, attrs[param], "attrs", 4, fast=False)
+    lines.append(f"    return _mdui_component({schema.tag!r}, *children, **attrs)")
+    return "\n".join(lines) + "\n"
+
+
+def component(name, schema, namespace):
+    """
+    Generate a component constructor from its schema
+
+    Args:
+        name: Constructor name
+        schema: The component's Schema
+        namespace: Globals providing _mdui_component and _use_icon
+    """
+    scope = {
+        "_mdui_component": namespace["_mdui_component"],
+        "_use_icon": namespace["_use_icon"],
+        "_node": _node,
+        "_valmap": valmap,
+        "_cfg": fh_cfg,
+        "_defaults": {a.param: a.default for a in schema.args if a.default is not REQUIRED},
+    }
+    source = _source(name, schema)
+    exec(compile(source, f"<schema {name}>", "exec"), scope)
+    fn = scope[name]
+    fn.__doc__ = schema.doc
+    fn.__module__ = namespace["__name__"]
+    fn.schema = schema
+    fn.source = source
+    SCHEMAS[name] = schema
+    return fn
@@ -0,0 +1,152 @@
+"""
+Server-side option search for Select
+
+Select(search="countries", options=COUNTRIES) renders only the selected
+option and a first page; the rest is searched and paged on the server:
+
+    app = FastHTML(hdrs=MDUI.headers())
+    MDUI.mount_select_search(app)
+
+Options are indexed once per name: a sorted key list answers prefix queries
+with bisect, and one joined, case-folded string answers substring queries
+with str.find. Result lists are cached per query in a bounded LRU. Rendering
+the Select again with equal options, even a freshly loaded list, reuses the
+index; options can also be registered once at startup and the Select given
+only the name:
+
+    select_indexes.register("countries", load_countries())
+    Select(label="Country", search="countries")
+"""
+import threading
+from array import array
+from bisect import bisect_left, bisect_right
+from collections import OrderedDict
+
+
+ROUTE = "/_mdui_select"
+MATCHES = ("prefix", "substring")
+# Queries whose results are kept per index
+MAX_CACHED_QUERIES = 256
+# Largest page a client may request
+MAX_PAGE_SIZE = 200
+
+
+def option_value(opt):
+    return opt.get("value", opt.get("text", ""))
+
+
+def option_text(opt):
+    return opt.get("text", opt.get("value", ""))
+
+
+def _options_key(options):
+    return tuple((option_value(opt), option_text(opt)) for opt in options)
+
+
+class OptionIndex:
+    """Prebuilt search index over Select options"""
+
+    def __init__(self, options, match="substring", max_cached=MAX_CACHED_QUERIES):
+        if match not in MATCHES:
+            raise ValueError(f"match must be one of {MATCHES}, got {match!r}")
+        self.options = options
+        self.match = match
+        self.max_cached = max_cached
+        # What the index depends on, to tell a reloaded but equal list apart from new options
+        self.key = _options_key(options)
+        keys = [str(option_text(opt)).casefold() for opt in options]
+        # Prefix search: keys in sorted order with their option positions
+        order = sorted(range(len(keys)), key=keys.__getitem__)
+        self._sorted_keys = [keys[i] for i in order]
+        self._sorted_pos = array("I", order)
+        # Substring search: one string, with the offset each key starts at
+        self._blob = "\n".join(keys)
+        self._starts = array("I")
+        offset = 0
+        for key in keys:
+            self._starts.append(offset)
+            offset += len(key) + 1
+        self._by_value = {option_value(opt): i for i, opt in enumerate(options)}
+        self._cache = OrderedDict()
+        self._lock = threading.Lock()
+
+    def __len__(self):
+        return len(self.options)
+
+    def position(self, value):
+        """Option position of a value, or None"""
+        return self._by_value.get(value)
+
+    def _prefix(self, query):
+        lo = bisect_left(self._sorted_keys, query)
+        hi = bisect_right(self._sorted_keys, query + "\U0010ffff", lo)
+        return sorted(self._sorted_pos[lo:hi])
+
+    def _substring(self, query):
+        blob, starts, found = self._blob, self._starts, []
+        i = blob.find(query)
+        while i != -1:
+            pos = bisect_right(starts, i) - 1
+            found.append(pos)
+            # Continue after this key, so each option is listed once
+            i = blob.find(query, starts[pos + 1] if pos + 1 < len(starts) else len(blob))
+        return found
+
+    def search(self, query):
+        """
+        Positions of the options matching a query, in option order
+
+        Prefix matches come first; with match="substring" they are followed
+        by the options containing the query elsewhere.
+        """
+        query = query.casefold().strip()
+        with self._lock:
+            result = self._cache.get(query)
+            if result is not None:
+                self._cache.move_to_end(query)
+                return result
+        if not query:
+            result = range(len(self.options))
+        else:
+            prefix = self._prefix(query)
+            if self.match == "substring":
+                seen = set(prefix)
+                prefix += [pos for pos in self._substring(query) if pos not in seen]
+            result = array("I", prefix)
+        with self._lock:
+            self._cache[query] = result
+            if len(self._cache) > self.max_cached:
+                self._cache.popitem(last=False)
+        return result
+
+    def page(self, query, page=0, size=50):
+        """(options on the page, whether more pages follow)"""
+        result = self.search(query)
+        start = page * size
+        return [self.options[i] for i in result[start:start + size]], start + size < len(result)
+
+
+class SelectIndexRegistry:
+    """Option indexes of the searchable Selects, by name"""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._indexes = {}
+
+    def register(self, name, options, match="substring"):
+        """Index options under a name, reusing the index while they're equal"""
+        index = self._indexes.get(name)
+        if index is not None and index.match == match and (
+                index.options is options or index.key == _options_key(options)):
+            return index
+        index = OptionIndex(options, match)
+        with self._lock:
+            self._indexes[name] = index
+        return index
+
+    def get(self, name):
+        return self._indexes.get(name)
+
+
+select_indexes = SelectIndexRegistry()
+
@@ -0,0 +1,296 @@
+"""
+Inline SVG sprite icons
+
+With MDUI.mount_icon_sprite(app, index), Icon and Button(icon=...) reference the
+icon as ``<svg><use href="#mdui-i-home"/></svg>`` instead of a font
+ligature, and the page footer carries one ``<symbol>`` per icon the
+response used. Pages whose icons are all in the index load no icon font.
+
+Icon paths come from an index file that is memory-mapped and looked up
+with a binary search, so only the icons a process renders are read. No
+index ships with the package; build one from Material SVG files as part of
+the app's build and pass its path:
+
+    python -m fastmdui.sprites build path/to/svgs [index]
+    python -m fastmdui.sprites fetch home search settings ... [index.idx]
+
+Icons missing from the index keep rendering with the icon font.
+"""
+import contextvars
+import mmap
+import re
+import sys
+import urllib.request
+from array import array
+from bisect import bisect_left
+from contextlib import contextmanager
+from html import escape
+from pathlib import Path
+
+from fastcore.xml import FT, Safe
+
+from .icons import VARIANTS
+
+
+# Where the command line writes an index unless given a path
+DEFAULT_INDEX = Path("icon-paths.idx")
+SYMBOL_PREFIX = "mdui-i-"
+# Material Symbols SVGs, by style ('outlined', 'rounded', 'sharp') and name
+SVG_URL = "https://fonts.gstatic.com/s/i/short-term/release/materialsymbols{style}/{name}/default/24px.svg"
+
+_VIEWBOX = re.compile(rb'viewBox="([^"]+)"')
+_PATH = re.compile(rb"<path\b([^>]*)>")
+_D = re.compile(rb'\bd="([^"]+)"')
+
+_current = contextvars.ContextVar("mdui_symbols", default=None)
+# Every symbol referenced in this process, the fallback when no collector is active
+_seen = set()
+# Index used by Icon/Button while sprite mode is on
+_active = None
+
+
+class IconIndex:
+    """
+    Memory-mapped ``name<TAB>viewBox<TAB>path data`` lines, sorted by name
+
+    Names are ``icon--variant`` ("home--rounded"), or just the icon name for
+    paths that serve every variant.
+    """
+
+    def __init__(self, path):
+        self.path = Path(path)
+        self._found = {}
+        with open(self.path, "rb") as f:
+            size = f.seek(0, 2)
+            self._map = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) if size else b""
+        # Offset of every line; the names themselves stay in the mapping
+        self._starts = array("I")
+        offset = 0
+        while offset < len(self._map):
+            self._starts.append(offset)
+            end = self._map.find(b"\n", offset)
+            offset = len(self._map) if end == -1 else end + 1
+
+    def __len__(self):
+        return len(self._starts)
+
+    def _name(self, i):
+        start = self._starts[i]
+        return self._map[start:self._map.find(b"\t", start)]
+
+    def entry(self, name):
+        """(name, viewBox, path data) of an index name, or None"""
+        key = name.encode()
+        i = bisect_left(range(len(self._starts)), key, key=self._name)
+        if i < len(self._starts) and self._name(i) == key:
+            start = self._starts[i]
+            end = self._map.find(b"\n", start)
+            return tuple(self._map[start:end if end != -1 else len(self._map)].decode().split("\t", 2))
+        return None
+
+    def get(self, name, variant="filled"):
+        """(index name, viewBox, path data) for an icon, or None"""
+        key = (name, variant)
+        found = self._found.get(key, False)
+        if found is False:
+            found = None
+            for candidate in (f"{name}--{variant}", name):
+                found = self.entry(candidate)
+                if found is not None:
+                    break
+            self._found[key] = found
+        return found
+
+    def names(self):
+        return [self._name(i).decode() for i in range(len(self._starts))]
+
+
+def _split(name, variant):
+    """(name, variant) with mdui's "name--variant" suffix applied"""
+    base, sep, suffix = name.partition("--")
+    if sep and suffix in VARIANTS:
+        return base, suffix
+    return name, variant if variant in VARIANTS else "filled"
+
+
+def record_symbol(name):
+    """Record an index name for the current response's sprite"""
+    names = _current.get()
+    if names is not None:
+        names.add(name)
+    if name not in _seen:
+        _seen.add(name)
+
+
+def used_symbols():
+    """Index names referenced by the current response"""
+    names = _current.get()
+    return frozenset(_seen if names is None else names)
+
+
+@contextmanager
+def collect_symbols():
+    """Collect the symbols of everything built inside the block"""
+    names = set()
+    token = _current.set(names)
+    try:
+        yield names
+    finally:
+        _current.reset(token)
+
+
+def enable(index):
+    """Render indexed icons as sprite references (None turns it off)"""
+    global _active
+    _active = index
+
+
+def sprite_icon(name, variant=None):
+    """
+    ``<svg><use></svg>`` for an indexed icon, or None to use the font
+
+    Args:
+        name: Icon name, optionally with a variant suffix ("home--rounded")
+        variant: 'filled', 'outlined', 'rounded' or 'sharp'
+    """
+    if _active is None or not name or not isinstance(name, str):
+        return None
+    found = _active.get(*_split(name, variant))
+    if found is None:
+        return None
+    key, viewbox, _ = found
+    record_symbol(key)
+    use = FT("use", (), {"href": f"#{SYMBOL_PREFIX}{key}"})
+    return FT("svg", (use,), {
+        "viewBox": viewbox, "width": "100%", "height": "100%", "fill": "currentColor", "aria-hidden": "true",
+    })
+
+
+class IconSprite:
+    """
+    Hidden ``<svg>`` of the symbols the response referenced
+
+    Added to the app's footers by MDUI.mount_icon_sprite(app, index). Each symbol
+    is written once per response; the HTML is cached per distinct set.
+    """
+
+    def __init__(self, index=None, max_cached=256):
+        self.index = index
+        self.max_cached = max_cached
+        self._cache = {}
+
+    def __html__(self):
+        index = self.index or _active
+        names = used_symbols()
+        html = self._cache.get((index, names))
+        if html is None:
+            symbols = []
+            for name in sorted(names):
+                entry = index.entry(name) if index is not None else None
+                if entry is not None:
+                    _, viewbox, d = entry
+                    symbols.append(
+                        f'<symbol id="{SYMBOL_PREFIX}{name}" viewBox="{viewbox}"><path d="{escape(d)}"></path></symbol>'
+                    )
+            html = Safe(
+                f'<svg xmlns="http://www.w3.org/2000/svg" style="display:none" aria-hidden="true">{"".join(symbols)}</svg>'
+                if symbols else ""
+            )
+            if len(self._cache) >= self.max_cached:
+                self._cache.clear()
+            self._cache[index, names] = html
+        return html
+
+    __str__ = __html__
+
+    def __deepcopy__(self, memo):
+        return self
+
+
+class SymbolCollectorMiddleware:
+    """ASGI middleware giving each HTTP request its own symbol collector"""
+
+    def __init__(self, app):
+        self.app = app
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http":
+            return await self.app(scope, receive, send)
+        token = _current.set(set())
+        try:
+            await self.app(scope, receive, send)
+        finally:
+            _current.reset(token)
+
+
+def parse_svg(svg):
+    """(viewBox, path data) of an SVG icon file's contents"""
+    svg = svg.encode() if isinstance(svg, str) else svg
+    viewbox = _VIEWBOX.search(svg)
+    paths = []
+    for tag in _PATH.finditer(svg):
+        attrs = tag.group(1)
+        d = _D.search(attrs)
+        # Material SVGs include an unfilled 24x24 bounding box path
+        if d and b'fill="none"' not in attrs:
+            paths.append(d.group(1).decode())
+    return (viewbox.group(1).decode() if viewbox else "0 0 24 24"), "".join(paths)
+
+
+def write_index(icons, out=DEFAULT_INDEX):
+    """Write an index from {name: svg contents}"""
+    lines = []
+    for name, svg in icons.items():
+        viewbox, d = parse_svg(svg)
+        if d:
+            lines.append(f"{name}\t{viewbox}\t{d}")
+    out = Path(out)
+    out.parent.mkdir(parents=True, exist_ok=True)
+    # Sorted by the UTF-8 bytes the lookup compares
+    out.write_bytes(b"\n".join(sorted(line.encode() for line in lines)))
+    print(f"{out}: {len(lines)} icons")
+    return out
+
+
+def build(directory, out=DEFAULT_INDEX):
+    """
+    Index a directory of SVG icons
+
+    File stems are the index names: ``home.svg`` for a path used by every
+    variant, ``home--rounded.svg`` or ``rounded/home.svg`` for one variant.
+    """
+    directory = Path(directory)
+    icons = {}
+    for path in sorted(directory.rglob("*.svg")):
+        name = path.stem
+        if path.parent != directory and path.parent.name in VARIANTS:
+            name = f"{name}--{path.parent.name}"
+        icons[name] = path.read_bytes()
+    return write_index(icons, out)
+
+
+def fetch(*names, out=DEFAULT_INDEX, styles=("outlined", "rounded", "sharp")):
+    """Download Material Symbols SVGs for the given icons and index them"""
+    icons = {}
+    for name in names:
+        for style in styles:
+            with urllib.request.urlopen(SVG_URL.format(style=style, name=name)) as resp:
+                icons[f"{name}--{style}"] = resp.read()
+    return write_index(icons, out)
+
+
+def main(argv):
+    """Command line: ``build <svg directory> [index]`` or ``fetch <name>... [index.idx]``"""
+    command, args = (argv[0], argv[1:]) if argv else (None, [])
+    if command == "build" and 1 <= len(args) <= 2:
+        return build(*args)
+    if command == "fetch" and args:
+        # Icon names have no dots, so a trailing *.idx argument is the output path
+        if args[-1].endswith(".idx"):
+            return fetch(*args[:-1], out=args[-1])
+        return fetch(*args)
+    raise SystemExit("usage: python -m fastmdui.sprites build <svg directory> [index] | fetch <name>... [index.idx]")
+
+
+if __name__ == "__main__":
+    main(sys.argv[1:])
@@ -0,0 +1,147 @@
+"""
+Server-Sent Events progress
+
+Progress(stream=url) binds the bar to an event stream instead of polling.
+The script added by MDUI.headers(streams=True) opens one EventSource per
+bar and sets its value from each message:
+
+    Progress(stream=f"/jobs/{job.id}/progress", id=f"job-{job.id}")
+
+    @app.get("/jobs/{id}/progress")
+    def job_progress(id: str):
+        return progress_stream(lambda: jobs[id].progress)
+
+progress_stream() sends only the number and coalesces updates: however
+often the job reports progress, each client gets at most one message per
+``interval``, always with the latest value. The stream ends with a "done"
+event once the value reaches ``max`` or the source is exhausted. If the
+source raises, it ends with a "failed" event carrying the last value
+instead, and the exception is re-raised so the server logs it.
+"""
+import asyncio
+import inspect
+
+from starlette.concurrency import iterate_in_threadpool
+from starlette.responses import StreamingResponse
+
+
+DONE = "done"
+# Not "error", which EventSource also fires for connection errors
+FAILED = "failed"
+# Seconds between updates sent to one client
+INTERVAL = 0.25
+# Comment line sent when nothing changed for this long, to keep proxies open
+KEEPALIVE = 15
+
+# Binds [data-mdui-stream] elements to their event stream
+STREAM_JS = """
+function mduiBindStreams(root) {
+  for (const el of root.querySelectorAll("[data-mdui-stream]:not([data-mdui-bound])")) {
+    el.setAttribute("data-mdui-bound", "");
+    const source = new EventSource(el.dataset.mduiStream);
+    const set = (e) => el.isConnected ? el.setAttribute("value", e.data) : source.close();
+    source.onmessage = set;
+    source.addEventListener("done", (e) => { set(e); source.close(); });
+    source.addEventListener("failed", () => { el.setAttribute("data-mdui-failed", ""); source.close(); });
+  }
+}
+document.addEventListener("DOMContentLoaded", () => mduiBindStreams(document));
+document.addEventListener("htmx:load", (e) => mduiBindStreams(e.detail.elt.parentNode || document));
+"""
+
+
+def _message(value, event=None):
+    data = format(float(value), "g")
+    return f"event: {event}\ndata: {data}\n\n" if event else f"data: {data}\n\n"
+
+
+async def _polled(get, interval, max):
+    """Values of a getter, read once per interval"""
+    while True:
+        value = get()
+        if inspect.isawaitable(value):
+            value = await value
+        yield value
+        if value is None or value >= max:
+            return
+        await asyncio.sleep(interval)
+
+
+async def progress_events(source, interval=INTERVAL, max=1, keepalive=KEEPALIVE):
+    """
+    SSE messages for a progress source, at most one per interval
+
+    Args:
+        source: Callable returning the current value (sync or async), or an
+            (async) iterable of values; None ends the stream. If it raises,
+            a "failed" event is sent and the exception re-raised
+        interval: Minimum seconds between messages
+        max: Value at which the stream is done
+        keepalive: Seconds without a change before a keep-alive comment
+    """
+    if callable(source):
+        source = _polled(source, interval, max)
+    elif not hasattr(source, "__aiter__"):
+        # Plain iterators may block between values, so they run in a thread
+        source = iterate_in_threadpool(iter(source))
+
+    latest, changed, finished, error = None, asyncio.Event(), False, None
+
+    async def consume():
+        nonlocal latest, finished, error
+        try:
+            async for value in source:
+                if value is None:
+                    break
+                latest = value
+                changed.set()
+                if value >= max:
+                    break
+        except Exception as e:
+            error = e
+        finally:
+            finished = True
+            changed.set()
+
+    task = asyncio.create_task(consume())
+    sent = None
+    try:
+        while True:
+            try:
+                await asyncio.wait_for(changed.wait(), keepalive)
+            except asyncio.TimeoutError:
+                yield ": keep-alive\n\n"
+                continue
+            changed.clear()
+            if finished:
+                if error is not None:
+                    # Don't report a crashed job as complete
+                    yield _message(latest if latest is not None else 0, FAILED)
+                    raise error
+                yield _message(latest if latest is not None else max, DONE)
+                return
+            if latest != sent:
+                sent = latest
+                yield _message(latest)
+            # Coalesce: whatever arrives meanwhile is sent as one value
+            await asyncio.sleep(interval)
+    finally:
+        task.cancel()
+
+
+def progress_stream(source, interval=INTERVAL, max=1, keepalive=KEEPALIVE):
+    """
+    Event stream response for Progress(stream=...)
+
+    See progress_events() for the arguments.
+
+    Example:
+        @app.get("/jobs/{id}/progress")
+        def job_progress(id: str):
+            return progress_stream(lambda: jobs[id].progress, interval=0.5)
+    """
+    return StreamingResponse(
+        progress_events(source, interval, max, keepalive),
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"},
+    )
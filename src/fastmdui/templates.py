@@ -0,0 +1,272 @@
+"""
+Compiled component templates and cached subtrees
+
+@mdui_template turns a function that composes components into a template:
+the first call with a given shape runs the function once with placeholders
+and keeps the rendered HTML as static strings with holes. Later calls only
+escape the string arguments and join them in:
+
+    @mdui_template
+    def contact(name, email, icon="person"):
+        return ListItem(name, description=email, icon=icon)
+
+    List(*(contact(c.name, c.email) for c in contacts))
+
+Non-empty ``str`` arguments become holes; every other argument (None, bools,
+numbers, "" ...) is part of the shape, so each distinct combination is
+compiled separately. The function may place string arguments anywhere in the
+tree. Functions that branch on a string argument, directly or inside a
+component (Icon's variant, Select's variant...), are detected when compiling:
+an argument missing from the output, or output that changes with the
+placeholder, leaves the shape uncompiled. A comparison with a fixed value
+whose argument is also placed as is can't be detected, so don't write those.
+Uncompiled calls, and calls that can't use a template otherwise (unhashable
+arguments, values that need different attribute quoting, too many shapes),
+fall back to calling the function and return its FT tree.
+
+@cached is for chrome that rarely changes (app bars, navigation): the whole
+subtree is rendered once per distinct arguments and kept in a bounded LRU:
+
+    @cached(maxsize=64)
+    def app_bar(title, active):
+        return TopAppBar(TopAppBarTitle(title), ...)
+
+    app_bar("Inbox", active=req.url.path)
+    app_bar.cache_info()  # CacheInfo(hits=..., misses=..., maxsize=64, currsize=...)
+"""
+import functools
+import inspect
+import re
+import threading
+from collections import OrderedDict, namedtuple
+from html import escape
+
+from fastcore.xml import Safe
+
+from .icons import icon_registry, record_icons
+from .modules import collect_tags, record_tag
+from .render import render
+from .sprites import collect_symbols, record_symbol
+
+
+_HOLE = "\ue000mduihole{}\ue001"
+# Second placeholder set, compiled against to catch branching on the value
+_ALT_HOLE = "\ue000mduihole{}\ue002\ue001"
+_HOLE_RE = re.compile("\ue000mduihole(\\d+)\ue002?\ue001")
+# Left in the output when a placeholder was transformed (escaped, upper-cased,
+# JSON-encoded...) rather than placed as is
+_MARKS = ("\ue000", "mduihole")
+_UNCOMPILABLE = object()
+
+
+class Template:
+    """Static HTML strings interleaved with (argument name, in attribute) holes"""
+
+    __slots__ = ("statics", "holes", "names", "tags", "icons", "symbols")
+
+    def __init__(self, statics, holes, names, tags, icons, symbols=()):
+        self.statics = statics
+        self.holes = holes
+        # Argument name per placeholder index, for icon names
+        self.names = names
+        self.tags = tags
+        self.icons = icons
+        self.symbols = symbols
+
+    @classmethod
+    def compile(cls, fn, sig, arguments):
+        """Run fn with placeholders; returns None if the output can't be templated"""
+        names = [name for name, value in arguments.items() if type(value) is str and value]
+        html, tags, icons, symbols = _capture_holes(fn, sig, arguments, _HOLE)
+        pieces = _HOLE_RE.split(html)
+        statics = pieces[0::2]
+        if any(mark in s for s in statics for mark in _MARKS):
+            return None
+        # An argument that didn't reach the output was branched on or dropped
+        if set(pieces[1::2]) != {str(i) for i in range(len(names))}:
+            return None
+        # Output depending on the value (e.g. a comparison taking the other branch)
+        if names and _HOLE_RE.split(_capture_holes(fn, sig, arguments, _ALT_HOLE)[0]) != pieces:
+            return None
+        holes, before = [], statics[0]
+        for index, static in zip(pieces[1::2], statics[1:]):
+            # Inside a start tag, i.e. within an attribute value
+            holes.append((names[int(index)], before.rfind("<") > before.rfind(">")))
+            before += static
+        return cls(tuple(statics), tuple(holes), tuple(names), tags, icons, symbols)
+
+    def fill(self, arguments):
+        """Render with the given argument values; None if a value needs the FT path"""
+        statics = self.statics
+        out = [statics[0]]
+        for (name, in_attr), static in zip(self.holes, statics[1:]):
+            value = arguments[name]
+            if in_attr:
+                # to_xml switches quote characters for these; leave them to it
+                if '"' in value or "'" in value:
+                    return None
+                if "&" in value or "<" in value or ">" in value:
+                    value = escape(value, quote=False)
+            else:
+                value = escape(value, quote=False)
+            out.append(value)
+            out.append(static)
+        for tag in self.tags:
+            record_tag(tag)
+        for name, variant in self.icons:
+            if _MARKS[0] in name:
+                name = _HOLE_RE.sub(lambda m: arguments[self.names[int(m.group(1))]], name)
+            icon_registry.add(name, variant)
+        for name in self.symbols:
+            record_symbol(name)
+        return Safe("".join(out))
+
+
+def _capture_holes(fn, sig, arguments, hole):
+    """_capture() with non-empty string arguments replaced by numbered placeholders"""
+    call, index = {}, 0
+    for name, value in arguments.items():
+        if type(value) is str and value:
+            call[name] = hole.format(index)
+            index += 1
+        else:
+            call[name] = value
+    bound = inspect.BoundArguments(sig, call)
+    return _capture(fn, *bound.args, **bound.kwargs)
+
+
+def _capture(fn, *args, **kwargs):
+    """Render fn(...) and return (html, mdui-* tags, icon registrations, sprite symbols) it produced"""
+    with collect_tags() as tags, record_icons() as icons, collect_symbols() as symbols:
+        html = render(fn(*args, **kwargs), indent=False)
+    return html, tuple(tags), tuple(icons), tuple(sorted(symbols))
+
+
+def _replay(tags, icons, symbols):
+    """Record the tags, icons and sprite symbols of reused HTML for the current response"""
+    for tag in tags:
+        record_tag(tag)
+    for name, variant in icons:
+        icon_registry.add(name, variant)
+    for name in symbols:
+        record_symbol(name)
+
+
+def mdui_template(fn=None, *, max_variants=32):
+    """
+    Compile a component-composing function into string templates
+
+    Args:
+        fn: Function returning a component tree
+        max_variants: Most argument shapes compiled per function; further
+            shapes are rendered through the normal FT path
+
+    Examples:
+        @mdui_template
+        def save_button(label):
+            return Button(label, icon="save")
+
+        save_button("Save")  # rendered HTML, joined from the compiled template
+    """
+    if fn is None:
+        return functools.partial(mdui_template, max_variants=max_variants)
+
+    sig = inspect.signature(fn)
+    templates = {}
+
+    @functools.wraps(fn)
+    def wrapper(*args, **kwargs):
+        bound = sig.bind(*args, **kwargs)
+        bound.apply_defaults()
+        arguments = bound.arguments
+        try:
+            key = tuple(
+                (name, str) if type(value) is str and value else (name, type(value), value)
+                for name, value in arguments.items()
+            )
+            template = templates.get(key)
+        except TypeError:
+            return fn(*args, **kwargs)
+
+        if template is None:
+            if len(templates) >= max_variants:
+                return fn(*args, **kwargs)
+            template = Template.compile(fn, sig, arguments) or _UNCOMPILABLE
+            templates[key] = template
+        if template is not _UNCOMPILABLE:
+            html = template.fill(arguments)
+            if html is not None:
+                return html
+        return fn(*args, **kwargs)
+
+    wrapper.templates = templates
+    return wrapper
+
+
+CacheInfo = namedtuple("CacheInfo", ["hits", "misses", "maxsize", "currsize"])
+
+
+def cached(fn=None, *, maxsize=128):
+    """
+    Render a component-building function once per distinct arguments
+
+    The rendered HTML is kept in an LRU of at most ``maxsize`` entries and
+    returned as is on later calls, without building FT nodes. Include
+    everything the subtree depends on (e.g. the active route) in the
+    arguments. Calls with unhashable arguments aren't cached.
+
+    Args:
+        fn: Function returning a component tree
+        maxsize: Most distinct argument sets kept
+
+    Examples:
+        @cached
+        def nav(active):
+            return NavigationRail(*(NavigationRailItem(i, t, value=t) for t, i in ITEMS), value=active)
+
+        nav(req.url.path)
+        nav.cache_info()
+        nav.cache_clear()
+    """
+    if fn is None:
+        return functools.partial(cached, maxsize=maxsize)
+
+    entries = OrderedDict()
+    lock = threading.Lock()
+    stats = [0, 0]  # hits, misses
+
+    @functools.wraps(fn)
+    def wrapper(*args, **kwargs):
+        try:
+            key = (args, tuple(sorted(kwargs.items())))
+            hash(key)
+        except TypeError:
+            return fn(*args, **kwargs)
+        with lock:
+            entry = entries.get(key)
+            if entry is not None:
+                entries.move_to_end(key)
+                stats[0] += 1
+        if entry is None:
+            entry = _capture(fn, *args, **kwargs)
+            with lock:
+                stats[1] += 1
+                entries[key] = entry
+                if len(entries) > maxsize:
+                    entries.popitem(last=False)
+        html, tags, icons, symbols = entry
+        _replay(tags, icons, symbols)
+        return html
+
+    def cache_info():
+        with lock:
+            return CacheInfo(stats[0], stats[1], maxsize, len(entries))
+
+    def cache_clear():
+        with lock:
+            entries.clear()
+            stats[0] = stats[1] = 0
+
+    wrapper.cache_info = cache_info
+    wrapper.cache_clear = cache_clear
+    return wrapper
@@ -0,0 +1,229 @@
+"""
+Virtualized lists
+
+VirtualList server-renders only the first window of a large data source. An
+htmx sentinel at the end of each window loads the next one from a cursor when
+it scrolls into view:
+
+    app = FastHTML(hdrs=MDUI.headers())
+    MDUI.mount_virtual_lists(app)
+
+    @app.get("/contacts")
+    def contacts():
+        return VirtualList(db.iter_contacts(), lambda c: ListItem(c.name), window=50)
+
+Sources are kept in a bounded registry: sequences are sliced by position,
+iterators are advanced as windows are requested, and paging callbacks
+``fetch(cursor, limit) -> (items, next_cursor)`` are called with the opaque
+cursor string they returned for the previous window.
+
+An evicted source can't continue: its sentinel is replaced by an item that
+reloads the page. A malformed cursor for a sequence or iterator source gets
+a 400 response.
+"""
+import secrets
+import threading
+from collections import OrderedDict
+from collections.abc import Sequence
+from itertools import islice
+from urllib.parse import quote
+
+from fasthtml.common import FT
+from starlette.responses import Response
+
+from .components import Div, List, ListItem
+from .render import Rendered
+
+
+ROUTE = "/_mdui_list"
+# Unnamed sources kept before the least recently used is dropped
+MAX_SOURCES = 1024
+# Shown in place of the sentinel when the list's source was evicted
+EXPIRED = "This list has expired"
+EXPIRED_HINT = "Reload the page to see more"
+
+# Removes items far above the viewport, keeping the scroll position
+RECYCLE_JS = (
+    "const n=this.querySelectorAll(':scope>mdui-list-item'),x=n.length-+this.dataset.recycle;"
+    "let h=0;for(let i=0;i<x;i++){h+=n[i].offsetHeight;n[i].remove()}if(h)scrollBy(0,-h)"
+)
+
+
+class InvalidCursor(ValueError):
+    """Cursor not produced by a sequence or iterator source"""
+
+
+def _position(cursor):
+    if not cursor:
+        return 0
+    try:
+        position = int(cursor)
+    except ValueError:
+        raise InvalidCursor(f"Invalid cursor {cursor!r}") from None
+    if position < 0:
+        raise InvalidCursor(f"Invalid cursor {cursor!r}")
+    return position
+
+
+class _SequenceSource:
+    def __init__(self, items):
+        self.items = items
+
+    def page(self, cursor, limit):
+        start = _position(cursor)
+        end = start + limit
+        return self.items[start:end], (str(end) if end < len(self.items) else None)
+
+
+class _IteratorSource:
+    def __init__(self, items):
+        self.items = iter(items)
+        self.position = 0
+        self.last = None
+        self.lock = threading.Lock()
+
+    def page(self, cursor, limit):
+        cursor = _position(cursor)
+        with self.lock:
+            # htmx may repeat a request; the iterator can't go back, so replay
+            if self.last and self.last[0] == cursor:
+                return self.last[1]
+            if cursor != self.position:
+                return [], None
+            items = list(islice(self.items, limit))
+            self.position += len(items)
+            result = items, (str(self.position) if len(items) == limit else None)
+            self.last = cursor, result
+            return result
+
+
+class _PagedSource:
+    def __init__(self, fetch):
+        self.fetch = fetch
+
+    def page(self, cursor, limit):
+        return self.fetch(cursor, limit)
+
+
+class VirtualListRegistry:
+    """Sources and item renderers of the VirtualLists served by the window route"""
+
+    def __init__(self, max_sources=MAX_SOURCES):
+        self.max_sources = max_sources
+        self._lock = threading.Lock()
+        self._sources = OrderedDict()
+        # Named paging callbacks are stateless and never evicted
+        self._named = {}
+
+    def add(self, source, render_item, window, name=None):
+        entry = (source, render_item, window)
+        with self._lock:
+            if name is not None:
+                self._named[name] = entry
+                return name
+            key = secrets.token_urlsafe(8)
+            self._sources[key] = entry
+            if len(self._sources) > self.max_sources:
+                self._sources.popitem(last=False)
+            return key
+
+    def get(self, key):
+        with self._lock:
+            if key in self._named:
+                return self._named[key]
+            entry = self._sources.get(key)
+            if entry is not None:
+                self._sources.move_to_end(key)
+            return entry
+
+    def __len__(self):
+        return len(self._sources) + len(self._named)
+
+
+virtual_lists = VirtualListRegistry()
+
+
+def _default_item(item):
+    if isinstance(item, FT):
+        return item
+    if isinstance(item, dict):
+        return ListItem(**item)
+    return ListItem(str(item))
+
+
+def _window(key, entry, cursor):
+    """Rendered items of one window plus the sentinel loading the next"""
+    source, render_item, window = entry
+    items, next_cursor = source.page(cursor, window)
+    parts = [render_item(item) for item in items]
+    if next_cursor is not None:
+        parts.append(Div(
+            hx_get=f"{ROUTE}/{key}?cursor={quote(str(next_cursor), safe='')}",
+            hx_trigger="revealed",
+            hx_swap="outerHTML",
+            cls="mdui-virtual-list-more",
+        ))
+    return parts
+
+
+def _expired():
+    """Item replacing the sentinel of an evicted list"""
+    return ListItem(EXPIRED, description=EXPIRED_HINT, icon="refresh", onclick="location.reload()",
+                    cls="mdui-virtual-list-expired")
+
+
+def VirtualList(source=None, render_item=None, window=50, fetch=None, name=None, recycle=None, **kwargs):
+    """
+    MDUI List that renders the first window and loads the rest on scroll
+
+    Requires MDUI.mount_virtual_lists(app).
+
+    Args:
+        source: Any iterable; sequences are sliced, iterators are consumed
+            one window at a time
+        render_item: Item -> component; defaults to ListItem for strings and
+            dicts of ListItem arguments, FT items are used as is
+        window: Items per server-rendered window
+        fetch: Paging callback ``fetch(cursor, limit) -> (items, next_cursor)``
+            used instead of ``source``; cursor is None for the first window and
+            next_cursor None after the last
+        name: Register a ``fetch`` callback under a fixed name, so it survives
+            registry eviction and is shared by every page that renders it
+        recycle: Keep at most this many items in the DOM, removing those
+            scrolled far above the viewport
+
+    Examples:
+        VirtualList(range(50_000), lambda i: ListItem(f"Row {i}"))
+        VirtualList(fetch=search_orders, name="orders", window=100)
+    """
+    if fetch is not None:
+        src = _PagedSource(fetch)
+    elif isinstance(source, Sequence) and not isinstance(source, str):
+        src = _SequenceSource(source)
+    elif source is not None:
+        src = _IteratorSource(source)
+    else:
+        raise ValueError("VirtualList needs a source or a fetch callback")
+
+    entry = (src, render_item or _default_item, window)
+    key = virtual_lists.add(*entry, name=name if fetch is not None else None)
+    if recycle:
+        kwargs.setdefault("data_recycle", recycle)
+        kwargs.setdefault("hx_on__after_settle", RECYCLE_JS)
+    return List(*_window(key, entry, None), **kwargs)
+
+
+def mount(app, registry=virtual_lists):
+    """Register the route serving VirtualList windows"""
+
+    @app.route(f"{ROUTE}/{{key}}", methods=["get"], include_in_schema=False)
+    def mdui_virtual_list(key: str, cursor: str = None):
+        entry = registry.get(key)
+        if entry is None:
+            return Rendered(_expired())
+        try:
+            return Rendered(*_window(key, entry, cursor))
+        except InvalidCursor as e:
+            return Response(str(e), status_code=400)
+
+    return app
@@ -0,0 +1,163 @@
+"""
+Tests for the self-hosted, content-hashed asset mode
+Everything runs against a temporary asset folder, so no network is needed
+"""
+
+import pytest
+from fasthtml.common import FastHTML, to_xml
+from starlette.testclient import TestClient
+
+from fastmdui import MDUI, MDUIAssets
+from fastmdui.assets import compress
+
+
+@pytest.fixture
+def asset_dir(tmp_path):
+    """A minimal vendored asset folder"""
+    (tmp_path / "fonts").mkdir()
+    (tmp_path / "fonts" / "icons.woff2").write_bytes(b"wOF2-fake-font")
+    (tmp_path / "mdui.css").write_text("mdui-button{color:red}")
+    (tmp_path / "mdui.global.js").write_text("console.log('mdui')")
+    (tmp_path / "open-sans.css").write_text("body{}")
+    (tmp_path / "material-icons.css").write_text(
+        "@font-face{font-family:'Material Icons';src:url(fonts/icons.woff2) format('woff2')}"
+    )
+    return tmp_path
+
+
+@pytest.fixture
+def local_assets(asset_dir):
+    """Install a temporary asset set as the shared MDUI one"""
+    previous = MDUI._assets
+    MDUI._assets = MDUIAssets(asset_dir)
+    yield MDUI._assets
+    MDUI._assets = previous
+
+
+class TestMDUIAssets:
+    """Test asset scanning and hashed URLs"""
+
+    def test_hashed_urls(self, asset_dir):
+        """URLs carry a content hash and the prefix"""
+        assets = MDUIAssets(asset_dir)
+        url = assets.url("mdui.global.js")
+        assert url.startswith("/_mdui/mdui.global.")
+        assert url.endswith(".js")
+
+    def test_hash_follows_content(self, asset_dir):
+        """Changing a file changes its URL"""
+        before = MDUIAssets(asset_dir).url("mdui.css")
+        (asset_dir / "mdui.css").write_text("mdui-button{color:blue}")
+        assert MDUIAssets(asset_dir).url("mdui.css") != before
+
+    def test_stylesheet_font_urls_are_rewritten(self, asset_dir):
+        """Font references inside stylesheets point at hashed URLs"""
+        assets = MDUIAssets(asset_dir)
+        css = assets.get("material-icons.css").data.decode()
+        assert assets.url("fonts/icons.woff2") in css
+
+    def test_missing_asset(self, tmp_path):
+        """Unknown assets raise a helpful error"""
+        with pytest.raises(LookupError, match="python -m fastmdui.assets"):
+            MDUIAssets(tmp_path).url("mdui.css")
+
+    def test_use_assets(self, asset_dir):
+        """assets="local" works once a directory of vendored files is set"""
+        previous = MDUI._assets
+        try:
+            MDUI.use_assets(asset_dir / "empty")
+            with pytest.raises(LookupError, match="fetch"):
+                MDUI.build_headers(assets="local")
+            MDUI.use_assets(asset_dir)
+            assert MDUI.local_assets().directory == asset_dir
+            assert any("/_mdui/mdui.global." in str(h) for h in MDUI.build_headers(assets="local", icons="filled"))
+        finally:
+            MDUI._assets = previous
+
+
+class TestAssetRoute:
+    """Test serving assets through a FastHTML app"""
+
+    def test_serves_with_immutable_cache(self, local_assets):
+        """Hashed URLs are served with an immutable cache policy"""
+        app = MDUI.mount_assets(FastHTML(secret_key="test"))
+        client = TestClient(app)
+        resp = client.get(MDUI.asset_url("CDN_JS", "local"))
+        assert resp.status_code == 200
+        assert resp.text == "console.log('mdui')"
+        assert "immutable" in resp.headers["cache-control"]
+
+    def test_unknown_file_is_404(self, local_assets):
+        """Only known hashed names are served"""
+        client = TestClient(MDUI.mount_assets(FastHTML(secret_key="test")))
+        assert client.get("/_mdui/mdui.css").status_code == 404
+
+    def test_headers_use_local_urls(self, local_assets):
+        """headers(assets='local') never points at a CDN"""
+        html = to_xml(tuple(MDUI.headers(assets="local", icons="filled")))
+        assert "unpkg.com" not in html
+        assert "googleapis.com" not in html
+        assert local_assets.url("mdui.css") in html
+
+    def test_invalid_mode(self):
+        """Unknown asset modes are rejected"""
+        with pytest.raises(ValueError):
+            MDUI.headers(assets="s3")
+
+
+class TestPrecompressedAssets:
+    """Test precompressed variants, content negotiation and 304s"""
+
+    @pytest.fixture
+    def compressed(self, asset_dir):
+        (asset_dir / "mdui.global.js").write_text("customElements.define('mdui-x', X);\n" * 200)
+        compress(asset_dir)
+        return asset_dir
+
+    def test_compress_writes_gzip_variants(self, capsys, compressed):
+        """The build step stores variants and reports the savings"""
+        assert (compressed / "mdui.global.js.gz").is_file()
+        # Already-compressed fonts gain nothing and get no variant
+        assert not (compressed / "fonts" / "icons.woff2.gz").exists()
+        assert "mdui.global.js" in capsys.readouterr().out
+
+    def test_report(self, compressed):
+        """The report lists original and compressed sizes"""
+        row = next(r for r in MDUIAssets(compressed).report() if r["name"] == "mdui.global.js")
+        assert row["gzip"] < row["size"]
+
+    def test_negotiates_encoding(self, compressed):
+        """gzip is served to clients that accept it"""
+        assets = MDUIAssets(compressed)
+        client = TestClient(assets.mount(FastHTML(secret_key="test")))
+        url = assets.url("mdui.global.js")
+
+        resp = client.get(url, headers={"Accept-Encoding": "gzip"})
+        assert resp.headers["content-encoding"] == "gzip"
+        assert resp.headers["vary"] == "Accept-Encoding"
+        assert resp.text.startswith("customElements.define")
+
+        resp = client.get(url, headers={"Accept-Encoding": "identity"})
+        assert "content-encoding" not in resp.headers
+
+        resp = client.get(url, headers={"Accept-Encoding": "gzip;q=0"})
+        assert "content-encoding" not in resp.headers
+
+    def test_in_memory_assets_are_compressed(self, asset_dir):
+        """Rewritten stylesheets get their variants in memory"""
+        (asset_dir / "mdui.css").write_text("mdui-button{color:red}\n" * 100)
+        assets = MDUIAssets(asset_dir)
+        resp = assets.response(assets.url("mdui.css").rsplit("/", 1)[1], {"accept-encoding": "gzip, br"})
+        assert resp.headers["content-encoding"] in ("gzip", "br")
+
+    def test_conditional_request(self, compressed):
+        """A matching If-None-Match answers 304 without a body"""
+        assets = MDUIAssets(compressed)
+        client = TestClient(assets.mount(FastHTML(secret_key="test")))
+        url = assets.url("mdui.global.js")
+        etag = client.get(url, headers={"Accept-Encoding": "gzip"}).headers["etag"]
+
+        resp = client.get(url, headers={"Accept-Encoding": "gzip", "If-None-Match": etag})
+        assert resp.status_code == 304
+        assert resp.content == b""
+        assert client.get(url, headers={"If-None-Match": '"other"'}).status_code == 200
@@ -0,0 +1,67 @@
+"""
+Tests for batched form-control changes
+"""
+
+import json
+
+import pytest
+from fasthtml.common import FastHTML, to_xml
+from starlette.testclient import TestClient
+
+from fastmdui import MDUI, ChangeBatch, Slider, Switch, decode_changes
+from fastmdui.batch import FIELD, MAX_CHANGES
+
+
+class TestChangeBatch:
+    """Test the batching container and its script"""
+
+    def test_container(self):
+        html = to_xml(ChangeBatch(Switch(name="wifi"), action="/settings", idle=500, id="prefs"))
+        assert html.startswith('<div data-mdui-batch="/settings" data-mdui-batch-idle="500" id="prefs">')
+        assert '<mdui-switch name="wifi"></mdui-switch>' in html
+
+    def test_script(self):
+        """headers(batch=True) adds the collecting script"""
+        assert "data-mdui-batch" not in to_xml(MDUI.headers())
+        assert "sendBeacon" in to_xml(MDUI.headers(batch=True))
+        assert "/mdui-batch." in to_xml(MDUI.build_headers(batch=True, inline="external"))
+
+
+class TestDecodeChanges:
+    """Test decoding posted batches"""
+
+    def test_kinds(self):
+        changes = json.dumps([
+            ["wifi", "bool", True], ["digest", "bool", False], ["volume", "number", "40"],
+            ["ratio", "number", "0.5"], ["theme", "text", "dark"],
+        ])
+        assert decode_changes(changes) == {"wifi": True, "digest": False, "volume": 40, "ratio": 0.5, "theme": "dark"}
+
+    def test_form(self):
+        assert decode_changes({FIELD: '[["wifi", "bool", "true"]]'}) == {"wifi": True}
+        assert decode_changes({}) == {}
+
+    @pytest.mark.parametrize("data", [
+        "not json", '{"wifi": true}', '[["wifi", "bool"]]', '[[1, "text", "x"]]',
+        '[["wifi", "color", "red"]]', '[["volume", "number", "loud"]]',
+        json.dumps([["x", "bool", True]] * (MAX_CHANGES + 1)),
+    ])
+    def test_malformed(self, data):
+        with pytest.raises(ValueError):
+            decode_changes(data)
+
+    def test_endpoint(self):
+        app = FastHTML(secret_key="test")
+        saved = {}
+
+        @app.post("/settings")
+        def save(mdui_changes: str):
+            saved.update(decode_changes(mdui_changes))
+            return Slider(saved["volume"], name="volume", id="volume").oob()
+
+        resp = TestClient(app).post(
+            "/settings", data={FIELD: '[["volume", "number", 70], ["wifi", "bool", true]]'},
+            headers={"HX-Request": "1"},
+        )
+        assert saved == {"volume": 70, "wifi": True}
+        assert 'hx-swap-oob="true"' in resp.text
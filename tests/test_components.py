@@ -5,7 +5,7 @@ This ensures every component can be instantiated and has correct attributes
 """
 
 import pytest
-from fasthtml.common import Div
+from fasthtml.common import Div, Script
 from fastmdui import (
     # Core
     MDUI,
@@ -623,6 +623,30 @@ class TestMDUICore:
             headers = MDUI.headers(font=font)
             assert len(headers) > 0
     
+    def test_headers_are_cached(self):
+        """Test that identical arguments share the cached head"""
+        assert MDUI.headers(theme="dark").html is MDUI.headers(theme="dark").html
+        assert MDUI.headers(theme="dark").html is not MDUI.headers(theme="light").html
+
+    def test_headers_bundle_is_a_list(self):
+        """Test that callers can extend the bundle without touching the cache"""
+        from copy import deepcopy
+        headers = MDUI.headers()
+        assert isinstance(headers, list)
+        headers.append(Script("extra()"))
+        assert len(MDUI.headers()) == len(headers) - 1
+        assert isinstance(MDUI.headers() + [Script("more()")], list)
+        copied = deepcopy(headers)
+        assert copied == headers and copied is not headers
+        assert copied.html is headers.html
+
+    def test_headers_html(self):
+        """Test the pre-rendered header HTML"""
+        html = MDUI.headers_html(icons="filled")
+        assert MDUI.CDN_JS in html
+        assert MDUI.MATERIAL_ICONS_CSS in html
+        assert html == MDUI.headers(icons="filled").html
+
     def test_theme_script_generation(self):
         """Test theme script generation"""
         script = MDUI.theme_script()
@@ -0,0 +1,150 @@
+"""
+Tests for tree-diff re-rendering
+"""
+
+import json
+
+import pytest
+from fasthtml.common import Div, FastHTML, HttpHeader, Span, to_xml
+from starlette.testclient import TestClient
+
+from fastmdui import Badge, List, ListItem, Progress
+from fastmdui.diff import SESSION_KEY, ViewStore, diff, snapshot
+from fastmdui.patches import EVENT, HEADER, Patch
+
+
+def _cart(items, total="3"):
+    return Div(
+        List(*(ListItem(name, description=f"{qty} pcs", id=f"item-{name}") for name, qty in items), id="items"),
+        Badge(total, id="total"),
+        id="cart",
+    )
+
+
+def _swapped(updates):
+    return [u.get("id") or u.get("data-key") for u in updates if not isinstance(u, HttpHeader)]
+
+
+def _patch(updates):
+    patches = [u for u in updates if isinstance(u, Patch)]
+    return patches[0].patches if patches else {}
+
+
+class TestDiff:
+    """Test comparing a tree with the previous snapshot"""
+
+    def test_unchanged(self):
+        """Re-rendering the same tree sends nothing"""
+        _, entries = diff(None, _cart([("a", 1), ("b", 2)]))
+        updates, _ = diff(entries, _cart([("a", 1), ("b", 2)]))
+        assert updates == ()
+
+    def test_no_snapshot(self):
+        """Without a snapshot the root is swapped whole"""
+        updates, entries = diff(None, _cart([("a", 1)]))
+        assert _swapped(updates) == ["cart"]
+        assert to_xml(updates[0]).startswith('<div id="cart" hx-swap-oob="true">')
+        assert list(entries) == ["cart", "items", "item-a", "total"]
+
+    def test_changed_content(self):
+        """Only the innermost keyed node whose content changed is swapped"""
+        _, entries = diff(None, _cart([("a", 1), ("b", 2)]))
+        updates, _ = diff(entries, _cart([("a", 1), ("b", 2)], total=Span("4")))
+        assert _swapped(updates) == ["total"]
+        assert _patch(updates) == {}
+        # description is an attribute of the list item, so it is patched
+        updates, _ = diff(entries, _cart([("a", 1), ("b", 5)]))
+        assert _patch(updates) == {"item-b": {"description": "5 pcs"}}
+
+    def test_changed_structure(self):
+        """An added child swaps its parent, which covers its descendants"""
+        _, entries = diff(None, _cart([("a", 1)]))
+        updates, _ = diff(entries, _cart([("a", 2), ("b", 2)], total="4"))
+        assert _swapped(updates) == ["items", "total"]
+
+    def test_attribute_patch(self):
+        """Nodes whose attributes alone changed are patched, not swapped"""
+        tree = lambda value, hidden: Div(Progress(value, id="upload"), Badge("1", id="count", hidden=hidden), id="status")
+        _, entries = diff(None, tree(0.2, False))
+        updates, _ = diff(entries, tree(0.6, True))
+        assert _swapped(updates) == []
+        assert _patch(updates) == {"upload": {"value": "0.6"}, "count": {"hidden": True}}
+        updates, _ = diff(diff(None, tree(0.6, True))[1], tree(0.6, False))
+        assert _patch(updates) == {"count": {"hidden": None}}
+
+    def test_data_key(self):
+        """data-key nodes are swapped by selector, since they can't be patched"""
+        tree = lambda cls: Div(Span("x", data_key="row-1", cls=cls), id="rows")
+        _, entries = diff(None, tree("a"))
+        updates, _ = diff(entries, tree("b"))
+        assert updates[0].get("hx-swap-oob") == 'outerHTML:[data-key="row-1"]'
+
+    def test_generator_children(self):
+        """Generator children are materialized and still render in the swap"""
+        updates, _ = diff(None, List((ListItem(n) for n in "ab"), id="items"))
+        assert to_xml(updates[0]).count("<mdui-list-item ") == 2
+
+    def test_root_needs_key(self):
+        with pytest.raises(ValueError):
+            diff(None, List(ListItem("a", id="a")))
+
+    def test_snapshot_is_hashes(self):
+        """Snapshots hold hashes, not the nodes or their text"""
+        entries = snapshot(_cart([("secret", 1)])).entries
+        assert "secret" not in repr(entries["items"])
+
+
+class TestViewStore:
+    """Test per-session view snapshots"""
+
+    def test_render_then_update(self):
+        store = ViewStore()
+        session = {}
+        store.render(session, "cart", _cart([("a", 1)]))
+        assert SESSION_KEY in session
+        updates = store.update(session, "cart", _cart([("a", 1)], total="9"))
+        assert _swapped(updates) == ["total"]
+        # The update became the new snapshot
+        assert _swapped(store.update(session, "cart", _cart([("a", 1)], total="9"))) == []
+
+    def test_sessions_separate(self):
+        store = ViewStore()
+        first, second = {}, {}
+        store.render(first, "cart", _cart([("a", 1)]))
+        assert _swapped(store.update(second, "cart", _cart([("a", 1)]))) == ["cart"]
+
+    def test_bounded(self):
+        """Old views are evicted, and oversized ones aren't stored"""
+        store = ViewStore(max_views=2, max_nodes=3)
+        for name in "abc":
+            store.render({SESSION_KEY: "s"}, name, Div(id=name))
+        assert len(store) == 2
+        store.render({SESSION_KEY: "s"}, "big", _cart([("a", 1), ("b", 2)]))
+        assert len(store) == 2
+        assert _swapped(store.update({SESSION_KEY: "s"}, "a", Div(id="a"))) == ["a"]
+
+    def test_app(self):
+        """Updates arrive as out-of-band swaps plus one patch header"""
+        app = FastHTML(secret_key="test")
+        store = ViewStore()
+        state = {"value": 0.1, "count": "1"}
+
+        def view():
+            return Div(Progress(state["value"], id="p"), Badge(state["count"], id="n"), id="view")
+
+        @app.get("/")
+        def page(session):
+            return store.render(session, "view", view())
+
+        @app.post("/step")
+        def step(session):
+            state["value"], state["count"] = 0.5, "2"
+            return store.update(session, "view", view())
+
+        client = TestClient(app)
+        client.get("/")
+        resp = client.post("/step", headers={"HX-Request": "1"})
+        assert 'id="n" hx-swap-oob="true"' in resp.text
+        assert "mdui-linear-progress" not in resp.text
+        assert json.loads(resp.headers[HEADER])[EVENT]["patches"] == {"p": {"value": "0.5"}}
+        assert resp.headers["HX-Reswap"] == "none"
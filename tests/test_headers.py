@@ -0,0 +1,134 @@
+"""
+Tests for the loading strategy of MDUI.headers()
+Checks the loading attributes of every stylesheet/script in the generated head
+"""
+
+import base64
+import hashlib
+import itertools
+import re
+
+import pytest
+from fasthtml.common import FastHTML
+from starlette.testclient import TestClient
+
+from fastmdui import MDUI
+from fastmdui.icons import icon_registry
+
+
+ICONS = ["all", "outlined", "rounded", "sharp", "filled", "auto", None]
+FONTS = ["open-sans", "roboto", None]
+COMBINATIONS = list(itertools.product(ICONS, FONTS, [False, True]))
+
+
+def _tags(html, tag):
+    return re.findall(rf"<{tag}\b[^>]*>", html)
+
+
+@pytest.fixture
+def used_icons():
+    """Register a few icons for the head, restoring the global registry afterwards"""
+    saved = icon_registry.used()
+    icon_registry.update("home", "search--outlined")
+    yield
+    icon_registry.clear()
+    for variant, names in saved.items():
+        icon_registry.update(*names, variant=variant)
+
+
+def _head(**kwargs):
+    return str(MDUI.headers(**kwargs).html)
+
+
+@pytest.mark.parametrize("icons,font,tachyons", COMBINATIONS)
+def test_async_loading(icons, font, tachyons, used_icons):
+    """Only mdui.css blocks render; everything else is hinted or deferred"""
+    html = _head(icons=icons, font=font, tachyons=tachyons, loading="async")
+    stylesheets = [t for t in _tags(html, "link") if 'rel="stylesheet"' in t]
+
+    blocking = [t for t in stylesheets if 'media="print"' not in t]
+    assert blocking == [f'<link rel="stylesheet" href="{MDUI.CDN_CSS}">']
+    for tag in stylesheets:
+        if tag not in blocking:
+            assert "onload=\"this.media='all'\"" in tag
+
+    assert f'<script src="{MDUI.CDN_JS}" defer>' in html
+    assert f'<link rel="preload" href="{MDUI.CDN_JS}" as="script">' in html
+    assert '<link rel="preconnect" href="https://unpkg.com">' in html
+
+    uses_google_fonts = font == "open-sans" or icons is not None
+    assert ('href="https://fonts.googleapis.com"' in html) == uses_google_fonts
+    assert ('<link rel="preconnect" href="https://fonts.gstatic.com" crossorigin>' in html) == uses_google_fonts
+    if font == "open-sans":
+        assert "display=swap" in html
+    assert ("tachyons" in html) == tachyons
+
+
+@pytest.mark.parametrize("icons,font,tachyons", COMBINATIONS)
+def test_blocking_loading_unchanged(icons, font, tachyons, used_icons):
+    """The default strategy emits plain tags without hints"""
+    html = _head(icons=icons, font=font, tachyons=tachyons)
+    assert 'rel="preconnect"' not in html
+    assert 'rel="preload"' not in html
+    assert "media=" not in html
+    assert f'<script src="{MDUI.CDN_JS}"></script>' in html
+
+
+def test_invalid_loading():
+    """Unknown strategies are rejected"""
+    with pytest.raises(ValueError):
+        MDUI.headers(loading="lazy")
+
+
+class TestInlineAssets:
+    """Test minified inline blocks, CSP hashes and the external mode"""
+
+    def test_inline_blocks_are_minified(self):
+        """No indentation or comments are shipped"""
+        html = str(MDUI.headers(primary_light_color="1, 2, 3").html)
+        assert "\n        " not in html
+        assert "// Save preference" not in html
+        assert ".mdui-theme-dark #theme-icon-light{display:none}" in html
+
+    def test_csp_hashes_match_rendered_blocks(self):
+        """The precomputed hashes cover the exact inline content"""
+        headers = MDUI.headers(theme="dark")
+        html = str(headers.html)
+        for tag, directive in (("script", "script-src"), ("style", "style-src")):
+            blocks = re.findall(rf"<{tag}>(.*?)</{tag}>", html, re.S)
+            expected = [
+                "'sha256-" + base64.b64encode(hashlib.sha256(b.encode()).digest()).decode() + "'"
+                for b in blocks
+            ]
+            assert headers.csp_hashes[directive] == expected
+
+    def test_external_mode(self):
+        """External mode serves the blocks as cacheable files"""
+        headers = MDUI.headers(inline="external")
+        html = str(headers.html)
+        assert "<style>" not in html
+        assert "<script>" not in html
+        assert headers.csp_hashes == {"script-src": [], "style-src": []}
+
+        client = TestClient(MDUI.mount_assets(FastHTML(secret_key="test")))
+        css_url = re.search(r'href="(/_mdui/mdui-head\.[0-9a-f]+\.css)"', html).group(1)
+        js_url = re.search(r'src="(/_mdui/mdui-theme-init\.[0-9a-f]+\.js)"', html).group(1)
+        assert "color-scheme:auto" in client.get(css_url).text
+        assert "initTheme()" in client.get(js_url).text
+
+    def test_external_mode_after_asset_swap(self, tmp_path):
+        """Swapping the asset set rebuilds external headers and keeps their files"""
+        from fastmdui import MDUIAssets
+
+        previous = MDUI._assets
+        try:
+            html = str(MDUI.headers(inline="external").html)
+            css_url = re.search(r'href="(/_mdui/mdui-head\.[0-9a-f]+\.css)"', html).group(1)
+            custom = MDUIAssets(tmp_path)
+            client = TestClient(MDUI.mount_assets(FastHTML(secret_key="test"), assets=custom))
+            assert client.get(css_url).status_code == 200
+            headers = MDUI.headers(inline="external")
+            assert MDUI.local_assets() is custom
+            assert client.get(re.search(r'href="(/_mdui/mdui-head\.[0-9a-f]+\.css)"', str(headers.html)).group(1)).status_code == 200
+        finally:
+            MDUI._assets = previous
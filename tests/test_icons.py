@@ -0,0 +1,93 @@
+"""
+Tests for the icon usage registry and headers(icons="auto")
+"""
+
+import pytest
+from fasthtml.common import to_xml
+
+from fastmdui import (
+    MDUI, Button, ButtonIcon, Chip, Fab, Icon, ListItem,
+    NavigationBarItem, NavigationRailItem, Tab,
+)
+from fastmdui.core import IconFontLinks
+from fastmdui.icons import IconRegistry, icon_registry
+
+
+@pytest.fixture(autouse=True)
+def clean_registry():
+    icon_registry.clear()
+    yield
+    icon_registry.clear()
+
+
+class TestIconRegistry:
+    """Test recording icon names and variants"""
+
+    def test_variant_from_suffix(self):
+        """mdui name suffixes select the variant"""
+        registry = IconRegistry()
+        registry.update("home", "search--outlined", "star--rounded")
+        assert registry.used() == {
+            "filled": ["home"],
+            "outlined": ["search"],
+            "rounded": ["star"],
+        }
+
+    def test_version_only_changes_for_new_icons(self):
+        """Recording a known icon doesn't invalidate caches"""
+        registry = IconRegistry()
+        registry.add("home")
+        version = registry.version
+        registry.add("home")
+        assert registry.version == version
+
+    def test_components_record_icons(self):
+        """Components with icons feed the shared registry"""
+        Button("Go", icon="send", end_icon="arrow_forward")
+        ButtonIcon("menu")
+        Fab("add")
+        Chip("Tag", icon="label")
+        ListItem("Settings", icon="settings", end_icon="chevron_right")
+        NavigationBarItem(icon="home", label="Home")
+        NavigationRailItem(icon="inbox", label="Inbox")
+        Tab(label="Tab", value="t", icon="tab")
+        Icon("favorite", variant="sharp")
+        used = icon_registry.used()
+        assert used["sharp"] == ["favorite"]
+        assert used["filled"] == sorted([
+            "send", "arrow_forward", "menu", "add", "label", "settings",
+            "chevron_right", "home", "inbox", "tab",
+        ])
+
+
+class TestAutoIconHeaders:
+    """Test that icons='auto' loads only the fonts in use"""
+
+    def test_nothing_loaded_without_icons(self):
+        """No icon font is requested before any icon is used"""
+        html = str(MDUI.headers(icons="auto").html)
+        assert "Material" not in html
+
+    def test_only_used_variants_and_glyphs(self):
+        """Symbols fonts are restricted to the recorded glyphs"""
+        headers = MDUI.headers(icons="auto")
+        Icon("search", variant="outlined")
+        Icon("home", variant="outlined")
+        html = str(headers.html)
+        assert "Material+Symbols+Outlined" in html
+        assert "icon_names=home,search" in html
+        assert "Rounded" not in html
+        assert "Sharp" not in html
+        assert MDUI.MATERIAL_ICONS_CSS not in html
+
+    def test_filled_icons_load_classic_font(self):
+        """Attribute icons need the classic Material Icons font"""
+        Button("Save", icon="save")
+        urls = IconFontLinks(MDUI).urls()
+        assert urls == [MDUI.MATERIAL_ICONS_CSS]
+
+    def test_links_render_through_to_xml(self):
+        """The live part renders inside a normal head tuple"""
+        headers = MDUI.headers(icons="auto")
+        Icon("star", variant="rounded")
+        assert "icon_names=star" in to_xml(tuple(headers))
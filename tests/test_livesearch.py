@@ -0,0 +1,110 @@
+"""
+Tests for debounced, cancellable live search
+"""
+
+import asyncio
+import time
+
+from fasthtml.common import FastHTML, to_xml
+from starlette.testclient import TestClient
+
+from fastmdui import TextField
+from fastmdui.livesearch import SESSION_KEY, LiveSearch
+
+
+class TestSearchField:
+    """Test the htmx attributes of TextField(search=...)"""
+
+    def test_plain_field_unchanged(self):
+        assert to_xml(TextField(label="Name")) == '<mdui-text-field label="Name" value="" type="text"></mdui-text-field>'
+
+    def test_search_attributes(self):
+        node = TextField(label="Search", search="/products", debounce=300, results="hits")
+        assert node.get("name") == "q"
+        assert node.get("hx-get") == "/products"
+        assert node.get("hx-trigger") == "input changed delay:300ms, clear"
+        assert node.get("hx-sync") == "this:replace"
+        assert node.get("hx-target") == "#hits"
+
+    def test_explicit_attributes_kept(self):
+        node = TextField(search="/s", name="term", hx_target="closest section")
+        assert node.get("name") == "term"
+        assert node.get("hx-target") == "closest section"
+
+
+class TestLiveSearch:
+    """Test cancelling superseded searches and caching results"""
+
+    def test_newer_query_cancels_running(self):
+        """A newer query from the same client cancels the older task"""
+        cancelled = []
+
+        async def search(q):
+            try:
+                await asyncio.sleep(0.2 if q == "a" else 0)
+            except asyncio.CancelledError:
+                cancelled.append(q)
+                raise
+            return [q]
+
+        live = LiveSearch(search)
+
+        async def main():
+            first = asyncio.create_task(live.run("client", "a"))
+            await asyncio.sleep(0.01)
+            second = await live.run("client", "ab")
+            return await first, second
+
+        first, second = asyncio.run(main())
+        assert first.status_code == 204
+        assert second == ["ab"]
+        assert cancelled == ["a"]
+        assert live.running() == 0
+
+    def test_clients_independent(self):
+        async def search(q):
+            await asyncio.sleep(0.01)
+            return q
+
+        live = LiveSearch(search)
+
+        async def main():
+            return await asyncio.gather(live.run({}, "a"), live.run({}, "b"))
+
+        assert asyncio.run(main()) == ["a", "b"]
+
+    def test_cached(self):
+        """Repeated queries are answered from the cache, until the ttl"""
+        calls = []
+
+        def search(q, page):
+            calls.append((q, page))
+            return [q, page]
+
+        live = LiveSearch(search, ttl=0.05)
+        session = {}
+        assert asyncio.run(live.run(session, " shoe ", 0)) == ["shoe", 0]
+        assert asyncio.run(live.run(session, "shoe", 0)) == ["shoe", 0]
+        asyncio.run(live.run(session, "shoe", 1))
+        assert calls == [("shoe", 0), ("shoe", 1)]
+        assert SESSION_KEY in session
+        time.sleep(0.06)
+        asyncio.run(live.run(session, "shoe", 0))
+        assert len(calls) == 3
+
+    def test_cache_bounded(self):
+        live = LiveSearch(lambda q: q, max_cached=2)
+        for q in "abc":
+            asyncio.run(live.run("c", q))
+        assert live.cached("a") is None and live.cached("c") == "c"
+
+    def test_endpoint(self):
+        app = FastHTML(secret_key="test")
+        live = LiveSearch(lambda q: [f"result for {q}"])
+
+        @app.get("/search")
+        async def search(q: str, session):
+            return await live.run(session, q)
+
+        resp = TestClient(app).get("/search?q=lamp", headers={"HX-Request": "1"})
+        assert "result for lamp" in resp.text
@@ -0,0 +1,73 @@
+"""
+Tests for per-component ES module loading
+"""
+
+import pytest
+from fasthtml.common import FastHTML
+from starlette.testclient import TestClient
+
+from fastmdui import MDUI, Button, Card, List, ListItem, ThemeToggle
+from fastmdui.modules import collect_tags, used_tags
+
+
+class TestTagCollector:
+    """Test recording the mdui-* tags a response contains"""
+
+    def test_collects_built_tags(self):
+        """Only mdui-* tags built inside the block are recorded"""
+        with collect_tags() as tags:
+            List(ListItem("One"), ListItem("Two"))
+            Card(title="Title")
+        assert tags == {"mdui-list", "mdui-list-item", "mdui-card"}
+
+    def test_nested_components(self):
+        """Components built by other components are recorded too"""
+        with collect_tags() as tags:
+            ThemeToggle()
+        assert tags == {"mdui-button-icon", "mdui-icon"}
+
+    def test_fallback_outside_request(self):
+        """Without a collector every tag seen so far is used"""
+        Button("Seen")
+        assert "mdui-button" in used_tags()
+
+
+class TestComponentModules:
+    """Test the module imports emitted by headers(scripts='modules')"""
+
+    def test_module_url(self):
+        """Tags map onto mdui's per-component modules"""
+        url = MDUI.component_module_url("mdui-list-item")
+        assert url == f"https://esm.sh/mdui@{MDUI.VERSION}/components/list-item.js"
+
+    def test_no_global_script(self):
+        """The full bundle is not loaded in modules mode"""
+        with collect_tags():
+            html = str(MDUI.headers(scripts="modules").html)
+        assert MDUI.CDN_JS not in html
+
+    def test_only_used_components_per_request(self):
+        """Each response imports just the components it contains"""
+        app = MDUI.collect_components(FastHTML(secret_key="test", hdrs=MDUI.headers(scripts="modules")))
+
+        @app.get("/buttons")
+        def buttons():
+            return Button("Hi")
+
+        @app.get("/list")
+        async def listing():
+            return List(ListItem("One"))
+
+        client = TestClient(app)
+        page = client.get("/buttons").text
+        assert 'rel="modulepreload" href="https://esm.sh/mdui@2.0.3/components/button.js"' in page
+        assert "list-item.js" not in page
+
+        page = client.get("/list").text
+        assert 'import "https://esm.sh/mdui@2.0.3/components/list-item.js";' in page
+        assert "button.js" not in page
+
+    def test_local_assets_rejected(self):
+        """Modules come from a CDN, so local assets can't be combined"""
+        with pytest.raises(ValueError):
+            MDUI.headers(scripts="modules", assets="local")
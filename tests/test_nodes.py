@@ -0,0 +1,158 @@
+"""
+Tests for the compact node type returned by the mdui components
+"""
+
+import copy
+import gc
+import tracemalloc
+
+from fasthtml.common import FT, ft_hx, to_xml
+
+from fastmdui import Button, List, ListItem
+from fastmdui.nodes import CompactFT, is_plain_ft
+from fastmdui.render import render
+
+
+def _retained(build):
+    """Bytes still allocated by whatever build() returns"""
+    gc.collect()
+    tracemalloc.start()
+    result = build()
+    size, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    del result
+    return size
+
+
+class TestMemory:
+    """Test the memory saved on large pages"""
+
+    def test_large_list_uses_less_memory(self):
+        """List items take well under the memory of FT nodes"""
+        rows = [(f"Item {i}", f"Description {i}") for i in range(5_000)]
+
+        def compact():
+            return List(*(ListItem(h, description=d, href="/items") for h, d in rows))
+
+        def plain():
+            return ft_hx("mdui-list", tuple(
+                ft_hx("mdui-list-item", (), headline=h, description=d, href="/items") for h, d in rows
+            ))
+
+        assert render(compact()) == to_xml(plain())
+        assert _retained(compact) < 0.6 * _retained(plain)
+
+    def test_rendering_does_not_convert(self):
+        """Rendering leaves nodes compact"""
+        page = List(*(ListItem(f"Item {i}") for i in range(10)))
+        to_xml(page)
+        render(page)
+        assert page._ft is None
+        assert all(item._ft is None for item in page._children)
+
+
+class TestFTCompatibility:
+    """Test that nodes behave like the FT they stand in for"""
+
+    def test_reading(self):
+        """Tag, attribute and child reads don't convert"""
+        button = Button("Save", icon="save", id="save")
+        assert button.tag == "mdui-button"
+        assert button.get("icon") == "save"
+        assert button.id == "save"
+        assert str(button) == "save"
+        assert list(button) == ["Save"]
+        assert button._ft is None
+
+    def test_attrs_convert_once(self):
+        """Touching attrs converts to an FT that later reads and writes share"""
+        item = ListItem("One", icon="inbox")
+        item.attrs["rounded"] = True
+        item.hx_get = "/one"
+        assert isinstance(item.to_ft(), FT)
+        assert item.to_ft() is item.to_ft()
+        assert to_xml(item) == '<mdui-list-item icon="inbox" headline="One" rounded hx-get="/one"></mdui-list-item>'
+        assert render(item) == to_xml(item)
+
+    def test_call_adds_children(self):
+        """Calling a node returns the FT with the new children"""
+        lst = List()(ListItem("One"))
+        assert isinstance(lst, FT)
+        assert lst.children[0].get("headline") == "One"
+
+    def test_route_targets(self):
+        """Nodes FastHTML must resolve route targets in stay FT, as do their parents"""
+        from fasthtml.common import FastHTML, Div
+        from starlette.testclient import TestClient
+
+        app = FastHTML(secret_key="test")
+
+        @app.post("/save")
+        def save():
+            return "saved"
+
+        @app.get("/")
+        def home():
+            return List(ListItem("Plain"), Div(Button("Save", post=save)))
+
+        assert is_plain_ft(Button("Save", post=save))
+        assert 'hx-post="/save"' in TestClient(app).get("/").text
+
+    def test_html(self):
+        button = Button("Go")
+        assert button.__html__() == '<mdui-button variant="filled">Go</mdui-button>'
+        assert "x" + button == 'x<mdui-button variant="filled">Go</mdui-button>'
+        assert isinstance(CompactFT.from_ft(ft_hx("mdui-x", ())), CompactFT)
+
+    def test_is_ft(self):
+        """Compact nodes pass isinstance checks for FT"""
+        item = ListItem("One")
+        assert isinstance(item, FT) and isinstance(item, CompactFT)
+        assert not is_plain_ft(item)
+
+    def test_reading_attrs_does_not_convert(self):
+        """.attrs is a copy until written; popping a missing name is free"""
+        item = ListItem("One", id="one")
+        assert item.attrs == {"headline": "One", "id": "one"}
+        assert item.attrs.pop("hx-post", None) is None
+        assert item.children == ()
+        assert item._ft is None
+        assert item.attrs.pop("id") == "one"
+        assert item._ft is not None and "id" not in item.attrs
+
+
+class TestCopy:
+    """Test copying nodes, as FastHTML does with headers and footers"""
+
+    def test_copy_and_deepcopy(self):
+        lst = List(ListItem("One", id="one"))
+        for clone in (copy.copy(lst), copy.deepcopy(lst)):
+            assert isinstance(clone, CompactFT)
+            assert render(clone) == render(lst)
+        clone = copy.deepcopy(lst)
+        clone.children[0].attrs["id"] = "changed"
+        assert lst.children[0].get("id") == "one"
+        assert lst._ft is None
+
+    def test_copy_converted(self):
+        item = ListItem("One")
+        item.hx_get = "/one"
+        clone = copy.deepcopy(item)
+        clone.hx_get = "/two"
+        assert item.get("hx-get") == "/one" and clone.get("hx-get") == "/two"
+
+    def test_served_from_footers(self):
+        """Components can be app footers, which are deep-copied per request"""
+        from fasthtml.common import FastHTML, P
+        from fastmdui import Snackbar
+        from starlette.testclient import TestClient
+
+        app = FastHTML(secret_key="test", ftrs=[Snackbar("Saved", id="s")])
+
+        @app.get("/")
+        def home():
+            return P("Home")
+
+        resp = TestClient(app).get("/")
+        assert resp.status_code == 200
+        assert '<mdui-snackbar id="s">Saved</mdui-snackbar>' in resp.text
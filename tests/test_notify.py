@@ -0,0 +1,143 @@
+"""
+Tests for the Snackbar notification bus
+"""
+
+import asyncio
+import threading
+import time
+
+from fastmdui import MDUI
+from fastmdui.notify import SESSION_KEY, NotificationBus, _event, session_id, websocket
+
+
+async def _take(subscription, n, timeout=1):
+    return [await asyncio.wait_for(subscription.__anext__(), timeout) for _ in range(n)]
+
+
+def _collect(sent):
+    async def send(message):
+        sent.append(message)
+    return send
+
+
+class TestQueueing:
+    """Test merging, deduplicating and bounding queued messages"""
+
+    def test_burst_is_merged(self):
+        """Near-duplicates in a burst become one Snackbar with a count"""
+        async def main():
+            bus = NotificationBus(interval=0.02)
+            for i in range(1, 6):
+                bus.notify("s", f"Uploaded file {i}")
+            bus.notify("s", "Import done")
+            return await _take(bus.subscribe("s"), 2)
+        first, second = asyncio.run(main())
+        assert "Uploaded file 5 (×5)" in first and "<mdui-snackbar open>" in first
+        assert "Import done" in second
+
+    def test_rate_limited(self):
+        """A session gets at most one Snackbar per interval"""
+        async def main():
+            bus = NotificationBus(interval=0.05)
+            subscription = bus.subscribe("s")
+            for text in ("One", "Two", "Three"):
+                bus.notify("s", text)
+            times = []
+            for _ in range(3):
+                await _take(subscription, 1)
+                times.append(time.monotonic())
+            return times
+        times = asyncio.run(main())
+        assert times[2] - times[0] >= 0.09
+
+    def test_recent_duplicates_suppressed(self):
+        """The same message isn't shown again within the dedupe window"""
+        async def main():
+            bus = NotificationBus(interval=0, dedupe_window=10)
+            subscription = bus.subscribe("s")
+            bus.notify("s", "Saved")
+            await _take(subscription, 1)
+            bus.notify("s", "Saved")
+            bus.notify("s", "Deleted")
+            return await _take(subscription, 1)
+        assert "Deleted" in asyncio.run(main())[0]
+
+    def test_queue_is_bounded(self):
+        """Old messages are dropped beyond max_queue"""
+        bus = NotificationBus(max_queue=3)
+        for text in ("a", "b", "c", "d", "e"):
+            bus.notify("s", text)
+        assert [m.text for m in bus._sessions["s"].pending] == ["c", "d", "e"]
+
+    def test_sessions_are_bounded(self):
+        """Idle sessions are dropped beyond max_sessions"""
+        bus = NotificationBus(max_sessions=2)
+        for key in ("a", "b", "c"):
+            bus.notify(key, "Hi")
+        assert list(bus._sessions) == ["b", "c"]
+
+
+class TestDelivery:
+    """Test the dispatcher task and connections"""
+
+    def test_single_dispatcher_fans_out(self):
+        """One task serves every session and connection"""
+        async def main():
+            bus = NotificationBus(interval=0)
+            subscriptions = [bus.subscribe(f"s{i % 25}") for i in range(50)]
+            tasks = len(asyncio.all_tasks())
+            bus.broadcast("Maintenance at noon")
+            received = [await _take(s, 1) for s in subscriptions]
+            return tasks, received
+        tasks, received = asyncio.run(main())
+        assert tasks == 2  # this coroutine and the dispatcher
+        assert all("Maintenance at noon" in r[0] for r in received)
+
+    def test_notify_from_thread(self):
+        """Background threads can queue messages"""
+        async def main():
+            bus = NotificationBus(interval=0)
+            subscription = bus.subscribe("s")
+            thread = threading.Thread(target=bus.notify, args=("s", "From a worker"))
+            thread.start()
+            thread.join()
+            return await _take(subscription, 1)
+        assert "From a worker" in asyncio.run(main())[0]
+
+    def test_session_ids(self):
+        """Sessions get a stable notification id"""
+        session = {}
+        key = session_id(session)
+        assert session[SESSION_KEY] == key == session_id(session)
+
+        async def main():
+            bus = NotificationBus(interval=0)
+            subscription = bus.subscribe(session)
+            bus.notify(session, "Hello")
+            return await _take(subscription, 1)
+        assert "Hello" in asyncio.run(main())[0]
+
+    def test_websocket(self):
+        """WebSocket clients get each Snackbar as an out-of-band append"""
+        async def main():
+            bus = NotificationBus(interval=0)
+            sent = []
+            task = asyncio.create_task(websocket(_collect(sent), "s", bus))
+            await asyncio.sleep(0)
+            bus.notify("s", "Hi")
+            while not sent:
+                await asyncio.sleep(0.001)
+            task.cancel()
+            await asyncio.gather(task, return_exceptions=True)
+            return sent, bus._sessions["s"].subscribers
+        sent, subscribers = asyncio.run(main())
+        assert sent[0].startswith('<div hx-swap-oob="beforeend:body"><mdui-snackbar open>Hi')
+        assert not subscribers
+
+    def test_event_format(self):
+        """Multi-line HTML stays one event"""
+        assert _event("<a>\nb</a>") == "event: snackbar\ndata: <a>\ndata: b</a>\n\n"
+
+    def test_script(self):
+        """headers(notifications=True) opens the stream"""
+        assert "/_mdui_notify" in str(MDUI.headers(notifications=True).html)
@@ -0,0 +1,72 @@
+"""
+Tests for the offline service worker generator
+"""
+
+from fasthtml.common import FastHTML
+from starlette.testclient import TestClient
+
+from fastmdui import MDUI, MDUIAssets
+from fastmdui.offline import cache_version
+
+
+class TestOfflineAssets:
+    """Test the asset set a service worker caches"""
+
+    def test_precaches_configured_assets(self):
+        """Every stylesheet and script of the bundle is precached"""
+        headers = MDUI.headers(tachyons=True, icons="all", offline=True)
+        precache, runtime = MDUI.offline_assets(headers)
+        for url in (
+            MDUI.CDN_CSS, MDUI.CDN_JS, MDUI.TACHYONS_CSS, MDUI.OPEN_SANS_FONT_CSS,
+            MDUI.MATERIAL_ICONS_CSS, MDUI.MATERIAL_ICONS_OUTLINED_CSS,
+            MDUI.MATERIAL_ICONS_ROUNDED_CSS, MDUI.MATERIAL_ICONS_SHARP_CSS,
+        ):
+            assert url in precache
+        # Google Fonts picks font files per browser, so they're cached on use
+        assert runtime == ["https://fonts.gstatic.com/"]
+
+    def test_only_chosen_assets(self):
+        """Assets that weren't configured are left out"""
+        precache, runtime = MDUI.offline_assets(MDUI.headers(icons=None, font=None))
+        assert precache == [MDUI.CDN_CSS, MDUI.CDN_JS]
+        assert runtime == []
+
+    def test_local_fonts_are_precached(self, tmp_path):
+        """Local stylesheets bring their font files along"""
+        (tmp_path / "fonts").mkdir()
+        (tmp_path / "fonts" / "icons.woff2").write_bytes(b"wOF2")
+        (tmp_path / "material-icons.css").write_text("@font-face{src:url(fonts/icons.woff2)}")
+        for name in ("mdui.css", "mdui.global.js", "open-sans.css"):
+            (tmp_path / name).write_text(name)
+        previous, MDUI._assets = MDUI._assets, MDUIAssets(tmp_path)
+        try:
+            precache, _ = MDUI.offline_assets(MDUI.headers(assets="local", icons="filled"))
+            assert MDUI._assets.url("fonts/icons.woff2") in precache
+        finally:
+            MDUI._assets = previous
+
+    def test_version_follows_asset_set(self):
+        """Changing the asset set changes the cache name"""
+        assert cache_version(["/a.1.css"]) == cache_version(["/a.1.css"])
+        assert cache_version(["/a.1.css"]) != cache_version(["/a.2.css"])
+
+
+class TestServiceWorkerRoute:
+    """Test registering and serving the worker"""
+
+    def test_registration_script(self):
+        """offline=True registers the worker"""
+        html = str(MDUI.headers(offline=True).html)
+        assert f"navigator.serviceWorker.register('{MDUI.SERVICE_WORKER_PATH}')" in html
+        assert "serviceWorker" not in str(MDUI.headers().html)
+
+    def test_serves_worker(self):
+        """The worker is served as revalidated JavaScript"""
+        headers = MDUI.headers(offline=True)
+        client = TestClient(MDUI.mount_service_worker(FastHTML(secret_key="test", hdrs=headers), headers))
+        resp = client.get(MDUI.SERVICE_WORKER_PATH)
+        assert resp.status_code == 200
+        assert resp.headers["content-type"].startswith("text/javascript")
+        assert resp.headers["cache-control"] == "no-cache"
+        assert MDUI.CDN_JS in resp.text
+        assert "cache.match(event.request" in resp.text
@@ -0,0 +1,113 @@
+"""
+Tests for out-of-band partial updates
+"""
+
+import json
+
+import pytest
+from fasthtml.common import FastHTML, Span, to_xml
+from starlette.testclient import TestClient
+
+from fastmdui import MDUI, Badge, Button, Progress, Snackbar, mdui_patch, mdui_updates
+from fastmdui.nodes import CompactFT
+from fastmdui.patches import EVENT, HEADER, RESWAP, Patch, oob
+
+
+def _patches(header):
+    return json.loads(header)[EVENT]["patches"]
+
+
+class TestOob:
+    """Test marking components for out-of-band swaps"""
+
+    def test_compact_component(self):
+        """Compact nodes stay compact and gain hx-swap-oob"""
+        node = Progress(0.4, id="upload").oob()
+        assert isinstance(node, CompactFT)
+        assert to_xml(node) == '<mdui-linear-progress value="0.4" id="upload" hx-swap-oob="true"></mdui-linear-progress>'
+
+    def test_ft_component(self):
+        """FT components work the same and aren't modified"""
+        badge = Badge(Span("3"), id="count")
+        node = badge.oob("innerHTML")
+        assert node.attrs["hx-swap-oob"] == "innerHTML"
+        assert "hx-swap-oob" not in badge.attrs
+
+    def test_needs_id(self):
+        """Swaps addressed by id need one; explicit targets don't"""
+        with pytest.raises(ValueError):
+            Progress(0.4).oob()
+        assert oob(Snackbar("Hi"), "beforeend:#toasts").attrs["hx-swap-oob"] == "beforeend:#toasts"
+
+
+class TestPatch:
+    """Test attribute-only patches"""
+
+    def test_values(self):
+        """Values become strings; True sets and False/None removes"""
+        patch = mdui_patch("save", value=0.5, disabled=True, loading=False, data_step=2, cls="busy")
+        assert patch.k == HEADER
+        assert _patches(patch.v) == {
+            "save": {"value": "0.5", "disabled": True, "loading": None, "data-step": "2", "class": "busy"}
+        }
+
+    def test_patch_needs_id(self):
+        """Patches are addressed by id"""
+        with pytest.raises(ValueError):
+            mdui_patch("", value=1)
+
+    def test_batch(self):
+        """Patches merge into one header, later values winning"""
+        first = mdui_patch("upload", value=0.2)
+        parts = mdui_updates(first, [mdui_patch("upload", value=0.8), mdui_patch("count", hidden=False)],
+                             Badge("3", id="inbox").oob())
+        swap, reswap, patch = parts
+        assert isinstance(patch, Patch)
+        assert _patches(patch.v) == {"upload": {"value": "0.8"}, "count": {"hidden": None}}
+        assert _patches(first.v) == {"upload": {"value": "0.2"}}
+        assert swap.attrs["hx-swap-oob"] == "true"
+        assert (reswap.k, reswap.v) == (RESWAP, "none")
+
+    def test_batch_without_patches(self):
+        """Without patches the parts come back unchanged"""
+        button = Button("Hi")
+        assert mdui_updates(button, [button]) == (button, button)
+
+    def test_main_content_keeps_swap(self):
+        """Only responses without normally swapped content get HX-Reswap: none"""
+        assert not any(getattr(p, "k", None) == RESWAP for p in mdui_updates(Button("Hi"), mdui_patch("a", value=1)))
+        assert [(p.k, p.v) for p in mdui_updates()] == [(RESWAP, "none")]
+
+
+class TestResponses:
+    """Test patches and swaps in FastHTML responses"""
+
+    def test_response(self):
+        """One response carries the swaps and a single patch header"""
+        app = FastHTML(secret_key="test", hdrs=MDUI.headers(patches=True))
+
+        @app.post("/tick")
+        def tick():
+            return mdui_updates(
+                mdui_patch("upload", value=0.8),
+                mdui_patch("save", disabled=False),
+                Snackbar("Done", id="toast", open=True).oob(),
+            )
+
+        @app.post("/only")
+        def only():
+            return mdui_patch("upload", value=1)
+
+        client = TestClient(app)
+        resp = client.post("/tick", headers={"HX-Request": "1"})
+        assert _patches(resp.headers[HEADER]) == {"upload": {"value": "0.8"}, "save": {"disabled": None}}
+        assert 'id="toast" hx-swap-oob="true"' in resp.text
+        assert resp.headers[RESWAP] == "none"
+        resp = client.post("/only", headers={"HX-Request": "1"})
+        assert _patches(resp.headers[HEADER]) == {"upload": {"value": "1"}}
+        assert "mdui-" not in resp.text
+
+    def test_script(self):
+        """headers(patches=True) adds the patch listener"""
+        assert EVENT in str(MDUI.headers(patches=True).html)
+        assert EVENT not in str(MDUI.headers().html)
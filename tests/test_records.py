@@ -0,0 +1,104 @@
+"""
+Tests for List.from_records
+Every case is compared against a loop over ListItem
+"""
+
+from collections import namedtuple
+from dataclasses import dataclass
+
+import pytest
+from fasthtml.common import to_xml
+
+from fastmdui import List, ListItem
+from fastmdui.icons import icon_registry
+
+
+USERS = [
+    {"id": 1, "name": "Ann", "email": "ann@example.com", "icon": "person", "active": True},
+    {"id": 2, "name": "Bob & Co", "email": "", "icon": "group", "active": False},
+    {"id": 3, "name": "<Cy>", "email": "cy@example.com", "icon": None, "active": True},
+]
+
+
+def expected(**item):
+    return to_xml(List(*(
+        ListItem(u["name"], description=u["email"], icon=u["icon"], href=f"/users/{u['id']}",
+                 disabled=not u["active"], **item)
+        for u in USERS
+    ), id="users"))
+
+
+MAPPING = dict(
+    headline="name", description="email", icon="icon",
+    href=lambda u: f"/users/{u['id']}", disabled=lambda u: not u["active"],
+)
+
+
+class TestRecordShapes:
+    """Test the supported record types"""
+
+    def test_dicts(self):
+        assert to_xml(List.from_records(USERS, id="users", **MAPPING)) == expected()
+
+    def test_objects(self):
+        """Dataclasses and namedtuples are read by attribute"""
+        @dataclass
+        class User:
+            id: int
+            name: str
+            email: str
+            icon: str
+            active: bool
+
+        Row = namedtuple("Row", USERS[0])
+        getters = dict(MAPPING, href=lambda u: f"/users/{u.id}", disabled=lambda u: not u.active)
+        for rows in ([User(**u) for u in USERS], [Row(**u) for u in USERS]):
+            assert to_xml(List.from_records(rows, id="users", **getters)) == expected()
+
+    def test_tuples(self):
+        """Tuple rows use indexes or the names in columns"""
+        rows = [tuple(u.values()) for u in USERS]
+        html = List.from_records(
+            rows, columns=tuple(USERS[0]), headline="name", description=2, icon="icon",
+            href=lambda r: f"/users/{r[0]}", disabled=lambda r: not r[4], id="users",
+        )
+        assert to_xml(html) == expected()
+        with pytest.raises(ValueError, match="columns"):
+            List.from_records(rows, headline="name")
+
+    def test_columns(self):
+        """A dict of column arrays is read row by row"""
+        columns = {key: [u[key] for u in USERS] for key in USERS[0]}
+        mapping = dict(MAPPING, href=lambda r: f"/users/{r[0]}", disabled=lambda r: not r[4])
+        assert to_xml(List.from_records(columns, id="users", **mapping)) == expected()
+
+    def test_non_string_values(self):
+        """Lists and numbers are converted the way ListItem converts them"""
+        rows = [{"name": "Ann", "tags": ["admin", "ops"], "count": 3}, {"name": "Bob", "tags": [], "count": 0}]
+        expected = to_xml(List(*(ListItem(r["name"], description=r["tags"], headline_line=r["count"]) for r in rows)))
+        for prerender in (False, True):
+            html = List.from_records(rows, headline="name", description="tags", headline_line="count", prerender=prerender)
+            assert to_xml(html) == expected
+        assert 'description="admin ops"' in expected
+
+    def test_empty(self):
+        assert to_xml(List.from_records([], headline="name")) == to_xml(List())
+
+
+class TestOptions:
+    """Test shared arguments, prerendering and icon recording"""
+
+    def test_shared_item_arguments(self):
+        """Shared arguments keep ListItem's attribute order"""
+        item = {"end_icon": "chevron_right", "rounded": True, "cls": "user", "hx_get": "/x"}
+        assert to_xml(List.from_records(USERS, id="users", item=item, **MAPPING)) == expected(**item)
+
+    def test_prerender(self):
+        """Prerendered items produce the same HTML"""
+        html = to_xml(List.from_records(USERS, id="users", prerender=True, **MAPPING))
+        assert html == expected()
+
+    def test_records_icons(self):
+        icon_registry.clear()
+        List.from_records(USERS, headline="name", icon="icon", item={"end_icon": "chevron_right"})
+        assert icon_registry.used()["filled"] == ["chevron_right", "group", "person"]
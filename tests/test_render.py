@@ -0,0 +1,152 @@
+"""
+Tests for the direct-to-string renderer
+Every case is compared byte-for-byte against FastHTML's to_xml
+"""
+
+import re
+
+import pytest
+from fasthtml.common import Body, FastHTML, Div, Head, Html, P, Pre, Input, NotStr, to_xml
+from starlette.testclient import TestClient
+
+from fastmdui import (
+    MDUI, Button, Card, Checkbox, Dialog, List, ListItem, Select, TextField,
+    TopAppBar, TopAppBarTitle, Divider,
+)
+from fastmdui import render as render_module
+from fastmdui.icons import icon_registry
+from fastmdui.render import Rendered, render, stream, stream_page
+
+
+@pytest.fixture
+def clean_icons():
+    """Start from an empty global icon registry, restoring it afterwards"""
+    saved = icon_registry.used()
+    icon_registry.clear()
+    yield
+    icon_registry.clear()
+    for variant, names in saved.items():
+        icon_registry.update(*names, variant=variant)
+
+
+TREES = [
+    List(Divider(), *(ListItem(f"Item {i}", description="a & b", icon="inbox") for i in range(3))),
+    Card(Div(Button("Save", variant="filled", icon="save"), Checkbox("I <agree>", checked=True))),
+    Dialog("Confirm", P("It's \"quoted\""), open=True, hx_vals={"a": 1}),
+    TopAppBar(TopAppBarTitle("Title"), Button("x", disabled=False)),
+    Div(Pre("  keep\n  spacing"), Div("plain", contenteditable="true"), Input(value="v")),
+    Div(TextField(label="Name", value="<b>"), Select(options=[{"value": "a", "text": "A & B"}]), NotStr("<i>raw</i>"), None, b"bytes", 3),
+    (Div("a"), [1, 2], Div(cls="empty")),
+    Div(data_x_="dropped", _="on click log me"),
+]
+
+
+class TestParity:
+    """Test that render() matches to_xml()"""
+
+    @pytest.mark.parametrize("tree", TREES)
+    @pytest.mark.parametrize("indent", [True, False])
+    def test_matches_to_xml(self, tree, indent):
+        """Same output for components, escaping and whitespace handling"""
+        assert render(tree, indent=indent) == to_xml(tree, indent=indent)
+
+    def test_options(self):
+        """lvl, do_escape and several top-level elements behave like to_xml"""
+        args = (List(ListItem("<x>")), "<raw>", None, b"b")
+        assert render(*args, lvl=4) == to_xml(*args, lvl=4)
+        assert render(*args, do_escape=False) == to_xml(*args, do_escape=False)
+
+    def test_attribute_cache_is_bounded(self):
+        """Unique attribute values don't grow the cache without limit"""
+        render(Div(*(Div(id=f"n{i}") for i in range(render_module._MAX_ATTRS + 10))))
+        assert len(render_module._ATTRS) <= render_module._MAX_ATTRS
+
+
+class TestRendered:
+    """Test the wrapper used inside FastHTML responses"""
+
+    def test_in_response(self):
+        """Wrapped content appears in the page unescaped"""
+        app = FastHTML(secret_key="test", hdrs=MDUI.headers())
+
+        @app.get("/")
+        def home():
+            return Rendered(List(ListItem("One & two")))
+
+        html = TestClient(app).get("/").text
+        assert to_xml(List(ListItem("One & two")), indent=False) in html
+
+
+class TestStream:
+    """Test chunked rendering of generator children"""
+
+    @pytest.mark.parametrize("tree", TREES)
+    def test_matches_render(self, tree):
+        """Joined chunks equal the whole-tree output"""
+        assert "".join(stream(tree, chunk_size=64)) == to_xml(tree)
+
+    def test_generators_match_materialized_children(self):
+        """List, Card(content=...) and Div accept generators"""
+        from fastmdui.components import Div as MDUIDiv
+        tree = MDUIDiv(
+            List(ListItem(f"Item {i}") for i in range(3)),
+            Card("Title", content=(Button(str(i)) for i in range(2))),
+        )
+        expected = to_xml(MDUIDiv(
+            List(*(ListItem(f"Item {i}") for i in range(3))),
+            Card("Title", content=[Button(str(i)) for i in range(2)]),
+        ))
+        assert "".join(stream(tree)) == expected
+
+    def test_items_are_consumed_incrementally(self):
+        """The first chunk goes out before the generator is exhausted"""
+        consumed = []
+
+        def items():
+            for i in range(10_000):
+                consumed.append(i)
+                yield ListItem(f"Item {i}")
+
+        chunks = stream(List(items()), chunk_size=4096)
+        next(chunks)
+        assert 0 < len(consumed) < 10_000
+        assert sum(1 for _ in chunks) > 10
+
+    def test_head_is_flushed_first(self):
+        """The head goes out as its own chunk so assets load during the body"""
+        page = Html(Head(*MDUI.headers()), Body(List(ListItem(f"Item {i}") for i in range(100))))
+        first = next(stream(page, chunk_size=1 << 20))
+        assert first.rstrip().endswith("</head>")
+
+    def test_stream_page(self):
+        """stream_page renders the app's headers, title and the streamed body"""
+        app = FastHTML(secret_key="test", hdrs=MDUI.headers())
+
+        @app.get("/")
+        def home(req):
+            return stream_page(req, List(ListItem(f"Item {i}") for i in range(2000)), title="Items")
+
+        client = TestClient(app)
+        html = client.get("/").text
+        assert html.startswith("<!doctype html>")
+        assert MDUI.CDN_JS in html
+        assert "<title>Items</title>" in html
+        assert html.count("<mdui-list-item") == 2000
+        fragment = client.get("/", headers={"HX-Request": "1"}).text
+        assert fragment.startswith("<mdui-list>")
+
+    def test_stream_page_late_assets(self, clean_icons):
+        """Modules and icon fonts first used by the streamed body are loaded from its end"""
+        app = MDUI.collect_components(FastHTML(secret_key="test", hdrs=MDUI.headers(scripts="modules", icons="auto")))
+
+        @app.get("/")
+        def home(req):
+            return stream_page(req, List(ListItem(f"Item {i}", icon="stream_late_icon--outlined") for i in range(3)))
+
+        html = TestClient(app).get("/").text
+        head, body = html.split("</head>")
+        assert MDUI.component_module_url("mdui-list-item") not in head
+        assert f'import "{MDUI.component_module_url("mdui-list-item")}"' in body
+        assert "stream_late_icon" not in head
+        late = body[body.index("</mdui-list>"):]
+        assert any("stream_late_icon" in link for link in re.findall(r"<link\b[^>]*>", late))
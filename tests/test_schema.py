@@ -0,0 +1,143 @@
+"""
+Tests for the schema-generated component constructors
+"""
+
+import inspect
+
+import pytest
+from fasthtml.common import FT, Span, to_xml
+
+from fastmdui import (
+    Avatar, Badge, ButtonIcon, Chip, Dialog, Fab, ListItem, NavigationBarItem,
+    NavigationRailItem, Progress, Radio, Slider, Switch, Tab, Tooltip,
+)
+from fastmdui.icons import record_icons
+from fastmdui.modules import collect_tags
+from fastmdui.nodes import CompactFT
+from fastmdui.schema import KWARGS, SCHEMAS, Attr, Schema, Slot, Text, component
+
+
+CALLS = [
+    (ListItem, (), {}),
+    (ListItem, ("Alice", "alice@example.com"), dict(
+        icon="person", end_icon="chevron_right", headline_line="1", description_line="2",
+        href="/a", target="_blank", disabled=True, non_clickable=True, rounded=True)),
+    (NavigationBarItem, ("home", "Home", "/"), {}),
+    (NavigationRailItem, ("inbox", "Inbox"), {}),
+    (Chip, ("Tag",), {}),
+    (Chip, (), dict(icon="sell", selected=True)),
+    (Avatar, ("me.png", "Me"), {}),
+    (Dialog, ("Title", "Body", True), {}),
+    (Switch, (True,), {}),
+    (Radio, ("size", "m", True), {}),
+    (Progress, (), {}),
+    (Progress, (0,), {}),
+    (Fab, ("add",), {}),
+    (Slider, (5, 1, 10), {}),
+    (Tab, ("Label", "one", "star"), {}),
+    (Badge, ("3",), {}),
+    (Tooltip, ("Help",), {}),
+]
+
+
+class TestParity:
+    """Test that the fast path builds what the ft_hx path builds"""
+
+    @pytest.mark.parametrize("fn,args,kwargs", CALLS, ids=lambda v: getattr(v, "__name__", ""))
+    def test_fast_path_matches_ft_hx_path(self, fn, args, kwargs):
+        """A dropped id=None forces the ft_hx path without changing the output"""
+        fast, slow = fn(*args, **kwargs), fn(*args, **kwargs, id=None)
+        assert to_xml(fast) == to_xml(slow)
+        assert type(fast) is type(slow)
+        assert list(fast.attrs.items()) == list(slow.attrs.items())
+
+    def test_attribute_order_with_kwargs(self):
+        """Extra attributes go where the schema places them"""
+        assert list(ListItem("A", icon="x", data_k="1").attrs) == ["data-k", "icon", "headline"]
+        assert list(Radio("n", "v", True, data_k="1").attrs) == ["name", "value", "data-k", "checked"]
+        assert list(Tab("L", "v", "i", data_k="1").attrs) == ["value", "data-k", "icon"]
+        assert list(ListItem("A", cls="c", data_k="1").attrs) == ["data-k", "headline", "class"]
+
+    def test_output(self):
+        """Generated constructors render the expected markup"""
+        assert to_xml(ListItem("A", icon="person")) == '<mdui-list-item icon="person" headline="A"></mdui-list-item>'
+        assert to_xml(Chip("Tag", selected=True)) == "<mdui-chip selected>Tag</mdui-chip>"
+        assert 'value="0"' in to_xml(Progress(0))
+        assert to_xml(ButtonIcon("menu")) == '<mdui-button-icon icon="menu" variant="standard"></mdui-button-icon>'
+
+    def test_non_string_content_uses_ft_hx(self):
+        """FT content keeps the node an FT, so route targets inside still resolve"""
+        chip = Chip(Span("x"))
+        assert type(chip) is FT
+        assert type(Chip(5)) is CompactFT
+        assert type(Dialog(Span("H"))) is FT
+
+    def test_records_tags_and_icons(self):
+        """The fast path records tags and icons like _mdui_component"""
+        with collect_tags() as tags, record_icons() as icons:
+            ListItem("A", icon="person", end_icon="chevron_right")
+        assert "mdui-list-item" in tags
+        assert [name for name, _ in icons] == ["person", "chevron_right"]
+
+
+class TestSignatures:
+    """Test that the constructors keep their call signatures"""
+
+    def test_list_item_signature(self):
+        """Argument names, order and defaults are unchanged"""
+        params = inspect.signature(ListItem).parameters
+        assert list(params) == [
+            "headline", "description", "icon", "end_icon", "headline_line", "description_line",
+            "href", "target", "disabled", "non_clickable", "rounded", "kwargs",
+        ]
+        assert params["icon"].default is None
+        assert params["disabled"].default is False
+
+    def test_required_arguments(self):
+        """Required arguments stay required"""
+        with pytest.raises(TypeError):
+            Fab()
+        with pytest.raises(TypeError):
+            ButtonIcon("x", data_k="1")
+
+    def test_positional_arguments(self):
+        """Positional calls bind in signature order"""
+        item = NavigationRailItem("inbox", "Inbox", "/inbox")
+        assert item.attrs == {"icon": "inbox", "label": "Inbox", "href": "/inbox"}
+
+
+class TestSchema:
+    """Test the declarations themselves"""
+
+    def test_introspection(self):
+        """Schemas are registered and describable"""
+        assert SCHEMAS["ListItem"] is ListItem.schema
+        info = ListItem.schema.describe()
+        assert info["tag"] == "mdui-list-item"
+        assert info["attributes"]["non_clickable"]["attribute"] == "nonclickable"
+        assert info["attributes"]["icon"]["icon"] is True
+        assert Dialog.schema.describe()["slots"] == {"headline": "headline", "description": "description"}
+        assert Fab.schema.describe()["arguments"][0] == {"name": "icon", "kind": "attr", "required": True}
+        assert ListItem.__doc__ == "MDUI List Item component"
+
+    def test_emit_must_cover_attributes(self):
+        """Schemas reject an emit order missing an attribute"""
+        with pytest.raises(ValueError):
+            Schema("mdui-x", [Attr("a"), Attr("b")], emit=("a", KWARGS))
+        with pytest.raises(ValueError):
+            Attr("a", set_when="sometimes")
+
+    def test_custom_component(self):
+        """New components can be declared the same way"""
+        from fastmdui import components
+        Card2 = component("Card2", Schema("mdui-card", [
+            Text("body"),
+            Slot("header"),
+            Attr("variant", "filled", set_when="always"),
+            Attr("clickable", False, set_when="flag"),
+        ]), vars(components))
+        SCHEMAS.pop("Card2")
+        assert to_xml(Card2("Hi", header="H", clickable=True)) == to_xml(
+            Card2("Hi", header="H", clickable=True, id=None))
+        assert list(Card2("Hi").attrs) == ["variant"]
+        assert Card2.schema.arg("body").default == ""
@@ -0,0 +1,124 @@
+"""
+Tests for the server-searched Select mode and its option index
+"""
+
+import re
+
+import pytest
+from fasthtml.common import FastHTML, to_xml
+from starlette.testclient import TestClient
+
+from fastmdui import MDUI, Select
+from fastmdui.search import OptionIndex, select_indexes
+
+
+COUNTRIES = [{"value": f"c{i}", "text": name} for i, name in enumerate(
+    ["France", "Finland", "Germany", "South Africa", "Frankland", "Afghanistan", "Fiji"]
+)]
+PRODUCTS = [{"value": str(i), "text": f"Product {i:04d}"} for i in range(1000)]
+
+
+def _texts(html):
+    return re.findall(r'<mdui-menu-item value="[^"]*">([^<]*)</mdui-menu-item>', html)
+
+
+class TestOptionIndex:
+    """Test prefix and substring search"""
+
+    def test_prefix_matches_first(self):
+        """Prefix matches come first, then substring matches, each in option order"""
+        index = OptionIndex(COUNTRIES)
+        names = [COUNTRIES[i]["text"] for i in index.search("fr")]
+        assert names == ["France", "Frankland", "South Africa"]
+
+    def test_prefix_only(self):
+        index = OptionIndex(COUNTRIES, match="prefix")
+        assert [COUNTRIES[i]["text"] for i in index.search("F")] == ["France", "Finland", "Frankland", "Fiji"]
+
+    def test_case_insensitive_and_empty(self):
+        index = OptionIndex(COUNTRIES)
+        assert list(index.search("  AFRICA ")) == [3]
+        assert list(index.search("")) == list(range(len(COUNTRIES)))
+        assert list(index.search("xyz")) == []
+
+    def test_each_option_listed_once(self):
+        """Repeated occurrences within one option don't duplicate it"""
+        index = OptionIndex([{"value": "a", "text": "aaaa"}, {"value": "b", "text": "baa"}])
+        assert list(index.search("a")) == [0, 1]
+
+    def test_results_are_cached(self):
+        """Pages of the same query reuse the result list"""
+        index = OptionIndex(PRODUCTS, max_cached=2)
+        assert index.search("product 01") is index.search("Product 01")
+        index.search("1")
+        index.search("2")
+        assert len(index._cache) == 2
+
+    def test_pages(self):
+        index = OptionIndex(PRODUCTS)
+        opts, more = index.page("product 0", page=1, size=400)
+        assert opts[0]["text"] == "Product 0400" and more
+        opts, more = index.page("product 0", page=2, size=400)
+        assert len(opts) == 200 and not more
+
+    def test_invalid_match(self):
+        with pytest.raises(ValueError):
+            OptionIndex(COUNTRIES, match="fuzzy")
+
+
+class TestSearchSelect:
+    """Test the rendered Select and its endpoint"""
+
+    def test_renders_first_page_only(self):
+        """Only a page plus the selected option are rendered"""
+        html = to_xml(Select(label="Product", options=PRODUCTS, value="900", search="products", page_size=20))
+        texts = _texts(html)
+        assert texts[0] == "Product 0900"
+        assert texts[1:] == [f"Product {i:04d}" for i in range(20)]
+        assert 'hx-trigger="input changed delay:250ms, clear"' in html
+        assert 'hx-sync="this:replace"' in html
+        assert 'hx-trigger="intersect once"' in html
+
+    def test_plain_select_unchanged(self):
+        """Without search every option is rendered"""
+        assert len(_texts(to_xml(Select(options=COUNTRIES)))) == len(COUNTRIES)
+
+    def test_endpoint(self):
+        """Searching and paging go through the registered route"""
+        Select(options=PRODUCTS, search="products", page_size=20)
+        client = TestClient(MDUI.mount_select_search(FastHTML(secret_key="test")))
+
+        html = client.get("/_mdui_select/products", params={"q": "product 09", "size": 20}).text
+        assert 'name="q" value="product 09"' in html
+        assert _texts(html) == [f"Product {i:04d}" for i in range(900, 920)]
+        more = re.search(r'hx-get="([^"]*page=1[^"]*)"', html).group(1).replace("&amp;", "&")
+
+        html = client.get(more).text
+        assert "mdui-text-field" not in html
+        assert _texts(html)[0] == "Product 0920"
+
+    def test_selected_kept_after_search(self):
+        """The selected option stays available to show its label"""
+        Select(options=COUNTRIES, search="countries")
+        client = TestClient(MDUI.mount_select_search(FastHTML(secret_key="test")))
+        html = client.get("/_mdui_select/countries", params={"q": "fin", "selected": "c2"}).text
+        assert _texts(html) == ["Germany", "Finland"]
+
+    def test_index_reused_for_equal_options(self):
+        """A freshly loaded but equal option list keeps the built index"""
+        first = select_indexes.register("reload", [dict(o) for o in COUNTRIES])
+        assert select_indexes.register("reload", [dict(o) for o in COUNTRIES]) is first
+        changed = COUNTRIES + [{"value": "x", "text": "Xanadu"}]
+        assert select_indexes.register("reload", changed) is not first
+        assert select_indexes.register("reload", changed, match="prefix").match == "prefix"
+
+    def test_registered_once(self):
+        """A Select given only the name uses the registered options"""
+        index = select_indexes.register("products-once", PRODUCTS)
+        html = to_xml(Select(label="Product", search="products-once", page_size=5))
+        assert select_indexes.get("products-once") is index
+        assert _texts(html) == [f"Product {i:04d}" for i in range(5)]
+
+    def test_unknown_name(self):
+        client = TestClient(MDUI.mount_select_search(FastHTML(secret_key="test")))
+        assert client.get("/_mdui_select/missing").text == ""
@@ -0,0 +1,180 @@
+"""
+Tests for inline SVG sprite icons
+"""
+
+import pytest
+from fasthtml.common import FastHTML
+from starlette.testclient import TestClient
+
+from fastmdui import MDUI, Button, Icon, ListItem
+from fastmdui import sprites
+from fastmdui.icons import record_icons
+from fastmdui.render import render
+from fastmdui.sprites import IconIndex, IconSprite, build, collect_symbols, parse_svg, sprite_icon
+
+
+HOME = '<svg xmlns="http://www.w3.org/2000/svg" viewBox="0 0 24 24"><path d="M0 0h24v24H0z" fill="none"/><path d="M10 20v-6h4v6h5v-8h3L12 3 2 12h3v8z"/></svg>'
+SEARCH = '<svg xmlns="http://www.w3.org/2000/svg" height="24" viewBox="0 -960 960 960" width="24"><path d="M784-120 532-372q-30 24-69 38t-83 14"/></svg>'
+HOME_ROUNDED = '<svg xmlns="http://www.w3.org/2000/svg" viewBox="0 0 24 24"><path d="M10 19v-5h4v5"/><path d="M12 3 2 12h3"/></svg>'
+
+
+@pytest.fixture
+def index_path(tmp_path):
+    icons = tmp_path / "svgs"
+    (icons / "rounded").mkdir(parents=True)
+    (icons / "home.svg").write_text(HOME)
+    (icons / "search--outlined.svg").write_text(SEARCH)
+    (icons / "rounded" / "home.svg").write_text(HOME_ROUNDED)
+    return build(icons, tmp_path / "icons.idx")
+
+
+@pytest.fixture
+def sprite_mode(index_path):
+    index = IconIndex(index_path)
+    sprites.enable(index)
+    yield index
+    sprites.enable(None)
+
+
+class TestIconIndex:
+    """Test building and reading the memory-mapped path index"""
+
+    def test_parse_svg_skips_bounding_box(self):
+        """Unfilled bounding box paths are dropped and the rest joined"""
+        assert parse_svg(HOME) == ("0 0 24 24", "M10 20v-6h4v6h5v-8h3L12 3 2 12h3v8z")
+        assert parse_svg(HOME_ROUNDED)[1] == "M10 19v-5h4v5M12 3 2 12h3"
+
+    def test_lookup(self, index_path):
+        """Names are found by binary search, with variant fallback"""
+        index = IconIndex(index_path)
+        assert index.names() == ["home", "home--rounded", "search--outlined"]
+        assert index.get("home", "rounded")[0] == "home--rounded"
+        assert index.get("home", "outlined")[0] == "home"
+        assert index.get("search", "outlined") == ("search--outlined", "0 -960 960 960", "M784-120 532-372q-30 24-69 38t-83 14")
+        assert index.get("search", "filled") is None
+        assert index.get("missing") is None
+
+    def test_empty_index(self, tmp_path):
+        """An empty index finds nothing"""
+        path = tmp_path / "empty.idx"
+        path.write_bytes(b"")
+        assert len(IconIndex(path)) == 0
+        assert IconIndex(path).get("home") is None
+
+
+class TestCommandLine:
+    """Test the build/fetch command line"""
+
+    def test_fetch_index_path(self, monkeypatch):
+        """A trailing *.idx argument is the output path, not an icon name"""
+        calls = []
+        monkeypatch.setattr(sprites, "fetch", lambda *names, **kw: calls.append((names, kw)))
+        sprites.main(["fetch", "home", "search", "icons.idx"])
+        sprites.main(["fetch", "home"])
+        assert calls == [(("home", "search"), {"out": "icons.idx"}), (("home",), {})]
+
+    def test_build(self, tmp_path):
+        (tmp_path / "home.svg").write_text('<svg><path d="M1 1"/></svg>')
+        sprites.main(["build", str(tmp_path), str(tmp_path / "out.idx")])
+        assert IconIndex(tmp_path / "out.idx").get("home", "filled")
+
+    def test_usage(self):
+        with pytest.raises(SystemExit):
+            sprites.main(["fetch"])
+
+
+class TestSpriteIcons:
+    """Test Icon and Button rendering in sprite mode"""
+
+    def test_off_by_default(self):
+        """Without an index icons use the font"""
+        assert sprite_icon("home") is None
+        assert 'name="home"' in render(Icon("home"))
+
+    def test_icon_uses_symbol(self, sprite_mode):
+        """Indexed icons reference their symbol and skip the font registry"""
+        with record_icons() as icons:
+            html = render(Icon("home", variant="rounded", id="i"), indent=False)
+        assert html == (
+            '<mdui-icon id="i"><svg viewBox="0 0 24 24" width="100%" height="100%" fill="currentColor" '
+            'aria-hidden="true"><use href="#mdui-i-home--rounded"></use></svg></mdui-icon>'
+        )
+        assert icons == []
+
+    def test_missing_icon_uses_font(self, sprite_mode):
+        """Icons missing from the index keep the font glyph"""
+        with record_icons() as icons:
+            html = render(Icon("settings"))
+        assert 'name="settings"' in html
+        assert icons == [("settings", "outlined")]
+
+    def test_button_slots_icon(self, sprite_mode):
+        """Button icons become slotted sprite icons"""
+        html = render(Button("Go", icon="home", end_icon="search--outlined"), indent=False)
+        assert 'slot="icon"' in html and 'slot="end-icon"' in html
+        assert "#mdui-i-home" in html and "#mdui-i-search--outlined" in html
+        assert " icon=" not in html
+
+    def test_other_components_keep_attributes(self, sprite_mode):
+        """Icon attributes of other components are left to mdui"""
+        assert 'icon="home"' in render(ListItem("A", icon="home"))
+
+
+class TestIconSprite:
+    """Test the per-response symbol sheet"""
+
+    def test_symbols_once_per_response(self, sprite_mode):
+        """Each app response carries just the symbols it used, once"""
+        app = MDUI.mount_icon_sprite(FastHTML(secret_key="test", hdrs=MDUI.headers(icons="sprite")), sprite_mode.path)
+
+        @app.get("/")
+        def page():
+            return Icon("home"), Icon("home"), Button("Find", icon="search--outlined")
+
+        @app.get("/other")
+        def other():
+            return Icon("home", variant="rounded")
+
+        client = TestClient(app)
+        html = client.get("/").text
+        assert html.count("<symbol ") == 2
+        assert '<symbol id="mdui-i-home" viewBox="0 0 24 24"><path d="M10 20v-6h4v6h5v-8h3L12 3 2 12h3v8z"></path></symbol>' in html
+        assert 'id="mdui-i-search--outlined" viewBox="0 -960 960 960"' in html
+        other = client.get("/other").text
+        assert other.count("<symbol ") == 1 and "mdui-i-home--rounded" in other
+
+    def test_collects_symbols(self, sprite_mode):
+        """Symbols are recorded per collector, and no symbols means no sprite"""
+        with collect_symbols() as names:
+            assert str(IconSprite()) == ""
+            Icon("home")
+            Icon("settings")
+        assert names == {"home"}
+
+    def test_missing_index(self, tmp_path):
+        """Mounting without an index file fails clearly"""
+        with pytest.raises(FileNotFoundError):
+            MDUI.mount_icon_sprite(FastHTML(secret_key="test"), tmp_path / "none.idx")
+
+
+
+class TestTemplates:
+    """Test sprite symbols of compiled and cached subtrees"""
+
+    def test_symbols_replayed(self, sprite_mode):
+        """Reused HTML still records the symbols its <use> references need"""
+        from fastmdui import cached, mdui_template
+
+        @mdui_template
+        def home_link(label):
+            return Button(label, icon="home")
+
+        @cached
+        def nav():
+            return Icon("search", variant="outlined")
+
+        for _ in range(3):
+            with collect_symbols() as names:
+                html = render(home_link("Home"), nav())
+            assert 'href="#mdui-i-home"' in html and 'href="#mdui-i-search--outlined"' in html
+            assert names == {"home", "search--outlined"}
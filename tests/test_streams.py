@@ -0,0 +1,117 @@
+"""
+Tests for Server-Sent Events progress
+"""
+
+import asyncio
+
+import pytest
+
+from fasthtml.common import FastHTML, to_xml
+from starlette.testclient import TestClient
+
+from fastmdui import MDUI, Progress
+from fastmdui.streams import STREAM_JS, progress_events, progress_stream
+
+
+def _events(source, **kwargs):
+    async def collect():
+        return [message async for message in progress_events(source, **kwargs)]
+    return asyncio.run(collect())
+
+
+class TestProgressBinding:
+    """Test the Progress stream attribute and script"""
+
+    def test_stream_attribute(self):
+        """stream= sets the URL the script binds to"""
+        html = to_xml(Progress(0, stream="/jobs/7/progress", id="job-7"))
+        assert html == '<mdui-linear-progress value="0" data-mdui-stream="/jobs/7/progress" id="job-7"></mdui-linear-progress>'
+        assert "data-mdui-stream" not in to_xml(Progress(0.5))
+
+    def test_script(self):
+        """headers(streams=True) adds the EventSource binding"""
+        assert "mduiBindStreams" in str(MDUI.headers(streams=True).html)
+        assert "mduiBindStreams" not in str(MDUI.headers().html)
+        assert "EventSource" in STREAM_JS
+
+
+class TestProgressEvents:
+    """Test coalescing and ending the event stream"""
+
+    def test_coalesces_bursts(self):
+        """A burst of updates becomes a few messages with the latest value"""
+        async def job():
+            for i in range(1, 101):
+                yield i / 100
+                if i % 25 == 0:
+                    await asyncio.sleep(0.05)
+        events = _events(job(), interval=0.04)
+        assert len(events) < 10
+        assert events[-1] == "event: done\ndata: 1\n\n"
+        values = [float(e.split("data: ")[1]) for e in events]
+        assert values == sorted(values)
+
+    def test_polled_getter(self):
+        """Callables are polled and only changes are sent"""
+        values = iter([0.1, 0.1, 0.1, 0.5, 1])
+        events = _events(lambda: next(values), interval=0.001)
+        assert events[0] == "data: 0.1\n\n" and events.count("data: 0.1\n\n") == 1
+        assert events[-1] == "event: done\ndata: 1\n\n"
+
+    def test_async_getter(self):
+        """Async getters are awaited"""
+        async def get():
+            return 2
+        assert _events(get, max=2) == ["event: done\ndata: 2\n\n"]
+
+    def test_source_ending_early(self):
+        """An exhausted source or None ends the stream with the last value"""
+        assert _events([0.2, 0.3], interval=0)[-1] == "event: done\ndata: 0.3\n\n"
+        assert _events(iter([0.2, None, 0.9]), interval=0)[-1] == "event: done\ndata: 0.2\n\n"
+
+    def test_failing_source(self):
+        """A raising source ends with a failed event, not done, and re-raises"""
+        def get():
+            raise RuntimeError("job crashed")
+
+        async def partial():
+            yield 0.4
+            raise RuntimeError("job crashed")
+
+        for source in (get, partial()):
+            messages = []
+
+            async def collect():
+                async for message in progress_events(source, interval=0):
+                    messages.append(message)
+
+            with pytest.raises(RuntimeError, match="job crashed"):
+                asyncio.run(collect())
+            assert messages[-1].startswith("event: failed\n")
+            assert not any(m.startswith("event: done") for m in messages)
+        assert messages[-1] == "event: failed\ndata: 0.4\n\n"
+        assert 'addEventListener("failed"' in STREAM_JS
+
+    def test_keepalive(self):
+        """Quiet streams send keep-alive comments"""
+        async def slow():
+            await asyncio.sleep(0.05)
+            yield 1
+        assert _events(slow(), keepalive=0.01)[0] == ": keep-alive\n\n"
+
+
+class TestProgressStream:
+    """Test the event stream response"""
+
+    def test_response(self):
+        """The endpoint streams plain numbers as text/event-stream"""
+        app = FastHTML(secret_key="test")
+        progress = iter([0.25, 0.5, 1.0])
+
+        @app.get("/jobs/{id}/progress")
+        def job_progress(id: str):
+            return progress_stream(lambda: next(progress), interval=0)
+
+        resp = TestClient(app).get("/jobs/1/progress")
+        assert resp.headers["content-type"].startswith("text/event-stream")
+        assert resp.text == "data: 0.25\n\ndata: 0.5\n\nevent: done\ndata: 1\n\n"
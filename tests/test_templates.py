@@ -0,0 +1,174 @@
+"""
+Tests for @mdui_template compiled component templates
+"""
+
+from fasthtml.common import Div, to_xml
+
+from fastmdui import (
+    Button, Card, Icon, ListItem, NavigationRail, NavigationRailItem, Select, TopAppBar, TopAppBarTitle,
+    cached, mdui_template,
+)
+from fastmdui.icons import icon_registry
+from fastmdui.modules import collect_tags
+from fastmdui.templates import Template
+
+
+@mdui_template
+def contact(name, email, icon="person", disabled=False):
+    return ListItem(name, description=email, icon=icon, disabled=disabled)
+
+
+@mdui_template
+def card(title, subtitle, body):
+    return Card(title, subtitle, Div(body, cls="body"), id=f"card-{title}")
+
+
+class TestCompiledOutput:
+    """Test that templates render what the FT path renders"""
+
+    def test_matches_plain_call(self):
+        """Holes in attributes and text are filled and escaped like to_xml"""
+        for args in (("Ann", "ann@example.com"), ("A & B <x>", "a>b"), ("Zoë", "z")):
+            assert contact(*args) == to_xml(contact.__wrapped__(*args), indent=False)
+        assert card("T", "S", "<b>") == to_xml(card.__wrapped__("T", "S", "<b>"), indent=False)
+
+    def test_compiles_once_per_shape(self):
+        """Strings share one template; other values make separate shapes"""
+        contact.templates.clear()
+        contact("Ann", "a")
+        contact("Bob", "b")
+        assert len(contact.templates) == 1
+        html = contact("Cy", "c", icon=None, disabled=True)
+        assert len(contact.templates) == 2
+        assert " disabled" in html and "icon=" not in html
+
+    def test_empty_strings_are_part_of_the_shape(self):
+        """An empty argument drops its attribute like the FT path does"""
+        assert contact("Ann", "") == to_xml(contact.__wrapped__("Ann", ""), indent=False)
+
+
+class TestFallback:
+    """Test calls that go through the normal FT path"""
+
+    def test_quotes_in_attributes(self):
+        """Values that change attribute quoting aren't templated"""
+        result = contact('Say "hi"', "x")
+        assert to_xml(result) == to_xml(contact.__wrapped__('Say "hi"', "x"))
+
+    def test_transformed_arguments(self):
+        """Functions that transform string arguments are never templated"""
+        @mdui_template
+        def shout(text):
+            return Button(text.upper())
+
+        assert to_xml(shout("go")) == to_xml(Button("GO"))
+        assert to_xml(shout("stop")) == to_xml(Button("STOP"))
+
+    def test_unhashable_arguments(self):
+        """Lists of children are passed straight through"""
+        @mdui_template
+        def group(items):
+            return Div(*items)
+
+        assert to_xml(group([Icon("home")])) == to_xml(Div(Icon("home")))
+
+    def test_branching_components(self):
+        """Components that branch on a string argument render like plain calls"""
+        @mdui_template
+        def icon(name, variant="outlined"):
+            return Icon(name, variant=variant)
+
+        @mdui_template
+        def select(label, variant):
+            return Select(label=label, variant=variant)
+
+        for variant in ("outlined", "rounded", "filled"):
+            assert to_xml(icon("home", variant)) == to_xml(Icon("home", variant=variant))
+        assert to_xml(icon("home")) == to_xml(Icon("home"))
+        assert to_xml(select("Country", "outlined")) == to_xml(Select(label="Country", variant="outlined"))
+        assert to_xml(select("Country", "filled")) == to_xml(Select(label="Country", variant="filled"))
+
+    def test_plain_placement_compiles(self):
+        contact.templates.clear()
+        contact("Ann", "a")
+        assert all(isinstance(t, Template) for t in contact.templates.values())
+
+    def test_variant_limit(self):
+        """Past max_variants, new shapes use the FT path"""
+        @mdui_template(max_variants=1)
+        def counter(n):
+            return Button(str(n))
+
+        counter(1)
+        assert counter(2).tag == "mdui-button"
+        assert len(counter.templates) == 1
+
+
+class TestSideEffects:
+    """Test that templated calls still record tags and icons"""
+
+    def test_records_tags_and_icons(self):
+        icon_registry.clear()
+        contact("Ann", "a", icon="mail")
+        with collect_tags() as tags:
+            contact("Bob", "b", icon="star--outlined")
+        assert "mdui-list-item" in tags
+        used = icon_registry.used()
+        assert "mail" in used["filled"] and "star" in used["outlined"]
+        assert not any("mduihole" in n for names in used.values() for n in names)
+
+
+@cached(maxsize=2)
+def chrome(title, active):
+    return (
+        TopAppBar(TopAppBarTitle(title)),
+        NavigationRail(
+            NavigationRailItem("inbox", "Inbox", value="/inbox"),
+            NavigationRailItem("send", "Sent", value="/sent"),
+            value=active,
+        ),
+    )
+
+
+class TestCachedSubtree:
+    """Test @cached rendering of app chrome"""
+
+    def setup_method(self):
+        chrome.cache_clear()
+
+    def test_renders_once_per_key(self):
+        """Repeated arguments reuse the stored HTML"""
+        first = chrome("Mail", "/inbox")
+        assert chrome("Mail", "/inbox") is first
+        assert first == to_xml(chrome.__wrapped__("Mail", "/inbox"), indent=False)
+        assert chrome("Mail", active="/sent") != first
+        info = chrome.cache_info()
+        assert (info.hits, info.misses, info.currsize) == (1, 2, 2)
+
+    def test_lru_is_bounded(self):
+        """The least recently used entry is evicted"""
+        chrome("Mail", "/inbox")
+        chrome("Mail", "/sent")
+        chrome("Mail", "/inbox")
+        chrome("Mail", "/drafts")
+        assert chrome.cache_info().currsize == 2
+        chrome("Mail", "/inbox")
+        assert chrome.cache_info().hits == 2
+
+    def test_hits_record_tags_and_icons(self):
+        """Cached chrome still counts as used by the current response"""
+        chrome("Mail", "/inbox")
+        icon_registry.clear()
+        with collect_tags() as tags:
+            chrome("Mail", "/inbox")
+        assert {"mdui-top-app-bar", "mdui-navigation-rail-item"} <= tags
+        assert icon_registry.used()["filled"] == ["inbox", "send"]
+
+    def test_unhashable_arguments(self):
+        """Unhashable arguments build the tree without caching"""
+        @cached
+        def bar(items):
+            return TopAppBar(*items)
+
+        assert bar([TopAppBarTitle("x")]).tag == "mdui-top-app-bar"
+        assert bar.cache_info().currsize == 0
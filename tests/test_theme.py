@@ -0,0 +1,61 @@
+"""
+Tests for server-side theme resolution (theme_mode="server")
+"""
+
+from fasthtml.common import FastHTML
+from starlette.testclient import TestClient
+
+from fastmdui import MDUI, ThemeToggle
+
+
+def _client(**htmlkw):
+    app = FastHTML(secret_key="test", hdrs=MDUI.headers(theme_mode="server"), htmlkw=htmlkw)
+    MDUI.server_theme(app)
+    MDUI.mount_assets(app)
+
+    @app.get("/")
+    def home():
+        return ThemeToggle()
+
+    return TestClient(app)
+
+
+class TestServerTheme:
+    """Test the cookie-driven theme class on <html>"""
+
+    def test_auto_without_cookie(self):
+        """Without a choice the page follows the system preference"""
+        page = _client().get("/").text
+        assert '<html class="mdui-theme-auto">' in page
+
+    def test_cookie_sets_theme(self):
+        """The saved choice is applied server-side"""
+        client = _client()
+        client.cookies.set(MDUI.THEME_COOKIE, "dark")
+        assert '<html class="mdui-theme-dark">' in client.get("/").text
+        client.cookies.set(MDUI.THEME_COOKIE, "light")
+        assert '<html class="mdui-theme-light">' in client.get("/").text
+
+    def test_keeps_existing_html_class(self):
+        """App-level <html> classes are preserved"""
+        page = _client(cls="app").get("/").text
+        assert '<html class="app mdui-theme-auto">' in page
+
+    def test_no_inline_theme_script(self):
+        """The bootstrap script is replaced by a small cached file"""
+        client = _client()
+        page = client.get("/").text
+        assert "initTheme" not in page
+        url = MDUI.local_assets().url("mdui-theme.js")
+        assert f'<script src="{url}" defer></script>' in page
+
+        resp = client.get(url)
+        assert resp.status_code == 200
+        assert "document.cookie" in resp.text
+        assert "immutable" in resp.headers["cache-control"]
+
+    def test_client_mode_unchanged(self):
+        """The default mode still ships the inline bootstrap"""
+        html = str(MDUI.headers().html)
+        assert "initTheme" in html
+        assert "mdui-theme.js" not in html
@@ -0,0 +1,141 @@
+"""
+Tests for VirtualList windows and the route serving them
+"""
+
+import re
+
+import pytest
+from fasthtml.common import FastHTML, to_xml
+from starlette.testclient import TestClient
+
+from fastmdui import MDUI, ListItem, VirtualList
+from fastmdui.virtual import VirtualListRegistry
+
+
+def _next_url(html):
+    match = re.search(r'hx-get="([^"]+)"', html)
+    return match and match.group(1).replace("&amp;", "&")
+
+
+def _scroll(client, html):
+    """Follow sentinels like htmx would, returning every rendered item"""
+    items = re.findall(r'headline="([^"]*)"', html)
+    url = _next_url(html)
+    while url:
+        html = client.get(url, headers={"HX-Request": "true"}).text
+        items += re.findall(r'headline="([^"]*)"', html)
+        url = _next_url(html)
+    return items
+
+
+@pytest.fixture
+def client():
+    return TestClient(MDUI.mount_virtual_lists(FastHTML(secret_key="test")))
+
+
+class TestVirtualList:
+    """Test the first server-rendered window"""
+
+    def test_renders_first_window(self):
+        """Only `window` items and a revealed-triggered sentinel are rendered"""
+        html = to_xml(VirtualList(range(1000), lambda i: ListItem(f"Row {i}"), window=20))
+        assert html.count("<mdui-list-item") == 20
+        assert 'hx-trigger="revealed"' in html
+        assert 'hx-swap="outerHTML"' in html
+
+    def test_short_source_has_no_sentinel(self):
+        """Sources that fit in a window render completely"""
+        html = to_xml(VirtualList(["a", "b"], window=20))
+        assert html.count("<mdui-list-item") == 2
+        assert "hx-get" not in html
+
+    def test_recycle(self):
+        """recycle keeps a bounded number of items in the DOM"""
+        html = to_xml(VirtualList(range(100), recycle=60))
+        assert 'data-recycle="60"' in html
+        assert "hx-on--after-settle" in html
+
+    def test_needs_a_source(self):
+        with pytest.raises(ValueError):
+            VirtualList()
+
+
+class TestWindowRoute:
+    """Test loading further windows by cursor"""
+
+    def test_sequence(self, client):
+        """Sequences are sliced by position"""
+        html = to_xml(VirtualList([f"Row {i}" for i in range(95)], window=20))
+        assert _scroll(client, html) == [f"Row {i}" for i in range(95)]
+
+    def test_iterator(self, client):
+        """Iterators are consumed one window at a time"""
+        consumed = []
+
+        def rows():
+            for i in range(45):
+                consumed.append(i)
+                yield {"headline": f"Row {i}", "icon": "person"}
+
+        html = to_xml(VirtualList(rows(), window=20))
+        assert len(consumed) == 20
+        assert _scroll(client, html) == [f"Row {i}" for i in range(45)]
+
+    def test_repeated_request_is_replayed(self, client):
+        """A retried window of an iterator returns the same items"""
+        html = to_xml(VirtualList(iter(range(100)), lambda i: ListItem(str(i)), window=10))
+        url = _next_url(html)
+        assert client.get(url).text == client.get(url).text
+
+    def test_paging_callback(self, client):
+        """fetch callbacks get back the cursor they returned"""
+        data = [f"Order {i}" for i in range(30)]
+        calls = []
+
+        def fetch(cursor, limit):
+            calls.append(cursor)
+            start = int(cursor or 0)
+            return data[start:start + limit], (str(start + limit) if start + limit < len(data) else None)
+
+        html = to_xml(VirtualList(fetch=fetch, name="orders", window=12))
+        assert _scroll(client, html) == data
+        assert calls == [None, "12", "24"]
+
+    def test_opaque_cursor(self, client):
+        """Cursors reach the callback unchanged, whatever characters they hold"""
+        cursors = ["a+b/c==&x=1", "p #2?", None]
+        seen = []
+
+        def fetch(cursor, limit):
+            seen.append(cursor)
+            position = len(seen) - 1
+            return [f"Row {position}"], cursors[position]
+
+        html = to_xml(VirtualList(fetch=fetch, name="opaque", window=1))
+        assert _scroll(client, html) == ["Row 0", "Row 1", "Row 2"]
+        assert seen == [None, "a+b/c==&x=1", "p #2?"]
+
+    def test_unknown_list(self, client):
+        """Evicted or unknown lists end the scroll with a reload item"""
+        resp = client.get("/_mdui_list/missing?cursor=10")
+        assert resp.status_code == 200
+        assert 'class="mdui-virtual-list-expired"' in resp.text
+        assert "hx-get" not in resp.text
+
+    @pytest.mark.parametrize("cursor", ["abc", "-5", "1.5"])
+    def test_invalid_cursor(self, client, cursor):
+        for source in (list(range(10)), iter(range(10))):
+            key = _next_url(to_xml(VirtualList(source, window=5))).split("/")[-1].split("?")[0]
+            resp = client.get(f"/_mdui_list/{key}", params={"cursor": cursor})
+            assert resp.status_code == 400
+
+
+def test_registry_is_bounded():
+    """Unnamed sources are evicted least recently used first"""
+    registry = VirtualListRegistry(max_sources=2)
+    first = registry.add([1], None, 10)
+    registry.add([2], None, 10)
+    registry.add([3], None, 10)
+    assert registry.get(first) is None
+    registry.add(None, None, 10, name="fixed")
+    assert len(registry) == 3